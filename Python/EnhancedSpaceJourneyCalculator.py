@@ -4,26 +4,70 @@
 # Created: May 25, 2025
 
 import os
-import math
+import sys
 import time
 import datetime
-from typing import Dict, Any, Optional
+from typing import Any, Optional
 
-# Import our custom modules
-from space_logger import SpaceLogger, LogLevel
-from space_data import (
-    get_all_planetary_bodies, 
-    get_all_transportation_vehicles,
-    PlanetaryBody,
-    TransportationVehicle
-)
+# Import our custom modules. Only what module import needs is imported here;
+# the logger, catalog and journey modules load on first use so the header
+# appears immediately and headless runs never load the interactive pieces.
+import space_metrics
 
-# Initialize logger with file logging
-logger = SpaceLogger(log_to_file=True)
+# Fast-start mode (--fast or SPACE_FAST_START=1) skips the calculation
+# animation; it is also skipped whenever stdout is not a terminal
+FAST_START = os.environ.get("SPACE_FAST_START", "").lower() in ("1", "true", "yes")
+ANIMATION_STEPS = 5
+ANIMATION_DELAY = 0.3     # seconds per dot
+
+# File logger, created on first use
+logger: Optional["SpaceLogger"] = None
+
+def get_logger() -> "SpaceLogger":
+    """Return the calculator's file logger, creating it the first time it is needed"""
+    global logger
+    if logger is None:
+        from space_logger import SpaceLogger
+        logger = SpaceLogger(log_to_file=True)
+    return logger
+
+# Instrumentation of each stage (recorded only while space_metrics is enabled;
+# spans look these up by name)
+space_metrics.histogram("space_calculator_validation_seconds", "Time validating one prompt answer")
+space_metrics.histogram("space_calculator_calculation_seconds", "Time computing (or fetching) a journey quote")
+space_metrics.histogram("space_calculator_report_seconds", "Time formatting the journey report")
+space_metrics.histogram("space_calculator_persist_seconds", "Time appending the journey to the journal")
+_invalid_inputs = space_metrics.counter("space_calculator_invalid_inputs_total", "Prompt answers rejected by validation")
+_calculation_errors = space_metrics.counter("space_calculator_calculation_errors_total", "Journey calculations that failed")
+
+# Completed journeys are appended to a rotating journal next to this script,
+# opened on first use
+journal: Optional["JourneyJournal"] = None
+
+def get_journal() -> "JourneyJournal":
+    """Return the journey journal, opening it the first time it is needed"""
+    global journal
+    if journal is None:
+        from journey_journal import JourneyJournal
+        journal = JourneyJournal(os.path.join(os.path.dirname(os.path.abspath(__file__)), "journeys"))
+    return journal
 
 def clear_screen() -> None:
     """Clear screen for better user experience - works on both Windows and Unix-like systems"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear + cursor home instead of spawning a shell for cls/clear;
+    # piped or redirected output is left alone
+    if sys.stdout.isatty():
+        print("\033[2J\033[H", end="", flush=True)
+
+def show_calculation_animation() -> None:
+    """Print the 'Calculating' dots, paced only for an interactive terminal"""
+    if FAST_START or not sys.stdout.isatty():
+        return
+    print("\n\033[93mCalculating journey duration", end="")
+    for _ in range(ANIMATION_STEPS):
+        print(".", end="", flush=True)
+        time.sleep(ANIMATION_DELAY)
+    print("\033[0m\n")
 
 def display_header() -> None:
     """Display the ASCII art header"""
@@ -57,38 +101,51 @@ def get_input_with_validation(prompt: str, validation_fn, error_msg: str, exampl
     while True:
         try:
             user_input = input(prompt)
-            is_valid, value = validation_fn(user_input)
+            # Timed after input() returns, so typing time is not counted
+            with space_metrics.span("space_calculator_validation_seconds"):
+                is_valid, value = validation_fn(user_input)
             
             if is_valid:
                 return value
             
-            logger.warning(f"Invalid input: {user_input}")
+            if space_metrics.enabled:
+                _invalid_inputs.inc()
+            get_logger().warning("Invalid input: %s", user_input)
             print(f"\033[91m{error_msg}\033[0m")
             
             if examples:
                 print(f"\033[93m{examples}\033[0m")
                 
         except Exception as e:
-            logger.error(f"Exception during input: {str(e)}")
+            get_logger().error("Exception during input: %s", e)
             print(f"\033[91mAn error occurred. Please try again.\033[0m")
 
 def calculate_space_journey() -> None:
     """Main function to calculate a space journey"""
-    # Start logging
-    logger.info("Space Journey Calculator started")
-    
-    # Clear the screen and display header
+    # Clear the screen and display header before loading anything else
     clear_screen()
     display_header()
     
+    from space_data import get_all_planetary_bodies, get_all_transportation_vehicles
+    from journey_journal import journey_record
+    from quote_cache import get_quote_cache
+    from space_journey import (
+        format_journey_report,
+        validate_text,
+        validate_year,
+        validate_velocity,
+        validate_choice
+    )
+    
+    # Start logging
+    get_logger().info("Space Journey Calculator started")
+    
     # ===== USER INPUT SECTION =====
-    logger.debug("Beginning user input collection")
+    get_logger().debug("Beginning user input collection")
     
     # Get user's name with validation
     def validate_name(name: str) -> tuple[bool, str]:
-        if name.strip() == "":
-            return False, ""
-        return True, name.strip()
+        return validate_text(name)
     
     print("\033[92m\nWelcome to the Space Journey Calculator!\033[0m")
     traveler_name = get_input_with_validation(
@@ -96,20 +153,18 @@ def calculate_space_journey() -> None:
         validate_name,
         "Name cannot be empty. Please enter a valid name."
     )
-    logger.info(f"User name collected: {traveler_name}")
+    get_logger().info("User name collected: %s", traveler_name)
     
     # Get country with validation
     def validate_country(country: str) -> tuple[bool, str]:
-        if country.strip() == "":
-            return False, ""
-        return True, country.strip()
+        return validate_text(country)
     
     country = get_input_with_validation(
         "Please enter your country (e.g., United States, Canada, Mexico): ",
         validate_country,
         "Country cannot be empty. Please enter a valid country."
     )
-    logger.info(f"User country collected: {country}")
+    get_logger().info("User country collected: %s", country)
     
     # Greet the user by name and country
     print(f"\033[93m\nHello, {traveler_name} from {country}! Let's plan your space journey.\033[0m")
@@ -121,23 +176,17 @@ def calculate_space_journey() -> None:
     # Year selection with range validation
     current_year = today.year
     
-    def validate_year(year_str: str) -> tuple[bool, int]:
-        try:
-            year = int(year_str)
-            if year < current_year or year > (current_year + 30):
-                return False, 0
-            return True, year
-        except ValueError:
-            return False, 0
+    def validate_travel_year(year_str: str) -> tuple[bool, int]:
+        return validate_year(year_str, current_year)
     
     year = get_input_with_validation(
         f"\nEnter the year of travel ({current_year}-{current_year+30}): ",
-        validate_year,
+        validate_travel_year,
         f"Year must be between {current_year} and {current_year+30}.",
         f"- Values below {current_year} are in the past\n"
         f"- Values above {current_year+30} exceed our reservation system capabilities"
     )
-    logger.info(f"Valid travel year selected: {year}")
+    get_logger().info("Valid travel year selected: %s", year)
     
     # Calculate travel date
     travel_date = datetime.datetime(year, today.month, today.day)
@@ -157,13 +206,7 @@ def calculate_space_journey() -> None:
         print(f"\033[96m{i}. {name} (Max Velocity: {vehicle.max_velocity:,.0f} km/h)\033[0m")
     
     def validate_vehicle_choice(choice_str: str) -> tuple[bool, int]:
-        try:
-            choice = int(choice_str)
-            if choice < 1 or choice > len(vehicle_options):
-                return False, 0
-            return True, choice
-        except ValueError:
-            return False, 0
+        return validate_choice(choice_str, len(vehicle_options))
     
     vehicle_choice = get_input_with_validation(
         f"\nSelect a transportation vehicle (1-{len(vehicle_options)}): ",
@@ -173,7 +216,7 @@ def calculate_space_journey() -> None:
     
     selected_vehicle_name = vehicle_options[vehicle_choice]
     selected_vehicle = vehicles[selected_vehicle_name]
-    logger.info(f"Vehicle selected: {selected_vehicle_name}")
+    get_logger().info("Vehicle selected: %s", selected_vehicle_name)
     
     print(f"\nYou selected: {selected_vehicle.name}")
     print(f"Maximum Velocity: {selected_vehicle.max_velocity:,.0f} km/h")
@@ -183,27 +226,19 @@ def calculate_space_journey() -> None:
     # Velocity input with validation
     suggested_velocity = selected_vehicle.max_velocity * 0.8  # 80% of max for safety
     
-    def validate_velocity(velocity_str: str) -> tuple[bool, float]:
-        try:
-            velocity = float(velocity_str)
-            if velocity <= 0:
-                return False, 0
-            if velocity > selected_vehicle.max_velocity:
-                return False, 0
-            return True, velocity
-        except ValueError:
-            return False, 0
+    def validate_vehicle_velocity(velocity_str: str) -> tuple[bool, float]:
+        return validate_velocity(velocity_str, selected_vehicle.max_velocity)
     
     print(f"\n\033[96mRecommended velocity: {suggested_velocity:,.0f} km/h (80% of maximum)\033[0m")
     velocity = get_input_with_validation(
         f"Please enter your travel velocity in km/h (1-{selected_vehicle.max_velocity:,.0f}): ",
-        validate_velocity,
+        validate_vehicle_velocity,
         f"Velocity must be positive and cannot exceed {selected_vehicle.max_velocity:,.0f} km/h.",
         "- Space travel requires positive velocity\n"
         "- Exceeding the maximum velocity would damage the vehicle\n"
         "- Safety protocols prevent exceeding maximum velocity"
     )
-    logger.info(f"Valid velocity selected: {velocity} km/h")
+    get_logger().info("Valid velocity selected: %s km/h", velocity)
     
     print(f"You've selected a travel velocity of {velocity:,.2f} km/h")
     
@@ -217,13 +252,7 @@ def calculate_space_journey() -> None:
         print(f"\033[96m{i}. {name} ({planet.distance_from_earth:,.0f} km from Earth)\033[0m")
     
     def validate_planet_choice(choice_str: str) -> tuple[bool, int]:
-        try:
-            choice = int(choice_str)
-            if choice < 1 or choice > len(planet_options):
-                return False, 0
-            return True, choice
-        except ValueError:
-            return False, 0
+        return validate_choice(choice_str, len(planet_options))
     
     planet_choice = get_input_with_validation(
         f"\nSelect a destination (1-{len(planet_options)}): ",
@@ -233,7 +262,7 @@ def calculate_space_journey() -> None:
     
     selected_planet_name = planet_options[planet_choice]
     selected_planet = planets[selected_planet_name]
-    logger.info(f"Destination selected: {selected_planet_name}")
+    get_logger().info("Destination selected: %s", selected_planet_name)
     
     print(f"\nYou selected: {selected_planet.name}")
     print(f"Distance from Earth: {selected_planet.distance_from_earth:,.0f} km")
@@ -241,118 +270,93 @@ def calculate_space_journey() -> None:
     print(f"Description: {selected_planet.description}")
     
     # ===== CALCULATION SECTION =====
-    logger.debug("Beginning journey calculations")
+    get_logger().debug("Beginning journey calculations")
     
     try:
-        # Extract the distance from the planetary body
-        distance = selected_planet.distance_from_earth
-        
-        # Perform calculation (distance / velocity)
-        duration_hours = distance / velocity
-        
-        # Convert to various time formats for better understanding
-        duration_days = duration_hours / 24
-        duration_months = duration_days / 30.44  # Average month length
-        duration_years = duration_days / 365.25  # Account for leap years
-        
-        # Format remaining hours and minutes for display
-        whole_days = math.floor(duration_days)
-        whole_hours = math.floor(duration_hours % 24)
-        whole_minutes = math.floor((duration_hours * 60) % 60)
+        with space_metrics.span("space_calculator_calculation_seconds"):
+            journey = get_quote_cache().quote(selected_planet, selected_vehicle, velocity, travel_date)
+        distance = journey.distance
+        duration_hours = journey.duration_hours
+        duration_days = journey.duration_days
+        duration_months = journey.duration_months
+        duration_years = journey.duration_years
+        whole_days = journey.whole_days
+        whole_hours = journey.whole_hours
+        whole_minutes = journey.whole_minutes
+        arrival_date = journey.arrival_date
+        fuel_units = journey.fuel_units
+        journey_cost = journey.journey_cost
         
-        # Calculate arrival date
-        arrival_date = travel_date + datetime.timedelta(hours=duration_hours)
-        
-        # Calculate fuel usage
-        fuel_units = distance / selected_vehicle.fuel_efficiency
-        
-        # Calculate journey cost (fictional rate of $1000 per million km)
-        journey_cost = (distance / 1000000) * 1000
-        
-        logger.info("Journey calculations completed successfully")
+        get_logger().info("Journey calculations completed successfully")
     except Exception as e:
-        logger.error(f"Error in journey calculations: {str(e)}")
+        if space_metrics.enabled:
+            _calculation_errors.inc()
+        get_logger().error("Error in journey calculations: %s", e)
         print("\n\033[91mAn error occurred while calculating your journey details.")
         print("Please try again with different parameters.\033[0m")
         return
     
     # Add a bit of animation for the calculation
-    print("\n\033[93mCalculating journey duration", end="")
-    for _ in range(5):
-        print(".", end="", flush=True)
-        time.sleep(0.3)
-    print("\033[0m\n")
+    show_calculation_animation()
     
     # ===== RESULTS SECTION =====
     # Generate the result message with proper formatting
-    result_message = f"""
-\033[92m===== SPACE TRAVEL JOURNEY CALCULATION =====
-Traveler: {traveler_name}
-Country: {country}
-Travel Date: {travel_date.strftime('%Y-%m-%d')}
-
-Vehicle: {selected_vehicle.name}
-Maximum Velocity: {selected_vehicle.max_velocity:,.2f} km/h
-Selected Velocity: {velocity:,.2f} km/h
-Fuel Efficiency: {selected_vehicle.fuel_efficiency:,.2f} km per unit
-
-Destination: {selected_planet.name}
-Distance: {distance:,.0f} km
-
-Estimated Journey Details:
-- Duration: {duration_hours:.5f} hours
-           {duration_days:.5f} days
-           {duration_months:.5f} months
-           {duration_years:.5f} years
-
-- Plain English: Your journey to {selected_planet.name} will take approximately
-  {whole_days} days, {whole_hours} hours, and {whole_minutes} minutes
-  at your selected speed of {velocity:,.2f} km/h.
-
-- Fuel Required: {fuel_units:.2f} units
-- Estimated Arrival: {arrival_date.strftime('%Y-%m-%d %H:%M')}
-- Estimated Cost: ${journey_cost:,.2f}
-============================================\033[0m
-"""
+    with space_metrics.span("space_calculator_report_seconds"):
+        result_message = format_journey_report(traveler_name, country, travel_date, selected_vehicle, selected_planet, journey)
     
     # Display result with formatting
     print(result_message)
     
     # Log the journey details
-    logger.info(f"Journey to {selected_planet.name} calculated for {traveler_name}")
-    logger.info(f"Journey duration: {duration_days:.2f} days at {velocity:.2f} km/h")
-    logger.info(f"Journey cost: ${journey_cost:.2f}")
-    
-    # Save the journey details to a file
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    file_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-    journey_log_file = os.path.join(
-        script_dir, 
-        f"JourneyDetails_{traveler_name.replace(' ', '_')}_{file_timestamp}.txt"
-    )
-    
-    with open(journey_log_file, "w") as f:
-        # Strip ANSI color codes when writing to file
-        clean_message = result_message.replace("\033[92m", "").replace("\033[0m", "")
-        f.write(clean_message)
-    
-    print(f"Your journey details have been saved to: {journey_log_file}")
+    get_logger().info("Journey to %s calculated for %s", selected_planet.name, traveler_name)
+    get_logger().info("Journey duration: %.2f days at %.2f km/h", duration_days, velocity)
+    get_logger().info("Journey cost: $%.2f", journey_cost)
+    
+    # Record the journey details in the journey journal
+    with space_metrics.span("space_calculator_persist_seconds"):
+        journal_file = get_journal().append(journey_record(
+            traveler=traveler_name,
+            country=country,
+            travel_date=travel_date,
+            vehicle=selected_vehicle.name,
+            max_velocity=selected_vehicle.max_velocity,
+            velocity=velocity,
+            fuel_efficiency=selected_vehicle.fuel_efficiency,
+            destination=selected_planet.name,
+            distance=distance,
+            duration_hours=duration_hours,
+            duration_days=duration_days,
+            duration_months=duration_months,
+            duration_years=duration_years,
+            arrival_date=arrival_date,
+            fuel_units=fuel_units,
+            journey_cost=journey_cost
+        ))
+    
+    print(f"Your journey details have been saved to: {journal_file}")
     
     # Option to calculate another journey
     another_journey = input("Would you like to calculate another journey? (y/n): ")
     if another_journey.lower() == "y":
-        logger.info("User requested another journey calculation")
+        get_logger().info("User requested another journey calculation")
         calculate_space_journey()
     else:
         print("\n\033[93mThank you for using the Space Journey Calculator!\033[0m")
         print("\033[96mwww.spacetravel.com - Your Gateway to the Stars\033[0m")
-        logger.info("Space Journey Calculator session ended")
+        get_logger().info("Space Journey Calculator session ended")
 
 # Start the calculation
 if __name__ == "__main__":
+    # Non-interactive quoting: EnhancedSpaceJourneyCalculator.py --headless [options]
+    if "--headless" in sys.argv[1:]:
+        from space_headless import main as headless_main
+        sys.exit(headless_main([arg for arg in sys.argv[1:] if arg != "--headless"]))
+    if "--fast" in sys.argv[1:]:
+        FAST_START = True
+    
     try:
         calculate_space_journey()
     except Exception as e:
         print(f"\033[91mA critical error occurred: {str(e)}\033[0m")
-        logger.log("Critical error in Space Journey Calculator", LogLevel.CRITICAL)
+        get_logger().critical("Critical error in Space Journey Calculator")
         print("\033[93mPlease contact support@spacetravel.com for assistance.\033[0m")
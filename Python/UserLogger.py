@@ -3,22 +3,124 @@
 # For www.spacetravel.com cybersecurity
 
 import os
-import platform
+import sys
+import json
+import time
 import socket
 import datetime
 import getpass
+import platform
+import argparse
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-def log_user_activity():
+from space_logger import LogRotation, get_file_writer
+
+# Log files are kept next to this script
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ACTIVITY_LOG_FILE = os.path.join(_SCRIPT_DIR, "user_activity_log.txt")
+ACTIVITY_JSONL_FILE = os.path.join(_SCRIPT_DIR, "user_activity_log.jsonl")
+
+# Rotation and retention for both activity logs (None lets them grow)
+activity_rotation: Optional[LogRotation] = None
+
+# Host facts are collected once and reused until they are this old (seconds)
+HOST_INFO_REFRESH_INTERVAL = 300.0
+
+UNKNOWN_IP_ADDRESS = "Unable to determine"
+
+# Longest the resolver may take to list the host name's addresses (seconds);
+# it can block on DNS on hosts without a network
+RESOLVER_TIMEOUT = 1.0
+
+# ioctl request that returns an interface's IPv4 address (Linux)
+_SIOCGIFADDR = 0x8915
+
+@dataclass(frozen=True)
+class HostInfo:
+    username: str
+    fullname: str
+    computer_name: str
+    system_platform: str
+    ip_address: str
+    collected_at: float       # time.monotonic() when collected
+
+    def as_record(self) -> Dict[str, str]:
+        """Host fields for an activity record"""
+        return {
+            "username": self.username,
+            "fullname": self.fullname,
+            "computer_name": self.computer_name,
+            "system_platform": self.system_platform,
+            "ip_address": self.ip_address,
+        }
+
+def _interface_addresses() -> List[Tuple[str, str]]:
     """
-    Function to log user activity for cybersecurity purposes.
-    Captures username, full name, current date/time, and system information.
+    (interface, IPv4 address) for every configured interface.
+
+    Interfaces are enumerated locally; no socket is connected and nothing is
+    sent, so this works on hosts without a network route.
     """
-    # Get current date and time
-    current_datetime = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
+    addresses: List[Tuple[str, str]] = []
+    try:
+        import fcntl
+        import struct
+    except ImportError:
+        fcntl = None
+    if fcntl is not None and hasattr(socket, "if_nameindex"):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            for _, name in socket.if_nameindex():
+                try:
+                    request = struct.pack("256s", name.encode()[:15])
+                    reply = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, request)
+                except OSError:
+                    continue            # interface is down or has no IPv4 address
+                addresses.append((name, socket.inet_ntoa(reply[20:24])))
+    if not addresses:
+        # Windows and other platforms: addresses bound to the host name
+        for address in _host_name_addresses(RESOLVER_TIMEOUT):
+            if ("", address) not in addresses:
+                addresses.append(("", address))
+    return addresses
+
+def _host_name_addresses(timeout: float) -> List[str]:
+    """
+    IPv4 addresses the resolver lists for the host name, or none if it does
+    not answer within timeout seconds. The lookup runs on a daemon thread,
+    so a resolver stuck on DNS is left behind rather than waited for.
+    """
+    found: List[str] = []
+
+    def resolve() -> None:
+        try:
+            infos = socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)
+        except OSError:
+            return
+        found.extend(info[4][0] for info in infos)
+
+    thread = threading.Thread(target=resolve, name="UserLogger resolver", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return [] if thread.is_alive() else found
+
+def find_ip_address() -> str:
+    """The host's primary IPv4 address, preferring routable over loopback and link-local"""
+    addresses = [address for _, address in _interface_addresses()]
+    for address in addresses:
+        if not address.startswith(("127.", "169.254.")):
+            return address
+    for address in addresses:
+        if not address.startswith("127."):
+            return address
+    return addresses[0] if addresses else UNKNOWN_IP_ADDRESS
+
+def collect_host_info() -> HostInfo:
+    """Gather the user and host facts recorded with every activity entry"""
     # Get username and attempt to get full name from environment variables
     username = os.environ.get('USERNAME') or getpass.getuser()
-    
+
     # Try different environment variables for full name
     fullname = os.environ.get('USER')
     if not fullname:
@@ -27,46 +129,181 @@ def log_user_activity():
             fullname = os.path.basename(os.environ.get('USERPROFILE'))
         else:
             fullname = username  # Fallback
-    
-    # Get system information
-    computer_name = platform.node()
-    system_platform = platform.system() + " " + platform.release()
-    
-    # Get IP address
-    try:
-        # This trick gets the IP address used for external connections
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))  # Doesn't actually send data, just gets interface
-        ip_address = s.getsockname()[0]
-        s.close()
-    except:
-        ip_address = "Unable to determine"
-    
+
+    return HostInfo(
+        username=username,
+        fullname=fullname,
+        computer_name=platform.node(),
+        system_platform=platform.system() + " " + platform.release(),
+        ip_address=find_ip_address(),
+        collected_at=time.monotonic(),
+    )
+
+_host_info: Optional[HostInfo] = None
+_host_info_lock = threading.Lock()
+
+def get_host_info(refresh_interval: Optional[float] = HOST_INFO_REFRESH_INTERVAL) -> HostInfo:
+    """
+    Cached host facts, collected again once they are older than
+    refresh_interval seconds (never, if None)
+    """
+    global _host_info
+    host_info = _host_info
+    if host_info is not None and (
+        refresh_interval is None or time.monotonic() - host_info.collected_at < refresh_interval
+    ):
+        return host_info
+    with _host_info_lock:
+        # Another thread may have refreshed it while this one waited
+        if _host_info is host_info:
+            _host_info = collect_host_info()
+        return _host_info
+
+def refresh_host_info() -> HostInfo:
+    """Collect the host facts now, replacing the cached copy"""
+    return get_host_info(refresh_interval=0.0)
+
+def activity_record(event: str, host_info: Optional[HostInfo] = None, /, **details: Any) -> Dict[str, Any]:
+    """
+    Build one structured activity entry for the JSONL log.
+
+    event and host_info are positional-only, so details may use any key.
+    Details named like a field of the entry itself (timestamp, event or a
+    host field) are stored as detail_<key> rather than replacing it.
+    """
+    record: Dict[str, Any] = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="milliseconds"),
+        "event": event,
+    }
+    record.update((host_info or get_host_info()).as_record())
+    for key, value in details.items():
+        record[f"detail_{key}" if key in record else key] = value
+    return record
+
+def record_activity(event: str, path: str = ACTIVITY_JSONL_FILE, /, **details: Any) -> Dict[str, Any]:
+    """
+    Append an activity event to the JSONL log and return the record.
+
+    Lines go through the shared background file writer, so recording an
+    event never waits for the disk; they are flushed within half a second
+    and at exit. event and path are positional-only, so details may use any
+    key, including "path".
+    """
+    record = activity_record(event, None, **details)
+    get_file_writer(path, activity_rotation).write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+    return record
+
+def log_user_activity():
+    """
+    Function to log user activity for cybersecurity purposes.
+    Captures username, full name, current date/time, and system information.
+    """
+    # Get current date and time
+    current_datetime = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # User and system information, cached between calls
+    host_info = get_host_info()
+
     # Create log message
     log_message = f"""
 ===== SPACE TRAVEL CYBERSECURITY LOG =====
 Date and Time: {current_datetime}
 User Details:
-- Username: {username}
-- Full Name: {fullname}
-- Computer Name: {computer_name}
-- System: {system_platform}
-- IP Address: {ip_address}
+- Username: {host_info.username}
+- Full Name: {host_info.fullname}
+- Computer Name: {host_info.computer_name}
+- System: {host_info.system_platform}
+- IP Address: {host_info.ip_address}
 ============================================
 """
-    
+
     # Display log message
     print(log_message)
-    
-    # Log to a file
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    log_file = os.path.join(script_dir, "user_activity_log.txt")
-    
-    with open(log_file, 'a') as f:
-        f.write(log_message + "\n")
-    
-    print(f"Log has been written to: {log_file}")
+
+    # Log to a file (kept open by the shared writer and flushed at exit)
+    get_file_writer(ACTIVITY_LOG_FILE, activity_rotation).write(log_message + "\n")
+
+    print(f"Log has been written to: {ACTIVITY_LOG_FILE}")
+
+def _parse_event(line: str) -> Tuple[str, Dict[str, Any]]:
+    """An input line is either a bare event name or a JSON object with an "event" key"""
+    line = line.strip()
+    if line.startswith("{"):
+        try:
+            details = json.loads(line)
+        except json.JSONDecodeError:
+            return line, {}
+        if isinstance(details, dict):
+            event = str(details.pop("event", "activity"))
+            return event, details
+    return line, {}
+
+def run_daemon(
+    events: Iterable[str],
+    path: str = ACTIVITY_JSONL_FILE,
+    refresh_interval: Optional[float] = HOST_INFO_REFRESH_INTERVAL
+) -> int:
+    """
+    Record one JSONL activity entry per input line until the input ends.
+    Returns the number of events recorded.
+    """
+    writer = get_file_writer(path, activity_rotation)
+    count = 0
+    try:
+        for line in events:
+            if not line.strip():
+                continue
+            event, details = _parse_event(line)
+            record = activity_record(event, get_host_info(refresh_interval), **details)
+            writer.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+            count += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.flush()
+    return count
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Log user activity for www.spacetravel.com cybersecurity.")
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Keep running and record each line read from stdin as a JSONL activity event"
+    )
+    parser.add_argument("--output", default=ACTIVITY_JSONL_FILE, help="JSONL log path for --daemon")
+    parser.add_argument(
+        "--refresh", type=float, default=HOST_INFO_REFRESH_INTERVAL,
+        help="Seconds before host information is collected again (default: 300)"
+    )
+    parser.add_argument(
+        "--max-bytes", type=int, default=0,
+        help="Rotate a log once it reaches this size (default: never)"
+    )
+    parser.add_argument(
+        "--rotate-interval", type=float, default=0,
+        help="Rotate every this many seconds, aligned to local midnight (86400 = daily; default: never)"
+    )
+    parser.add_argument(
+        "--backups", type=int, default=LogRotation.backup_count,
+        help="Rotated logs to keep once rotation is enabled (0 keeps all; default: 10)"
+    )
+    args = parser.parse_args(argv)
+
+    global activity_rotation
+    if args.max_bytes or args.rotate_interval:
+        activity_rotation = LogRotation(
+            max_bytes=args.max_bytes or None,
+            interval=args.rotate_interval or None,
+            backup_count=args.backups,
+        )
+
+    if not args.daemon:
+        log_user_activity()
+        return 0
+
+    count = run_daemon(sys.stdin, args.output, args.refresh)
+    print(f"Recorded {count} activity events to: {os.path.abspath(args.output)}", file=sys.stderr)
+    return 0
 
 # Call the function to log user activity
 if __name__ == "__main__":
-    log_user_activity()
+    sys.exit(main())
@@ -0,0 +1,475 @@
+#!/usr/bin/env python
+# Sharded Batch Runner - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import sys
+import csv
+import time
+import shutil
+import argparse
+import datetime
+import tempfile
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from space_data import current_snapshot, CatalogSnapshot
+from space_catalog import CATALOG_KINDS, ColumnarCatalog, build_columns
+from space_headless import FORMATS, RESULT_FIELDS, detect_format, read_requests, quote_requests, write_results
+
+# Input bytes per shard. Shards are the unit of work and of retry, and each
+# one is written to its own file before the in-order merge.
+SHARD_BYTES = 16 * 1024 * 1024
+DEFAULT_RETRIES = 2
+# Failures worth another attempt: a worker that died (killed, out of memory)
+# or a file operation that failed. Anything else would fail again the same way.
+TRANSIENT_ERRORS = (BrokenProcessPool, OSError)
+# Workers publish their row count this often; the parent reports progress at
+# most once per interval
+PROGRESS_EVERY = 1000
+PROGRESS_INTERVAL = 1.0
+# Arrays packed into the shared catalog block start on this boundary
+SHARED_ALIGNMENT = 64
+
+@dataclass(frozen=True)
+class Shard:
+    """Lines [start, end) of the input, the bytes split at line boundaries"""
+    index: int
+    start: int
+    end: int
+    first_row: int = 1    # row number of the shard's first request
+    rows: int = 0         # requests in the shard, known after counting
+
+@dataclass(frozen=True)
+class ShardJob:
+    """What every shard of one run shares"""
+    input_path: str
+    input_format: str
+    output_format: str
+    fieldnames: Optional[List[str]]   # CSV header, read once by the parent
+    work_dir: str
+    today: datetime.datetime
+
+@dataclass
+class BatchSummary:
+    output: str
+    rows: int
+    ok: int
+    error: int
+    shards: int
+    retries: int
+    seconds: float
+
+def plan_shards(path: str, input_format: str, shard_bytes: int = SHARD_BYTES) -> Tuple[Optional[List[str]], List[Shard]]:
+    """
+    Split a request file into byte ranges that end on line boundaries.
+
+    Returns (CSV fieldnames or None, shards). Only the bytes around each
+    boundary are read. CSV fields must not contain line breaks.
+    """
+    if shard_bytes < 1:
+        raise ValueError("Shard size must be at least 1 byte.")
+    fieldnames = None
+    shards: List[Shard] = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if input_format == "csv":
+            header = f.readline().decode("utf-8-sig")
+            fieldnames = next(csv.reader([header]), [])
+        position = f.tell()
+        while position < size:
+            target = position + shard_bytes
+            if target >= size:
+                end = size
+            else:
+                # Finish the line holding the byte before the target
+                f.seek(target - 1)
+                f.readline()
+                end = f.tell()
+            shards.append(Shard(len(shards), position, end))
+            position = end
+    return fieldnames, shards
+
+def _shard_lines(path: str, shard: Shard) -> Iterator[str]:
+    """Decoded lines of one shard, with their line endings"""
+    with open(path, "rb") as f:
+        f.seek(shard.start)
+        position = shard.start
+        for line in f:
+            if position >= shard.end:
+                break
+            position += len(line)
+            yield line.decode("utf-8")
+
+def _is_request_line(line: str, input_format: str) -> bool:
+    # Must agree with read_requests, which skips blank JSONL lines and CSV
+    # rows without any field
+    if input_format == "csv":
+        return line.rstrip("\r\n") != ""
+    return line.strip() != ""
+
+class _CatalogMapping(Mapping):
+    """Name -> record view of a columnar catalog, in catalog order"""
+    def __init__(self, catalog: ColumnarCatalog):
+        self._catalog = catalog
+        self._rows = {catalog.name(row): row for row in range(len(catalog))}
+        self._records: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        record = self._records.get(name)
+        if record is None:
+            record = self._catalog.record(self._rows[name])
+            self._records[name] = record
+        return record
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+CatalogArrays = Dict[str, Tuple[Dict[str, np.ndarray], Dict[str, Any]]]
+
+def catalog_arrays(snapshot: CatalogSnapshot) -> CatalogArrays:
+    """Encode a snapshot's catalogs as {kind: (column arrays, manifest)}"""
+    return {kind: build_columns(getattr(snapshot, kind).values(), kind) for kind in CATALOG_KINDS}
+
+def snapshot_from_arrays(version: int, catalogs: CatalogArrays) -> CatalogSnapshot:
+    """
+    A snapshot reading its records from column arrays. Numbers come back as
+    their column type, so an int distance reads as a float.
+    """
+    mappings = {
+        kind: _CatalogMapping(ColumnarCatalog(None, manifest, arrays))
+        for kind, (arrays, manifest) in catalogs.items()
+    }
+    return CatalogSnapshot(version=version, **mappings)
+
+def share_catalogs(catalogs: CatalogArrays) -> Tuple[SharedMemory, Dict[str, Any]]:
+    """
+    Copy the catalog arrays into one shared memory block.
+
+    Returns the block and its layout, {kind: (manifest, {array: (offset,
+    dtype, shape)})}, which attach_shared_catalogs() needs to map the arrays
+    back. The caller closes and unlinks the block.
+    """
+    layout: Dict[str, Any] = {}
+    size = 0
+    for kind, (arrays, manifest) in catalogs.items():
+        entries = {}
+        for name, array in arrays.items():
+            size = -(-size // SHARED_ALIGNMENT) * SHARED_ALIGNMENT
+            entries[name] = (size, array.dtype.str, array.shape)
+            size += array.nbytes
+        layout[kind] = (manifest, entries)
+    block = SharedMemory(create=True, size=max(size, 1))
+    for kind, (arrays, _) in catalogs.items():
+        for name, (offset, dtype, shape) in layout[kind][1].items():
+            view = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+            view[...] = arrays[name]
+            del view
+    return block, layout
+
+def attach_shared_catalogs(block: SharedMemory, layout: Dict[str, Any]) -> CatalogArrays:
+    """Read-only views of the arrays share_catalogs() placed in a block"""
+    catalogs: CatalogArrays = {}
+    for kind, (manifest, entries) in layout.items():
+        arrays = {}
+        for name, (offset, dtype, shape) in entries.items():
+            array = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+            array.flags.writeable = False
+            arrays[name] = array
+        catalogs[kind] = (arrays, manifest)
+    return catalogs
+
+# Per-process worker state, set by _initialize_worker (or directly by the
+# parent when it runs shards itself)
+_worker_snapshot: Optional[CatalogSnapshot] = None
+_worker_block: Optional[SharedMemory] = None
+_worker_progress: Optional[Any] = None
+
+def _initialize_worker(block_name: str, layout: Dict[str, Any], version: int, progress: Any) -> None:
+    global _worker_snapshot, _worker_block, _worker_progress
+    # Pool workers share the parent's resource tracker, which already tracks
+    # the block; the parent alone unlinks it
+    _worker_block = SharedMemory(name=block_name)
+    _worker_snapshot = snapshot_from_arrays(version, attach_shared_catalogs(_worker_block, layout))
+    _worker_progress = progress
+
+def _count_shard(job: ShardJob, shard: Shard) -> int:
+    """Number of requests in a shard"""
+    return sum(1 for line in _shard_lines(job.input_path, shard) if _is_request_line(line, job.input_format))
+
+def shard_path(job: ShardJob, shard: Shard) -> str:
+    extension = ".csv" if job.output_format == "csv" else ".jsonl"
+    return os.path.join(job.work_dir, f"shard-{shard.index:05d}{extension}")
+
+def _quote_shard(job: ShardJob, shard: Shard) -> Dict[str, int]:
+    """
+    Quote one shard into its own output file; returns ok/error counts.
+    The file only appears under its final name once it is complete.
+    Errors other than TRANSIENT_ERRORS are raised as RuntimeError naming
+    the row being quoted.
+    """
+    done = 0
+
+    def tracked(results: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        nonlocal done
+        for result in results:
+            yield result
+            done += 1
+            if done % PROGRESS_EVERY == 0 and _worker_progress is not None:
+                _worker_progress[shard.index] = done
+        if _worker_progress is not None:
+            _worker_progress[shard.index] = done
+
+    if _worker_progress is not None:
+        _worker_progress[shard.index] = 0
+    path = shard_path(job, shard)
+    temporary_path = f"{path}.tmp"
+    requests = read_requests(_shard_lines(job.input_path, shard), job.input_format, job.fieldnames)
+    results = quote_requests(requests, today=job.today, snapshot=_worker_snapshot, first_row=shard.first_row)
+    try:
+        with open(temporary_path, "w", newline="") as stream:
+            counts = write_results(tracked(results), stream, job.output_format, flush_every=0, header=False)
+    except TRANSIENT_ERRORS:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"row {shard.first_row + done}: {type(e).__name__}: {e}") from e
+    os.replace(temporary_path, path)
+    return counts
+
+def _run_shards(
+    function: Callable[[ShardJob, Shard], Any],
+    job: ShardJob,
+    shards: Sequence[Shard],
+    max_workers: Optional[int],
+    retries: int,
+    initializer: Optional[Tuple[Any, ...]] = None,
+    progress: Optional[Callable[[], None]] = None
+) -> Tuple[List[Any], int]:
+    """
+    Run function(job, shard) for every shard and return (results in shard
+    order, number of retries).
+
+    Shards failing with TRANSIENT_ERRORS are run again in a fresh pool, so
+    a crashed worker costs only a round, though every shard unfinished in
+    the broken pool counts as failed; a shard failing more than retries
+    times raises RuntimeError. Any other error raises RuntimeError at once.
+    max_workers=1 runs in the calling process. progress is called while
+    waiting and after each shard.
+    """
+    results: Dict[int, Any] = {}
+    failures: Dict[int, int] = {}
+    pending = list(shards)
+    retried = 0
+    while pending:
+        errors: Dict[int, BaseException] = {}
+        if max_workers == 1 or len(pending) <= 1:
+            for shard in pending:
+                try:
+                    results[shard.index] = function(job, shard)
+                except TRANSIENT_ERRORS as e:
+                    errors[shard.index] = e
+                except Exception as e:
+                    raise RuntimeError(f"Shard {shard.index} failed: {e}") from e
+                if progress is not None:
+                    progress()
+        else:
+            workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_worker if initializer is not None else None,
+                initargs=initializer or ()
+            ) as executor:
+                futures: Dict[Future, Shard] = {executor.submit(function, job, shard): shard for shard in pending}
+                waiting = set(futures)
+                while waiting:
+                    done, waiting = wait(waiting, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        shard = futures[future]
+                        try:
+                            results[shard.index] = future.result()
+                        except TRANSIENT_ERRORS as e:
+                            errors[shard.index] = e
+                        except Exception as e:
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            raise RuntimeError(f"Shard {shard.index} failed: {e}") from e
+                    if progress is not None:
+                        progress()
+
+        pending = []
+        for shard in shards:
+            if shard.index not in errors:
+                continue
+            failures[shard.index] = failures.get(shard.index, 0) + 1
+            if failures[shard.index] > retries:
+                raise RuntimeError(
+                    f"Shard {shard.index} failed after {failures[shard.index]} attempts: {errors[shard.index]}"
+                )
+            pending.append(shard)
+        retried += len(pending)
+    return [results[shard.index] for shard in shards], retried
+
+def run_batch(
+    input_path: str,
+    output_path: str = "-",
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    shard_bytes: int = SHARD_BYTES,
+    retries: int = DEFAULT_RETRIES,
+    today: Optional[datetime.datetime] = None,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> BatchSummary:
+    """
+    Quote a large request file across worker processes.
+
+    The input is split into shards at line boundaries. A first pass counts
+    each shard's requests so row numbers match run_headless(); workers then
+    quote their shards into separate files, which are merged in input order.
+    The catalogs of the current snapshot are copied once into shared memory
+    and every worker reads the same version from there. Failed shards are
+    rerun up to retries times.
+
+    Args:
+        input_path: Request file (CSV or JSONL; must be seekable)
+        output_path: Result file, "-" for stdout
+        input_format: Request format (default: from the file extension)
+        output_format: Result format (default: from the extension, else the input format)
+        max_workers: Worker processes; 1 runs in the calling process
+        shard_bytes: Input bytes per shard
+        retries: Extra attempts allowed for each failed shard
+        today: Date the reservation years are checked against (default: now)
+        progress: Called with (requests quoted, total requests) while running
+    """
+    if not input_path or input_path == "-":
+        raise ValueError("The batch runner needs an input file; use space_headless for stdin.")
+    if retries < 0:
+        raise ValueError("Retries cannot be negative.")
+    started = time.perf_counter()
+    input_format = input_format or detect_format(input_path)
+    output_format = output_format or detect_format(output_path, default=input_format)
+    if input_format not in FORMATS:
+        raise ValueError(f"Unsupported input format '{input_format}'.")
+    if output_format not in FORMATS:
+        raise ValueError(f"Unsupported output format '{output_format}'.")
+
+    fieldnames, shards = plan_shards(input_path, input_format, shard_bytes)
+    snapshot = current_snapshot()
+    catalogs = catalog_arrays(snapshot)
+    shared = len(shards) > 1 and max_workers != 1
+    block: Optional[SharedMemory] = None
+    quoted = multiprocessing.RawArray("q", max(len(shards), 1))
+    # Shards go next to the output so the merge reads from the same disk
+    output_dir = os.path.dirname(os.path.abspath(output_path)) if output_path != "-" else None
+    work_dir = tempfile.mkdtemp(prefix=".shards-", dir=output_dir)
+    job = ShardJob(input_path, input_format, output_format, fieldnames, work_dir, today or datetime.datetime.now())
+    global _worker_snapshot, _worker_progress
+    try:
+        # Shards run in this process (one worker, or a retry round down to
+        # one shard) read the same column-built records as the workers
+        _worker_snapshot = snapshot_from_arrays(snapshot.version, catalogs)
+        _worker_progress = quoted
+        initializer = None
+        if shared:
+            block, layout = share_catalogs(catalogs)
+            initializer = (block.name, layout, snapshot.version, quoted)
+
+        sizes, retried = _run_shards(_count_shard, job, shards, max_workers, retries, initializer)
+        first_row = 1
+        for i, rows in enumerate(sizes):
+            shards[i] = replace(shards[i], first_row=first_row, rows=rows)
+            first_row += rows
+        total = first_row - 1
+
+        def report() -> None:
+            progress(sum(quoted[:len(shards)]), total)
+
+        shard_counts, quote_retries = _run_shards(
+            _quote_shard, job, shards, max_workers, retries, initializer,
+            report if progress is not None else None
+        )
+        retried += quote_retries
+
+        to_stdout = output_path == "-"
+        out_stream = sys.stdout if to_stdout else open(output_path, "w", newline="")
+        try:
+            if output_format == "csv":
+                csv.DictWriter(out_stream, fieldnames=RESULT_FIELDS).writeheader()
+            out_stream.flush()
+            for shard in shards:
+                with open(shard_path(job, shard), newline="") as part:
+                    shutil.copyfileobj(part, out_stream, 1024 * 1024)
+            out_stream.flush()
+        finally:
+            if not to_stdout:
+                out_stream.close()
+    finally:
+        _worker_snapshot = None
+        _worker_progress = None
+        if block is not None:
+            block.close()
+            block.unlink()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return BatchSummary(
+        output=output_path,
+        rows=total,
+        ok=sum(c["ok"] for c in shard_counts),
+        error=sum(c["error"] for c in shard_counts),
+        shards=len(shards),
+        retries=retried,
+        seconds=time.perf_counter() - started,
+    )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Quote a large CSV or JSONL request file in parallel shards."
+    )
+    parser.add_argument("--input", "-i", required=True, help="Request file")
+    parser.add_argument("--output", "-o", default="-", help="Result file (default: stdout)")
+    parser.add_argument("--input-format", choices=FORMATS,
+                        help="Request format (default: from file extension, else jsonl)")
+    parser.add_argument("--output-format", choices=FORMATS,
+                        help="Result format (default: from file extension, else input format)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--shard-bytes", type=int, default=SHARD_BYTES,
+                        help="Input bytes per shard (default: 16 MiB)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="Extra attempts for a failed shard (default: 2)")
+    parser.add_argument("--quiet", action="store_true", help="No progress on stderr")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+
+    def report(quoted: int, total: int) -> None:
+        elapsed = time.perf_counter() - started
+        print(f"\r{quoted:,}/{total:,} quotes ({quoted / max(elapsed, 1e-9):,.0f} quotes/s)", end="", file=sys.stderr)
+
+    try:
+        summary = run_batch(
+            args.input, args.output, args.input_format, args.output_format, args.workers,
+            args.shard_bytes, args.retries, progress=None if args.quiet else report
+        )
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(
+            f"\nQuoted {summary.ok:,} journeys, {summary.error:,} invalid requests in {summary.shards} shards "
+            f"({summary.retries} retried) in {summary.seconds:.2f} s "
+            f"({summary.rows / max(summary.seconds, 1e-9):,.0f} quotes/s)",
+            file=sys.stderr
+        )
+    return 0 if summary.error == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# Catalog Memory Benchmark - Python Version
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from dataclasses import make_dataclass, fields
+from typing import Any, Callable, Dict, List, Optional
+
+from space_data import PlanetaryBody
+from space_catalog import ColumnarCatalog
+
+# Generated bodies share a small set of descriptions, as simulation catalogs do
+DESCRIPTION_TEMPLATES = [
+    f"Simulated {kind} body in survey sector {sector}, catalogued for long-range journey planning."
+    for kind in ("rocky", "icy", "gaseous", "metallic", "volcanic")
+    for sector in range(20)
+]
+
+# PlanetaryBody as it was before slots: a plain dataclass with a __dict__
+LegacyPlanetaryBody = make_dataclass(
+    "LegacyPlanetaryBody", [(f.name, f.type) for f in fields(PlanetaryBody)]
+)
+
+def generate_bodies(count: int, record_class: type = PlanetaryBody, seed: int = 42) -> List[Any]:
+    """Synthetic bodies; every description is a separate string object, as if parsed from a file"""
+    rng = random.Random(seed)
+    return [
+        record_class(
+            name=f"Body-{i:08d}",
+            distance_from_earth=rng.uniform(3.8e5, 6e9),
+            diameter=rng.uniform(10, 150000),
+            gravity=rng.uniform(0.01, 25),
+            description=(rng.choice(DESCRIPTION_TEMPLATES) + " ")[:-1],
+        )
+        for i in range(count)
+    ]
+
+def measure(build: Callable[[], Any]) -> Dict[str, Any]:
+    """Peak and retained traced memory and wall time of build()"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"result": result, "retained_bytes": retained, "peak_bytes": peak, "build_seconds": seconds}
+
+def run_benchmark(count: int) -> Dict[str, Dict[str, float]]:
+    """Memory per body for the legacy dataclass, slotted records and the columnar store"""
+    results: Dict[str, Dict[str, float]] = {}
+
+    def report(label: str, measured: Dict[str, Any], scan: Callable[[Any], float]) -> None:
+        started = time.perf_counter()
+        scan(measured["result"])
+        results[label] = {
+            "bytes_per_body": measured["retained_bytes"] / count,
+            "retained_mb": measured["retained_bytes"] / 1e6,
+            "peak_mb": measured["peak_bytes"] / 1e6,
+            "build_seconds": measured["build_seconds"],
+            "scan_seconds": time.perf_counter() - started,
+        }
+
+    def scan_records(records: List[Any]) -> float:
+        return sum(record.distance_from_earth for record in records)
+
+    legacy = measure(lambda: generate_bodies(count, LegacyPlanetaryBody))
+    report("dataclass", legacy, scan_records)
+    del legacy
+
+    slotted = measure(lambda: generate_bodies(count))
+    report("slots", slotted, scan_records)
+
+    # The columnar store is built from records; only what it keeps is counted
+    records = slotted.pop("result")
+    columnar = measure(lambda: ColumnarCatalog.from_records(records))
+    del records, slotted
+    report("columnar", columnar, lambda catalog: float(catalog.column("distance_from_earth").sum()))
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare catalog memory use per planetary body.")
+    parser.add_argument("--count", type=int, default=1000000, help="Bodies to generate")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.count)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"===== CATALOG MEMORY ({args.count:,} planetary bodies) =====")
+    print(f"{'Storage':<12}{'Bytes/body':>12}{'Retained MB':>14}{'Peak MB':>10}{'Build s':>10}{'Scan s':>10}")
+    for label, stats in results.items():
+        print(
+            f"{label:<12}{stats['bytes_per_body']:>12,.1f}{stats['retained_mb']:>14,.1f}"
+            f"{stats['peak_mb']:>10,.1f}{stats['build_seconds']:>10.2f}{stats['scan_seconds']:>10.3f}"
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
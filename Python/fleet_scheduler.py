@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# Fleet Assignment Scheduler - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import sys
+import csv
+import bisect
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from space_data import (
+    get_all_transportation_vehicles,
+    get_planetary_body,
+    TransportationVehicle
+)
+
+OBJECTIVES = ("trips", "fuel")
+
+@dataclass
+class Booking:
+    booking_id: str
+    passengers: int
+    cargo: int                # kg
+    destination: str
+
+@dataclass
+class Trip:
+    destination: str
+    vehicle: TransportationVehicle
+    distance: float           # kilometers
+    booking_ids: List[str] = field(default_factory=list)
+    passengers: int = 0
+    cargo: int = 0            # kg
+
+    @property
+    def fuel_units(self) -> float:
+        # Bookings carry no velocity, so trips are costed at constant speed even
+        # for vehicles with an acceleration limit, whose burns use more fuel
+        return self.distance / self.vehicle.fuel_efficiency
+
+    @property
+    def passenger_utilization(self) -> float:
+        capacity = self.vehicle.passenger_capacity
+        return self.passengers / capacity if capacity else 0.0
+
+    @property
+    def cargo_utilization(self) -> float:
+        capacity = self.vehicle.cargo_capacity
+        return self.cargo / capacity if capacity else 0.0
+
+@dataclass
+class Schedule:
+    objective: str
+    trips: List[Trip] = field(default_factory=list)
+    unassigned: List[Booking] = field(default_factory=list)
+
+    @property
+    def trip_count(self) -> int:
+        return len(self.trips)
+
+    @property
+    def total_fuel_units(self) -> float:
+        return sum(trip.fuel_units for trip in self.trips)
+
+    def utilization(self) -> Dict[str, Dict[str, float]]:
+        """Trips and average passenger/cargo utilization per vehicle"""
+        totals: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        for trip in self.trips:
+            entry = totals[trip.vehicle.name]
+            entry[0] += 1
+            entry[1] += trip.passenger_utilization
+            entry[2] += trip.cargo_utilization
+        return {
+            name: {
+                "trips": count,
+                "passenger_utilization": passenger / count,
+                "cargo_utilization": cargo / count,
+            }
+            for name, (count, passenger, cargo) in totals.items()
+        }
+
+    def report(self) -> str:
+        """Plain-text summary of the schedule"""
+        lines = [
+            "===== FLEET ASSIGNMENT SCHEDULE =====",
+            f"Objective: minimize {self.objective}",
+            f"Trips: {self.trip_count:,}",
+            f"Fuel Required: {self.total_fuel_units:,.2f} units",
+            f"Unassigned Bookings: {len(self.unassigned):,}",
+            "",
+            "Utilization by Vehicle:",
+        ]
+        for name, stats in sorted(self.utilization().items()):
+            lines.append(
+                f"- {name}: {stats['trips']:,} trips, "
+                f"{stats['passenger_utilization']:.1%} passengers, "
+                f"{stats['cargo_utilization']:.1%} cargo"
+            )
+        lines.append("=====================================")
+        return "\n".join(lines)
+
+def _fits(booking: Booking, vehicle: TransportationVehicle) -> bool:
+    return booking.passengers <= vehicle.passenger_capacity and booking.cargo <= vehicle.cargo_capacity
+
+def pack_trips(bookings: Sequence[Booking], vehicle: TransportationVehicle, distance: float) -> List[Trip]:
+    """
+    Pack bookings onto as few trips of one vehicle type as possible.
+
+    Best-fit decreasing: bookings are placed largest first (by the larger of
+    their passenger and cargo share of the vehicle) into the open trip with
+    the fewest free seats, then the least cargo room, that still fits them.
+    Open trips are indexed by free seats and sorted by remaining cargo, so
+    each placement is a few bisections rather than a scan of every trip.
+    """
+    passenger_capacity = vehicle.passenger_capacity or 1
+    cargo_capacity = vehicle.cargo_capacity or 1
+    ordered = sorted(
+        bookings,
+        key=lambda b: max(b.passengers / passenger_capacity, b.cargo / cargo_capacity),
+        reverse=True
+    )
+
+    trips: List[Trip] = []
+    # Open trips bucketed by seats left; each bucket is sorted by
+    # (remaining cargo, trip number) and seat_levels lists the non-empty buckets
+    buckets: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    seat_levels: List[int] = []
+
+    for booking in ordered:
+        chosen = None
+        # Tightest seat fit first, then the tightest cargo fit within it
+        for seats in seat_levels[bisect.bisect_left(seat_levels, booking.passengers):]:
+            bucket = buckets[seats]
+            position = bisect.bisect_left(bucket, (booking.cargo, -1))
+            if position < len(bucket):
+                remaining_cargo, number = bucket.pop(position)
+                if not bucket:
+                    seat_levels.remove(seats)
+                chosen = (seats, remaining_cargo, number)
+                break
+
+        if chosen is None:
+            number = len(trips)
+            trips.append(Trip(destination=booking.destination, vehicle=vehicle, distance=distance))
+            seats, remaining_cargo = vehicle.passenger_capacity, vehicle.cargo_capacity
+        else:
+            seats, remaining_cargo, number = chosen
+
+        trip = trips[number]
+        trip.booking_ids.append(booking.booking_id)
+        trip.passengers += booking.passengers
+        trip.cargo += booking.cargo
+        seats -= booking.passengers
+        remaining_cargo -= booking.cargo
+
+        # Full trips leave the index; the rest go back in at their new position
+        if seats > 0 or remaining_cargo > 0:
+            if not buckets[seats]:
+                bisect.insort(seat_levels, seats)
+            bisect.insort(buckets[seats], (remaining_cargo, number))
+
+    return trips
+
+def _trip_cost(trips: List[Trip], objective: str) -> Tuple[float, float]:
+    fuel = sum(trip.fuel_units for trip in trips)
+    return (len(trips), fuel) if objective == "trips" else (fuel, len(trips))
+
+def schedule_bookings(
+    bookings: Iterable[Booking],
+    objective: str = "trips",
+    vehicles: Optional[Dict[str, TransportationVehicle]] = None
+) -> Schedule:
+    """
+    Assign a day's bookings to vehicle trips, minimizing trips or total fuel.
+
+    For each destination, every vehicle type packs the bookings it can carry
+    and the cheapest packing wins; bookings too large for that vehicle are
+    packed again with the remaining vehicle types. Bookings that fit no
+    vehicle are reported as unassigned.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Choose from {', '.join(OBJECTIVES)}.")
+    vehicles = get_all_transportation_vehicles() if vehicles is None else vehicles
+
+    by_destination: Dict[str, List[Booking]] = defaultdict(list)
+    for booking in bookings:
+        by_destination[booking.destination].append(booking)
+
+    schedule = Schedule(objective=objective)
+    for destination, pending in by_destination.items():
+        distance = get_planetary_body(destination).distance_from_earth
+        candidates = list(vehicles.values())
+
+        while pending and candidates:
+            best = None
+            for vehicle in candidates:
+                fitting = [booking for booking in pending if _fits(booking, vehicle)]
+                if not fitting:
+                    continue
+                trips = pack_trips(fitting, vehicle, distance)
+                # Carrying more bookings beats a cheaper packing of fewer
+                score = (-len(fitting),) + _trip_cost(trips, objective)
+                if best is None or score < best[0]:
+                    best = (score, vehicle, trips)
+            if best is None:
+                break
+            _, vehicle, trips = best
+            schedule.trips.extend(trips)
+            pending = [booking for booking in pending if not _fits(booking, vehicle)]
+            candidates.remove(vehicle)
+
+        schedule.unassigned.extend(pending)
+    return schedule
+
+def load_bookings(path: str) -> List[Booking]:
+    """
+    Read bookings from a CSV with booking_id, passengers, cargo, destination columns.
+
+    Raises ValueError naming the row if a booking has negative passengers or cargo.
+    """
+    bookings = []
+    with open(path, newline="") as f:
+        for row, fields in enumerate(csv.DictReader(f)):
+            passengers, cargo = int(fields["passengers"]), float(fields["cargo"])
+            if passengers < 0 or cargo < 0:
+                raise ValueError(
+                    f"Booking '{fields['booking_id']}' at row {row} has negative passengers or cargo."
+                )
+            bookings.append(Booking(
+                booking_id=fields["booking_id"],
+                passengers=passengers,
+                cargo=int(cargo),
+                destination=fields["destination"]
+            ))
+    return bookings
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pack a day's bookings onto the fleet.")
+    parser.add_argument("bookings", help="CSV with booking_id, passengers, cargo, destination")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="trips")
+    args = parser.parse_args(argv)
+
+    schedule = schedule_bookings(load_bookings(args.bookings), args.objective)
+    print(schedule.report())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# Journey Journal - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import re
+import gzip
+import json
+import shutil
+import atexit
+import datetime
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Pattern
+
+import space_metrics
+
+# Segment files look like JourneyJournal.000001.jsonl (or .jsonl.gz once compressed)
+SEGMENT_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".jsonl.gz"
+
+# Instrumentation (recorded only while space_metrics is enabled)
+_append_seconds = space_metrics.histogram(
+    "space_journal_append_seconds", "Time to serialize and append one journey record"
+)
+_records_written = space_metrics.counter("space_journal_records_total", "Journey records appended")
+_bytes_written = space_metrics.counter("space_journal_bytes_total", "Bytes appended to journal segments")
+_rotations = space_metrics.counter("space_journal_rotations_total", "Journal segment rotations")
+
+def _segment_pattern(base_name: str) -> Pattern:
+    return re.compile(rf"^{re.escape(base_name)}\.(\d{{6}})\.jsonl(\.gz)?$")
+
+def list_segments(directory: str, base_name: str = "JourneyJournal") -> List[str]:
+    """Return the journal's segment paths in write order"""
+    if not os.path.isdir(directory):
+        return []
+    pattern = _segment_pattern(base_name)
+    segments: Dict[int, str] = {}
+    for file_name in os.listdir(directory):
+        match = pattern.match(file_name)
+        if match:
+            number = int(match.group(1))
+            # While a segment is being compressed both copies exist; use the plain one
+            if number not in segments or not match.group(2):
+                segments[number] = file_name
+    return [os.path.join(directory, segments[number]) for number in sorted(segments)]
+
+class JourneyJournal:
+    """
+    Append-only journal of journey records, one JSON object per line.
+
+    Records go to the active segment file, which stays open between appends.
+    Once it grows past max_segment_bytes it is closed and a new segment is
+    started; closed segments can be gzipped on a background thread.
+    """
+    def __init__(
+        self,
+        directory: str,
+        base_name: str = "JourneyJournal",
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        compress_closed: bool = False,
+        flush_every: int = 1
+    ):
+        self.directory = directory
+        self.base_name = base_name
+        self.max_segment_bytes = max_segment_bytes
+        self.compress_closed = compress_closed
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._segment_number = 0
+        self._segment_bytes = 0
+        self._pending = 0
+        self._compressors: List[threading.Thread] = []
+
+        os.makedirs(directory, exist_ok=True)
+        self._open_segment(self._resume_segment_number())
+        atexit.register(self.close)
+
+    @property
+    def segment_path(self) -> str:
+        """Path of the segment currently being written"""
+        return self._segment_path(self._segment_number)
+
+    def _segment_path(self, number: int, compressed: bool = False) -> str:
+        suffix = COMPRESSED_SUFFIX if compressed else SEGMENT_SUFFIX
+        return os.path.join(self.directory, f"{self.base_name}.{number:06d}{suffix}")
+
+    def _resume_segment_number(self) -> int:
+        # Keep appending to the newest segment if it is still plain and has room
+        segments = list_segments(self.directory, self.base_name)
+        if not segments:
+            return 1
+        match = _segment_pattern(self.base_name).match(os.path.basename(segments[-1]))
+        number = int(match.group(1))
+        if match.group(2) or os.path.getsize(segments[-1]) >= self.max_segment_bytes:
+            return number + 1
+        return number
+
+    def _open_segment(self, number: int) -> None:
+        self._segment_number = number
+        self._file = open(self._segment_path(number), "ab")
+        self._segment_bytes = self._file.tell()
+
+    def _rotate(self) -> None:
+        closed_number = self._segment_number
+        self._file.close()
+        self._open_segment(closed_number + 1)
+        if self.compress_closed:
+            thread = threading.Thread(target=self._compress, args=(closed_number,), daemon=True)
+            thread.start()
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+
+    def _compress(self, number: int) -> None:
+        source = self._segment_path(number)
+        target = self._segment_path(number, compressed=True)
+        with open(source, "rb") as f_in, gzip.open(target + ".tmp", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.replace(target + ".tmp", target)
+        os.remove(source)
+
+    def append(self, record: Dict[str, Any]) -> str:
+        """Append one record and return the segment path it was written to"""
+        started = time.perf_counter() if space_metrics.enabled else None
+        line = (json.dumps(record, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Journey journal is closed.")
+            if self._segment_bytes and self._segment_bytes + len(line) > self.max_segment_bytes:
+                self._rotate()
+                if started is not None:
+                    _rotations.inc()
+            self._file.write(line)
+            self._segment_bytes += len(line)
+            self._pending += 1
+            if self.flush_every and self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
+            path = self.segment_path
+        if started is not None:
+            _append_seconds.observe(time.perf_counter() - started)
+            _records_written.inc()
+            _bytes_written.inc(len(line))
+        return path
+
+    def flush(self) -> None:
+        """Push buffered records to the operating system"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._pending = 0
+
+    def close(self) -> None:
+        """Close the active segment and wait for background compression"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        for thread in self._compressors:
+            thread.join()
+        self._compressors = []
+
+def read_journal(directory: str, base_name: str = "JourneyJournal") -> Iterator[Dict[str, Any]]:
+    """Stream every record back out of the journal, oldest first"""
+    for path in list_segments(directory, base_name):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                # A torn last line from an interrupted write is skipped
+                if line.endswith("\n"):
+                    yield json.loads(line)
+
+def journey_record(**fields: Any) -> Dict[str, Any]:
+    """Build a journal record, stamping it with the time it was recorded"""
+    record = {"recorded_at": datetime.datetime.now().isoformat(timespec="seconds")}
+    for key, value in fields.items():
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            value = value.isoformat()
+        record[key] = value
+    return record
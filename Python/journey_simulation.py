@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# Journey Uncertainty Simulation - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import sys
+import time
+import argparse
+import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from space_data import current_snapshot, get_planetary_body, get_transportation_vehicle
+from space_journey import COST_PER_MILLION_KM, HOURS_PER_DAY, validate_velocity
+from space_ephemeris import distances_for, has_orbit
+from space_batch import add_hours
+from space_trajectory import phase_totals, trajectory_columns
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_SAMPLES = 1000000
+
+@dataclass(frozen=True)
+class UncertaintyModel:
+    """
+    How far a real trip strays from the quoted one.
+
+    Each sample draws an effective cruise velocity (the selected velocity
+    scaled by a normal factor, never above the vehicle's maximum), a
+    departure delay (delayed with some probability, by an exponentially
+    distributed number of hours) and a path length (the Earth-to-body
+    distance on the actual departure date, scaled by a normal factor for
+    course corrections).
+    """
+    velocity_spread: float = 0.05         # std dev of the velocity factor
+    min_velocity_factor: float = 0.25     # slowest allowed fraction of the selected velocity
+    delay_probability: float = 0.3
+    mean_delay_hours: float = 12.0
+    distance_spread: float = 0.01         # std dev of the path length factor
+    use_ephemeris: bool = True            # distance on the delayed departure date
+
+DEFAULT_MODEL = UncertaintyModel()
+
+@dataclass
+class SimulationResult:
+    destination: str
+    vehicle: str
+    velocity: float                       # km/h, as selected
+    departure_date: datetime.datetime     # scheduled
+    samples: int
+    duration_hours: Dict[int, float]      # percentile -> value
+    duration_days: Dict[int, float]
+    arrival_date: Dict[int, datetime.datetime]
+    fuel_units: Dict[int, float]
+    journey_cost: Dict[int, float]
+    mean_duration_hours: float
+    mean_delay_hours: float
+    seconds: float                        # wall time of the simulation
+
+def _percentiles(values: np.ndarray) -> Dict[int, float]:
+    # One partition pass for all percentiles
+    return dict(zip(PERCENTILES, (float(v) for v in np.percentile(values, PERCENTILES))))
+
+def sample_journeys(
+    destination: str,
+    max_velocity: float,
+    velocity: float,
+    departure_date: datetime.datetime,
+    base_distance: float,
+    samples: int,
+    model: UncertaintyModel,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return per-sample (delay hours, cruise velocity km/h, distance km)"""
+    delay_hours = np.zeros(samples)
+    if model.delay_probability > 0 and model.mean_delay_hours > 0:
+        delayed = rng.random(samples) < model.delay_probability
+        delay_hours[delayed] = rng.exponential(model.mean_delay_hours, int(delayed.sum()))
+
+    if model.use_ephemeris and has_orbit(destination):
+        # Daily table lookups, interpolated at each sample's actual departure
+        departures = np.datetime64(departure_date, "us") + (delay_hours * 3.6e9).astype("timedelta64[us]")
+        distance = distances_for(destination, departures)
+    else:
+        distance = np.full(samples, base_distance)
+    if model.distance_spread > 0:
+        distance *= rng.normal(1.0, model.distance_spread, samples)
+
+    velocity_factor = rng.normal(1.0, model.velocity_spread, samples)
+    np.maximum(velocity_factor, model.min_velocity_factor, out=velocity_factor)
+    effective_velocity = np.minimum(velocity * velocity_factor, max_velocity)
+    return delay_hours, effective_velocity, distance
+
+def simulate_journey(
+    destination: str,
+    vehicle: str,
+    velocity: float,
+    departure_date: datetime.datetime,
+    samples: int = DEFAULT_SAMPLES,
+    model: UncertaintyModel = DEFAULT_MODEL,
+    seed: Optional[int] = None
+) -> SimulationResult:
+    """
+    Monte Carlo duration, arrival, fuel and cost percentiles for one quote.
+
+    Every sample is drawn and evaluated in one vectorized pass; a million
+    samples take about 0.3 s. Like calculate_journey(), raises
+    OverflowError when a journey is too long for its arrival date to be
+    represented.
+
+    Args:
+        destination: Planetary body name
+        vehicle: Transportation vehicle name
+        velocity: Selected velocity in km/h, validated like the interactive prompt
+        departure_date: Scheduled departure
+        samples: Number of simulated trips
+        model: Sources and sizes of the variation
+        seed: Seed (or SeedSequence) for reproducible results
+    """
+    started = time.perf_counter()
+    planet = get_planetary_body(destination)
+    selected_vehicle = get_transportation_vehicle(vehicle)
+    is_valid, velocity = validate_velocity(str(velocity), selected_vehicle.max_velocity)
+    if not is_valid:
+        raise ValueError(
+            f"Velocity must be positive and cannot exceed {selected_vehicle.max_velocity:,.0f} km/h."
+        )
+    if samples < 1:
+        raise ValueError("samples must be at least 1.")
+
+    rng = np.random.default_rng(seed)
+    delay_hours, cruise_velocity, distance = sample_journeys(
+        planet.name, selected_vehicle.max_velocity, velocity,
+        departure_date, planet.distance_from_earth, samples, model, rng
+    )
+    if selected_vehicle.acceleration is None:
+        with np.errstate(over="ignore"):
+            duration_hours = distance / cruise_velocity
+        fuel = {p: d / selected_vehicle.fuel_efficiency for p, d in _percentiles(distance).items()}
+    else:
+        # Accelerate-coast-decelerate: burn fuel depends on each sample's velocity
+        phases = trajectory_columns(distance, cruise_velocity, selected_vehicle.acceleration)
+        duration_hours, fuel_units = phase_totals(phases, selected_vehicle.fuel_efficiency)
+        fuel = _percentiles(fuel_units)
+    if not np.isfinite(duration_hours).all():
+        # Tiny velocities: percentiles of infinite durations would be NaN
+        raise OverflowError("Journey duration is too long to represent.")
+    arrival_hours = _percentiles(delay_hours + duration_hours)
+    arrival_dates = add_hours(np.datetime64(departure_date, "us"), list(arrival_hours.values()))
+    duration = _percentiles(duration_hours)
+    distance_percentiles = _percentiles(distance)
+
+    return SimulationResult(
+        destination=planet.name,
+        vehicle=selected_vehicle.name,
+        velocity=velocity,
+        departure_date=departure_date,
+        samples=samples,
+        duration_hours=duration,
+        duration_days={p: hours / HOURS_PER_DAY for p, hours in duration.items()},
+        arrival_date={p: arrival.astype(datetime.datetime) for p, arrival in zip(PERCENTILES, arrival_dates)},
+        fuel_units=fuel,
+        journey_cost={p: (d / 1000000) * COST_PER_MILLION_KM for p, d in distance_percentiles.items()},
+        mean_duration_hours=float(duration_hours.mean()),
+        mean_delay_hours=float(delay_hours.mean()),
+        seconds=time.perf_counter() - started,
+    )
+
+def _simulate_pair(args: tuple) -> SimulationResult:
+    destination, vehicle, velocity, departure_date, samples, model, seed = args
+    return simulate_journey(destination, vehicle, velocity, departure_date, samples, model, seed)
+
+def simulate_catalog(
+    departure_date: datetime.datetime,
+    velocity_fraction: float = 0.8,
+    samples: int = DEFAULT_SAMPLES,
+    model: UncertaintyModel = DEFAULT_MODEL,
+    destinations: Optional[Sequence[str]] = None,
+    vehicles: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> List[SimulationResult]:
+    """
+    Simulate every destination x vehicle pair, each at velocity_fraction of
+    the vehicle's maximum (0.8 is the calculator's recommended velocity).
+
+    Pairs are spread across worker processes; each gets its own child of
+    one SeedSequence, so results are reproducible for a given seed whatever
+    the number of workers. max_workers=1 runs everything in the calling process.
+    """
+    snapshot = current_snapshot()
+    destinations = list(snapshot.planetary_bodies) if destinations is None else list(destinations)
+    vehicles = list(snapshot.transportation_vehicles) if vehicles is None else list(vehicles)
+    pairs = [(destination, vehicle) for destination in destinations for vehicle in vehicles]
+    seeds = np.random.SeedSequence(seed).spawn(len(pairs))
+    jobs = [
+        (
+            destination, vehicle,
+            snapshot.get_transportation_vehicle(vehicle).max_velocity * velocity_fraction,
+            departure_date, samples, model, child_seed
+        )
+        for (destination, vehicle), child_seed in zip(pairs, seeds)
+    ]
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_simulate_pair(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_simulate_pair, jobs))
+
+def format_simulation(result: SimulationResult) -> str:
+    """Percentile table for one simulated quote"""
+    lines = [
+        f"{result.destination} by {result.vehicle} at {result.velocity:,.0f} km/h, "
+        f"departing {result.departure_date:%Y-%m-%d} ({result.samples:,} samples, {result.seconds:.2f} s)",
+        f"  {'':<18}" + "".join(f"{'P' + str(p):>22}" for p in PERCENTILES),
+        f"  {'Duration (days)':<18}" + "".join(f"{result.duration_days[p]:>22,.3f}" for p in PERCENTILES),
+        f"  {'Arrival':<18}" + "".join(f"{result.arrival_date[p].strftime('%Y-%m-%d %H:%M'):>22}" for p in PERCENTILES),
+        f"  {'Fuel (units)':<18}" + "".join(f"{result.fuel_units[p]:>22,.2f}" for p in PERCENTILES),
+        f"  {'Cost':<18}" + "".join(f"{'$' + format(result.journey_cost[p], ',.2f'):>22}" for p in PERCENTILES),
+    ]
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Monte Carlo journey duration, arrival and fuel percentiles.")
+    parser.add_argument("destination", nargs="?", help="Planetary body (omit with --catalog)")
+    parser.add_argument("vehicle", nargs="?", help="Transportation vehicle (omit with --catalog)")
+    parser.add_argument("velocity", nargs="?", type=float, help="Velocity in km/h (omit with --catalog)")
+    parser.add_argument("--date", default=None, help="Departure date YYYY-MM-DD (default: today)")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Samples per quote (default: 1,000,000)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible results")
+    parser.add_argument("--catalog", action="store_true", help="Simulate every destination x vehicle pair")
+    parser.add_argument(
+        "--velocity-fraction", type=float, default=0.8,
+        help="With --catalog, fraction of each vehicle's maximum velocity (default: 0.8)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --catalog")
+    parser.add_argument("--velocity-spread", type=float, default=DEFAULT_MODEL.velocity_spread)
+    parser.add_argument("--delay-probability", type=float, default=DEFAULT_MODEL.delay_probability)
+    parser.add_argument("--mean-delay-hours", type=float, default=DEFAULT_MODEL.mean_delay_hours)
+    parser.add_argument("--distance-spread", type=float, default=DEFAULT_MODEL.distance_spread)
+    args = parser.parse_args(argv)
+
+    if args.date:
+        departure_date = datetime.datetime.strptime(args.date, "%Y-%m-%d")
+    else:
+        today = datetime.date.today()
+        departure_date = datetime.datetime(today.year, today.month, today.day)
+    model = UncertaintyModel(
+        velocity_spread=args.velocity_spread,
+        delay_probability=args.delay_probability,
+        mean_delay_hours=args.mean_delay_hours,
+        distance_spread=args.distance_spread,
+    )
+
+    try:
+        if args.catalog:
+            started = time.perf_counter()
+            results = simulate_catalog(
+                departure_date, args.velocity_fraction, args.samples, model,
+                seed=args.seed, max_workers=args.workers
+            )
+            for result in results:
+                print(format_simulation(result))
+            print(f"\n{len(results)} quotes, {len(results) * args.samples:,} samples in {time.perf_counter() - started:.2f} s")
+        else:
+            if args.destination is None or args.vehicle is None or args.velocity is None:
+                parser.error("destination, vehicle and velocity are required without --catalog")
+            result = simulate_journey(
+                args.destination, args.vehicle, args.velocity, departure_date, args.samples, model, args.seed
+            )
+            print(format_simulation(result))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# Launch Window Optimizer - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from space_data import get_planetary_body, get_transportation_vehicle
+from space_journey import COST_PER_MILLION_KM, RESERVATION_YEARS, validate_velocity
+from space_ephemeris import distances_for
+from space_batch import add_hours
+from space_trajectory import vehicle_columns
+
+OBJECTIVES = ("duration", "fuel", "cost")
+
+@dataclass
+class LaunchWindow:
+    destination: str
+    vehicle: str
+    velocity: float               # km/h
+    departure_date: datetime.date
+    distance: float               # kilometers at departure
+    duration_hours: float
+    arrival_date: datetime.datetime
+    fuel_units: float
+    journey_cost: float           # dollars
+
+def reservation_days(today: Optional[datetime.date] = None) -> np.ndarray:
+    """Every departure day the reservation system accepts, as datetime64[D]"""
+    today = today or datetime.date.today()
+    try:
+        last_day = today.replace(year=today.year + RESERVATION_YEARS)
+    except ValueError:
+        # February 29 in a year that is not a leap year
+        last_day = today.replace(year=today.year + RESERVATION_YEARS, day=28)
+    return np.arange(np.datetime64(today, "D"), np.datetime64(last_day, "D") + 1)
+
+def _local_minima(values: np.ndarray) -> np.ndarray:
+    """Indices where values are no larger than both neighbours (plateaus count once)"""
+    if len(values) < 3:
+        return np.arange(len(values))
+    left = np.concatenate(([True], values[1:] < values[:-1]))
+    right = np.concatenate((values[:-1] <= values[1:], [True]))
+    return np.flatnonzero(left & right)
+
+def find_launch_windows(
+    destination: str,
+    vehicle: str,
+    velocity: float,
+    top_k: int = 5,
+    by: str = "duration",
+    days: Optional[np.ndarray] = None,
+    distinct: bool = True
+) -> List[LaunchWindow]:
+    """
+    Rank every candidate departure day for one (destination, vehicle, velocity).
+
+    All candidate days are evaluated in one vectorized pass over the ephemeris
+    table. With distinct=True only the best day of each window (a local
+    minimum of the objective) is reported, so the results are separate
+    launch opportunities rather than neighbouring days of the same one.
+
+    Args:
+        destination: Planetary body name
+        vehicle: Transportation vehicle name
+        velocity: Travel velocity in km/h, validated like the interactive prompt
+        top_k: Number of windows to return
+        by: "duration", "fuel" or "cost"
+        days: Candidate departure days (defaults to the 30-year reservation window)
+        distinct: Report one day per window instead of the k best days overall
+
+    Returns:
+        Windows sorted from best to worst
+    """
+    if by not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{by}'. Choose from {', '.join(OBJECTIVES)}.")
+    planet = get_planetary_body(destination)
+    selected_vehicle = get_transportation_vehicle(vehicle)
+    is_valid, velocity = validate_velocity(str(velocity), selected_vehicle.max_velocity)
+    if not is_valid:
+        raise ValueError(
+            f"Velocity must be positive and cannot exceed {selected_vehicle.max_velocity:,.0f} km/h."
+        )
+
+    days = reservation_days() if days is None else np.asarray(days, dtype="datetime64[D]")
+    distance = distances_for(planet.name, days)
+    duration_hours, fuel_units = vehicle_columns(distance, velocity, selected_vehicle)
+    journey_cost = (distance / 1000000) * COST_PER_MILLION_KM
+    objective = {"duration": duration_hours, "fuel": fuel_units, "cost": journey_cost}[by]
+
+    candidates = _local_minima(objective) if distinct else np.arange(len(objective))
+    if len(candidates) > top_k:
+        best = np.argpartition(objective[candidates], top_k - 1)[:top_k]
+        candidates = candidates[best]
+    candidates = candidates[np.lexsort((candidates, objective[candidates]))]
+
+    arrivals = add_hours(days[candidates], duration_hours[candidates])
+
+    return [
+        LaunchWindow(
+            destination=planet.name,
+            vehicle=selected_vehicle.name,
+            velocity=velocity,
+            departure_date=days[i].astype(datetime.date),
+            distance=float(distance[i]),
+            duration_hours=float(duration_hours[i]),
+            arrival_date=arrival.astype(datetime.datetime),
+            fuel_units=float(fuel_units[i]),
+            journey_cost=float(journey_cost[i]),
+        )
+        for i, arrival in zip(candidates, arrivals)
+    ]
+
+def _find_for_destination(args: tuple) -> List[LaunchWindow]:
+    destination, vehicle, velocity, top_k, by, distinct = args
+    return find_launch_windows(destination, vehicle, velocity, top_k, by, distinct=distinct)
+
+def find_launch_windows_multi(
+    destinations: Sequence[str],
+    vehicle: str,
+    velocity: float,
+    top_k: int = 5,
+    by: str = "duration",
+    distinct: bool = True,
+    max_workers: Optional[int] = None
+) -> Dict[str, List[LaunchWindow]]:
+    """
+    Run find_launch_windows for several destinations, one per worker process.
+
+    max_workers=1 runs everything in the calling process.
+    """
+    jobs = [(destination, vehicle, velocity, top_k, by, distinct) for destination in destinations]
+    if max_workers == 1 or len(jobs) <= 1:
+        results = [_find_for_destination(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_find_for_destination, jobs))
+    return dict(zip(destinations, results))
@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+# Parameter Sweep Exporter - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from space_data import current_snapshot
+from space_journey import COST_PER_MILLION_KM, HOURS_PER_DAY
+from space_ephemeris import distance_on
+from space_trajectory import phase_totals, trajectory_columns
+
+# Rows computed per work unit; bounds the memory of each worker and of the
+# results waiting to be written
+CHUNK_ROWS = 1000000
+
+OUTPUT_FORMATS = ("csv", "columns")
+
+# Columnar output: a directory holding a sweep.json manifest and one .npy file
+# per column, so the grid can be memory-mapped back without parsing. The
+# vehicle and destination columns hold positions in the manifest's name lists.
+MANIFEST_FILE = "sweep.json"
+SWEEP_FORMAT_VERSION = 1
+COLUMNS = (
+    ("vehicle", np.int32),
+    ("destination", np.int32),
+    ("velocity", np.float64),
+    ("distance", np.float64),
+    ("duration_hours", np.float64),
+    ("duration_days", np.float64),
+    ("fuel_units", np.float64),
+    ("journey_cost", np.float64),
+)
+CSV_HEADER = "vehicle,destination,velocity,distance,duration_hours,duration_days,fuel_units,journey_cost\n"
+
+@dataclass(frozen=True)
+class SweepChunk:
+    """One vehicle x destination pair over a run of consecutive velocity steps"""
+    vehicle_code: int
+    destination_code: int
+    vehicle: str
+    destination: str
+    distance: float           # kilometers
+    fuel_efficiency: float
+    acceleration: Optional[float]   # m/s², None for constant speed
+    start: float              # first velocity of the sweep, km/h
+    step: float               # km/h between rows
+    first_step: int           # index of this chunk's first velocity step
+    rows: int
+    offset: int               # row of the whole grid this chunk starts at
+
+@dataclass
+class SweepSummary:
+    path: str
+    output_format: str
+    rows: int
+    chunks: int
+    bytes_written: int
+    seconds: float
+
+def velocity_steps(max_velocity: float, step: float, start: float) -> int:
+    """Number of velocities start, start + step, ... not above max_velocity"""
+    if start > max_velocity:
+        return 0
+    # A little slack so a max_velocity that is an exact step is not lost to rounding
+    return int(np.floor((max_velocity - start) / step + 1e-9)) + 1
+
+def plan_sweep(
+    step: float = 1.0,
+    start: float = 1.0,
+    vehicles: Optional[Sequence[str]] = None,
+    destinations: Optional[Sequence[str]] = None,
+    departure_date: Optional[datetime.date] = None,
+    chunk_rows: int = CHUNK_ROWS
+) -> Tuple[List[str], List[str], List[SweepChunk]]:
+    """
+    Split the vehicle x destination x velocity grid into chunks.
+
+    Rows are ordered by vehicle, then destination, then ascending velocity.
+    Distances are each body's distance_from_earth, or its ephemeris distance
+    on departure_date when one is given.
+
+    Returns:
+        (vehicle names, destination names, chunks in row order)
+    """
+    if step <= 0:
+        raise ValueError("Velocity step must be positive.")
+    if start <= 0:
+        raise ValueError("Starting velocity must be positive.")
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1.")
+
+    # Every lookup comes from one snapshot, so a concurrent vehicle update
+    # cannot change the grid halfway through
+    snapshot = current_snapshot()
+    vehicle_names = list(snapshot.transportation_vehicles) if vehicles is None else list(vehicles)
+    destination_names = list(snapshot.planetary_bodies) if destinations is None else list(destinations)
+    selected_vehicles = [snapshot.get_transportation_vehicle(name) for name in vehicle_names]
+    bodies = [snapshot.get_planetary_body(name) for name in destination_names]
+    if departure_date is None:
+        distances = [float(body.distance_from_earth) for body in bodies]
+    else:
+        distances = [distance_on(body.name, departure_date) for body in bodies]
+
+    chunks: List[SweepChunk] = []
+    offset = 0
+    for vehicle_code, vehicle in enumerate(selected_vehicles):
+        steps = velocity_steps(vehicle.max_velocity, step, start)
+        for destination_code, (body, distance) in enumerate(zip(bodies, distances)):
+            for first_step in range(0, steps, chunk_rows):
+                rows = min(chunk_rows, steps - first_step)
+                chunks.append(SweepChunk(
+                    vehicle_code, destination_code, vehicle.name, body.name, distance,
+                    vehicle.fuel_efficiency, vehicle.acceleration, start, step, first_step, rows, offset
+                ))
+                offset += rows
+    return [v.name for v in selected_vehicles], [b.name for b in bodies], chunks
+
+def compute_chunk(chunk: SweepChunk) -> Dict[str, np.ndarray]:
+    """The grid columns for one chunk, with the same math as calculate_journey"""
+    velocity = chunk.start + chunk.step * np.arange(chunk.first_step, chunk.first_step + chunk.rows, dtype=np.float64)
+    if chunk.acceleration is not None:
+        return _trajectory_chunk(chunk, velocity)
+    duration_hours = chunk.distance / velocity
+    return {
+        "vehicle": np.full(chunk.rows, chunk.vehicle_code, dtype=np.int32),
+        "destination": np.full(chunk.rows, chunk.destination_code, dtype=np.int32),
+        "velocity": velocity,
+        "distance": np.full(chunk.rows, chunk.distance),
+        "duration_hours": duration_hours,
+        "duration_days": duration_hours / HOURS_PER_DAY,
+        # Fuel and cost depend on distance only, but planners want them on every row
+        "fuel_units": np.full(chunk.rows, chunk.distance / chunk.fuel_efficiency),
+        "journey_cost": np.full(chunk.rows, (chunk.distance / 1000000) * COST_PER_MILLION_KM),
+    }
+
+def _trajectory_chunk(chunk: SweepChunk, velocity: np.ndarray) -> Dict[str, np.ndarray]:
+    """Grid columns for a vehicle with an acceleration limit, where fuel varies with velocity"""
+    distance = np.full(chunk.rows, chunk.distance)
+    phases = trajectory_columns(distance, velocity, chunk.acceleration)
+    duration_hours, fuel_units = phase_totals(phases, chunk.fuel_efficiency)
+    return {
+        "vehicle": np.full(chunk.rows, chunk.vehicle_code, dtype=np.int32),
+        "destination": np.full(chunk.rows, chunk.destination_code, dtype=np.int32),
+        "velocity": velocity,
+        "distance": distance,
+        "duration_hours": duration_hours,
+        "duration_days": duration_hours / HOURS_PER_DAY,
+        "fuel_units": fuel_units,
+        "journey_cost": np.full(chunk.rows, (chunk.distance / 1000000) * COST_PER_MILLION_KM),
+    }
+
+def _csv_field(value: str) -> str:
+    if any(c in value for c in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def format_csv_chunk(chunk: SweepChunk) -> bytes:
+    """One chunk as CSV rows (no header)"""
+    columns = compute_chunk(chunk)
+    if chunk.rows == 0:
+        return b""
+    # Name, distance and cost are constant within a chunk (and fuel too, at
+    # constant speed), so only the velocity-dependent fields are formatted per row
+    prefix = f"{_csv_field(chunk.vehicle)},{_csv_field(chunk.destination)},".replace("%", "%%")
+    distance = "%.10g," % chunk.distance
+    cost = "%.10g\n" % columns["journey_cost"][0]
+    if chunk.acceleration is None:
+        row_format = prefix + "%.10g," + distance + "%.10g,%.10g," + ("%.10g," % columns["fuel_units"][0]) + cost
+        rows = zip(columns["velocity"].tolist(), columns["duration_hours"].tolist(), columns["duration_days"].tolist())
+    else:
+        row_format = prefix + "%.10g," + distance + "%.10g,%.10g,%.10g," + cost
+        rows = zip(
+            columns["velocity"].tolist(), columns["duration_hours"].tolist(),
+            columns["duration_days"].tolist(), columns["fuel_units"].tolist()
+        )
+    return "".join([row_format % row for row in rows]).encode("utf-8")
+
+def _write_column_chunk(args: Tuple[str, SweepChunk]) -> int:
+    """Compute one chunk straight into the memory-mapped column files"""
+    directory, chunk = args
+    for name, values in compute_chunk(chunk).items():
+        column = np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r+")
+        column[chunk.offset:chunk.offset + chunk.rows] = values
+        column.flush()
+        del column
+    return chunk.rows
+
+def _ordered_results(
+    function: Callable[[Any], Any],
+    tasks: Sequence[Any],
+    max_workers: Optional[int]
+) -> Iterator[Any]:
+    """
+    Yield function(task) in task order, running tasks across worker processes
+    with only a few results per worker waiting at a time. max_workers=1 runs
+    everything in the calling process.
+    """
+    if max_workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield function(task)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        window = 2 * (max_workers or os.cpu_count() or 1)
+        pending: Deque = deque()
+        for task in tasks:
+            pending.append(executor.submit(function, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def run_sweep(
+    output: str,
+    output_format: str = "csv",
+    step: float = 1.0,
+    start: float = 1.0,
+    vehicles: Optional[Sequence[str]] = None,
+    destinations: Optional[Sequence[str]] = None,
+    departure_date: Optional[datetime.date] = None,
+    max_workers: Optional[int] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> SweepSummary:
+    """
+    Compute the vehicle x destination x velocity grid and stream it to disk.
+
+    Chunks are computed across worker processes and written in row order, so
+    memory stays bounded by a few chunks whatever the grid size. "csv" writes
+    one file (output "-" writes to stdout); "columns" writes a directory of
+    .npy column files that workers fill in place, read back with open_sweep().
+
+    Args:
+        output: CSV file path, or directory for the columnar format
+        output_format: "csv" or "columns"
+        step: Velocity increment in km/h
+        start: First velocity in km/h
+        vehicles: Vehicle names (defaults to the whole catalog)
+        destinations: Planetary body names (defaults to the whole catalog)
+        departure_date: Use ephemeris distances on this date
+        max_workers: Worker processes; 1 runs in the calling process
+        chunk_rows: Rows per work unit
+        progress: Called with (rows written, total rows) after each chunk
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output_format}'. Choose from {', '.join(OUTPUT_FORMATS)}.")
+    started = time.perf_counter()
+    vehicle_names, destination_names, chunks = plan_sweep(
+        step, start, vehicles, destinations, departure_date, chunk_rows
+    )
+    total = sum(chunk.rows for chunk in chunks)
+    written = 0
+    bytes_written = 0
+
+    if output_format == "csv":
+        to_stdout = output == "-"
+        stream = sys.stdout.buffer if to_stdout else open(output, "wb")
+        try:
+            header = CSV_HEADER.encode()
+            stream.write(header)
+            bytes_written += len(header)
+            for chunk, data in zip(chunks, _ordered_results(format_csv_chunk, chunks, max_workers)):
+                stream.write(data)
+                bytes_written += len(data)
+                written += chunk.rows
+                if progress is not None:
+                    progress(written, total)
+        finally:
+            if to_stdout:
+                stream.flush()
+            else:
+                stream.close()
+    else:
+        os.makedirs(output, exist_ok=True)
+        manifest_path = os.path.join(output, MANIFEST_FILE)
+        # Readers only trust a directory whose manifest exists, so remove any
+        # old one until the new columns are complete
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        for name, dtype in COLUMNS:
+            column = np.lib.format.open_memmap(os.path.join(output, f"{name}.npy"), mode="w+", dtype=dtype, shape=(total,))
+            del column
+        tasks = [(output, chunk) for chunk in chunks]
+        for rows in _ordered_results(_write_column_chunk, tasks, max_workers):
+            written += rows
+            if progress is not None:
+                progress(written, total)
+        manifest = {
+            "format_version": SWEEP_FORMAT_VERSION,
+            "rows": total,
+            "columns": {name: np.dtype(dtype).str for name, dtype in COLUMNS},
+            "vehicles": vehicle_names,
+            "destinations": destination_names,
+            "start": start,
+            "step": step,
+            "departure_date": departure_date.isoformat() if departure_date is not None else None,
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        temporary_path = f"{manifest_path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temporary_path, manifest_path)
+        bytes_written = sum(os.path.getsize(os.path.join(output, f"{name}.npy")) for name, _ in COLUMNS)
+
+    return SweepSummary(
+        path=output,
+        output_format=output_format,
+        rows=written,
+        chunks=len(chunks),
+        bytes_written=bytes_written,
+        seconds=time.perf_counter() - started,
+    )
+
+def open_sweep(directory: str) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Return (manifest, memory-mapped columns) of a columnar sweep"""
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise ValueError(f"No completed sweep found in '{directory}'.")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != SWEEP_FORMAT_VERSION:
+        raise ValueError(f"Unsupported sweep format version {manifest.get('format_version')}.")
+    columns = {
+        name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        for name in manifest["columns"]
+    }
+    return manifest, columns
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Export duration, fuel and cost for every vehicle x destination x velocity."
+    )
+    parser.add_argument("output", help="CSV file ('-' for stdout), or a directory with --format columns")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output format (default: csv)")
+    parser.add_argument("--step", type=float, default=1.0, help="Velocity step in km/h (default: 1)")
+    parser.add_argument("--start", type=float, default=1.0, help="First velocity in km/h (default: 1)")
+    parser.add_argument("--vehicle", action="append", help="Only this vehicle (repeatable)")
+    parser.add_argument("--destination", action="append", help="Only this destination (repeatable)")
+    parser.add_argument("--date", default=None, help="Use ephemeris distances on this date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows per work unit (default: 1,000,000)")
+    parser.add_argument("--quiet", action="store_true", help="No progress on stderr")
+    args = parser.parse_args(argv)
+
+    departure_date = datetime.datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else None
+    started = time.perf_counter()
+
+    def report(written: int, total: int) -> None:
+        elapsed = time.perf_counter() - started
+        print(f"\r{written:,}/{total:,} rows ({written / max(elapsed, 1e-9):,.0f} rows/s)", end="", file=sys.stderr)
+
+    try:
+        summary = run_sweep(
+            args.output, args.format, args.step, args.start, args.vehicle, args.destination,
+            departure_date, args.workers, args.chunk_rows, None if args.quiet else report
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(
+            f"\nWrote {summary.rows:,} rows in {summary.chunks} chunks "
+            f"({summary.bytes_written / 1048576:,.1f} MiB) to {summary.path} in {summary.seconds:.2f} s",
+            file=sys.stderr
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# Journey Quote Cache - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import time
+import datetime
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from space_data import PlanetaryBody, TransportationVehicle, add_vehicle_listener
+from space_journey import JourneyResult, calculate_journey
+
+# Vehicle fields a journey quote depends on: max_velocity decides whether the
+# velocity is allowed at all, fuel_efficiency decides the fuel estimate and
+# acceleration the duration and burn fuel of the trajectory model
+QUOTE_FIELDS = ("max_velocity", "fuel_efficiency", "acceleration")
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL = 300.0           # seconds
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0        # dropped to stay within max_entries
+    expirations: int = 0      # dropped because they outlived the TTL
+    invalidations: int = 0    # dropped because their vehicle changed
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class QuoteCache:
+    """
+    LRU cache of computed quotes with an optional time-to-live.
+
+    Every entry records the vehicle it was computed for, and entries for a
+    vehicle are dropped as soon as update_transportation_vehicle() changes
+    that vehicle's max_velocity, fuel_efficiency or acceleration. Keys hold
+    the (frozen) vehicle record itself, so a quote computed from one version
+    of a vehicle is never returned for another, even for a reader racing an
+    update.
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = DEFAULT_TTL):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, str, float]]" = OrderedDict()
+        self._keys_by_vehicle: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        _live_caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None (counted as a miss)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, vehicle_name: str, value: Any) -> None:
+        """Store value for key, tied to the vehicle it was computed for"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, vehicle_name, time.monotonic())
+            self._keys_by_vehicle.setdefault(vehicle_name, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def get_or_compute(self, key: Hashable, vehicle_name: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, vehicle_name, value)
+        return value
+
+    def quote(
+        self,
+        planet: PlanetaryBody,
+        vehicle: TransportationVehicle,
+        velocity: float,
+        travel_date: datetime.datetime,
+        distance: Optional[float] = None
+    ) -> JourneyResult:
+        """calculate_journey() with the result cached by its inputs"""
+        key = ("journey", planet.name, vehicle, velocity, travel_date, distance)
+        return self.get_or_compute(
+            key, vehicle.name,
+            lambda: calculate_journey(planet, vehicle, velocity, travel_date, distance)
+        )
+
+    def invalidate_vehicle(self, vehicle_name: str) -> int:
+        """Drop every entry computed for a vehicle and return how many were dropped"""
+        with self._lock:
+            keys = self._keys_by_vehicle.pop(vehicle_name, set())
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_vehicle.clear()
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit/miss/eviction counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        _, vehicle_name, _ = self._entries.pop(key)
+        keys = self._keys_by_vehicle.get(vehicle_name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_vehicle[vehicle_name]
+
+# One listener serves every cache; a weak set lets unused caches be collected
+_live_caches: "weakref.WeakSet[QuoteCache]" = weakref.WeakSet()
+
+def _on_vehicle_updated(vehicle: TransportationVehicle, changes: Dict[str, Tuple[Any, Any]]) -> None:
+    if any(field_name in changes for field_name in QUOTE_FIELDS):
+        for cache in list(_live_caches):
+            cache.invalidate_vehicle(vehicle.name)
+
+add_vehicle_listener(_on_vehicle_updated)
+
+_default_cache: Optional[QuoteCache] = None
+
+def get_quote_cache() -> QuoteCache:
+    """The process-wide quote cache used by the calculator, headless mode and server"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = QuoteCache()
+    return _default_cache
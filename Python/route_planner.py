@@ -0,0 +1,369 @@
+# Multi-Leg Route Planner - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import heapq
+import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from space_data import get_planetary_body, get_transportation_vehicle
+from space_journey import (
+    HOURS_PER_DAY,
+    COST_PER_MILLION_KM,
+    journey_duration_and_fuel,
+    validate_velocity
+)
+from space_trajectory import vehicle_columns
+from space_ephemeris import heliocentric_position, compute_distances, ORBITAL_ELEMENTS
+
+ORIGIN = "Earth"
+OBJECTIVES = ("duration", "fuel")
+
+# Held-Karp is exact but O(2^n * n^2); above this many stops use the heuristic
+HELD_KARP_MAX_STOPS = 12
+
+# Rows of the pairwise matrix computed per step, to bound temporary memory
+MATRIX_CHUNK_ROWS = 512
+
+def _geocentric_positions(names: Sequence[str], date: np.datetime64) -> np.ndarray:
+    """
+    Earth-centred position vectors in km on a date. Planets with orbital
+    elements get their real direction; bodies known only by distance (the
+    Moon and catalog bodies) are placed on the x axis at that distance.
+    """
+    positions = np.zeros((len(names), 3), dtype=np.float64)
+    earth = heliocentric_position("Earth", date)[0]
+    for i, name in enumerate(names):
+        if name == ORIGIN:
+            continue
+        if name in ORBITAL_ELEMENTS:
+            positions[i] = heliocentric_position(name, date)[0] - earth
+        elif name == "Moon":
+            positions[i, 0] = compute_distances("Moon", date)[0]
+        else:
+            positions[i, 0] = get_planetary_body(name).distance_from_earth
+    return positions
+
+class DistanceMatrix:
+    """
+    Pairwise body-to-body distances in km, with Earth as row/column 0.
+
+    Without a date each body sits at its fixed distance_from_earth along one
+    line, so the distance between two bodies is the difference of their
+    distances from Earth. With a date, planets are placed with the ephemeris.
+    """
+    def __init__(self, bodies: Sequence[str], date: Optional[np.datetime64] = None):
+        self.names: List[str] = [ORIGIN] + [name for name in dict.fromkeys(bodies) if name != ORIGIN]
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.date = date
+        self.matrix = self._build()
+
+    def _build(self) -> np.ndarray:
+        n = len(self.names)
+        matrix = np.empty((n, n), dtype=np.float64)
+        if self.date is None:
+            radial = np.array(
+                [0.0] + [get_planetary_body(name).distance_from_earth for name in self.names[1:]],
+                dtype=np.float64
+            )
+            for start in range(0, n, MATRIX_CHUNK_ROWS):
+                stop = min(start + MATRIX_CHUNK_ROWS, n)
+                matrix[start:stop] = np.abs(radial[start:stop, None] - radial[None, :])
+        else:
+            positions = _geocentric_positions(self.names, self.date)
+            for start in range(0, n, MATRIX_CHUNK_ROWS):
+                stop = min(start + MATRIX_CHUNK_ROWS, n)
+                delta = positions[start:stop, None, :] - positions[None, :, :]
+                matrix[start:stop] = np.sqrt(np.einsum("ijk,ijk->ij", delta, delta))
+        return matrix
+
+    def distance(self, origin: str, destination: str) -> float:
+        return float(self.matrix[self.index[origin], self.index[destination]])
+
+    def submatrix(self, names: Sequence[str]) -> np.ndarray:
+        """Distances among a subset of bodies, in the given order"""
+        rows = [self.index[name] for name in names]
+        return self.matrix[np.ix_(rows, rows)]
+
+# Recently built matrices, keyed by (body names, date)
+_matrix_cache: "OrderedDict[Tuple[Tuple[str, ...], Optional[str]], DistanceMatrix]" = OrderedDict()
+_matrix_cache_lock = threading.Lock()
+MATRIX_CACHE_SIZE = 8
+
+def get_distance_matrix(bodies: Sequence[str], date=None) -> DistanceMatrix:
+    """Return a cached distance matrix covering bodies (built on first use)"""
+    date = None if date is None else np.datetime64(date, "D")
+    key = (tuple(sorted(set(bodies) - {ORIGIN})), None if date is None else str(date))
+    with _matrix_cache_lock:
+        # Any cached matrix for the same date that already covers these bodies will do
+        for (names, cached_date), matrix in reversed(_matrix_cache.items()):
+            if cached_date == key[1] and set(key[0]).issubset(names):
+                _matrix_cache.move_to_end((names, cached_date))
+                return matrix
+    matrix = DistanceMatrix(key[0], date)
+    with _matrix_cache_lock:
+        _matrix_cache[key] = matrix
+        while len(_matrix_cache) > MATRIX_CACHE_SIZE:
+            _matrix_cache.popitem(last=False)
+    return matrix
+
+@dataclass
+class Leg:
+    origin: str
+    destination: str
+    vehicle: str
+    velocity: float               # km/h
+    distance: float               # kilometers
+    duration_hours: float
+    fuel_units: float
+    journey_cost: float
+    departure_date: datetime.datetime
+    arrival_date: datetime.datetime
+
+@dataclass
+class Itinerary:
+    legs: List[Leg] = field(default_factory=list)
+
+    @property
+    def total_distance(self) -> float:
+        return sum(leg.distance for leg in self.legs)
+
+    @property
+    def total_duration_hours(self) -> float:
+        return sum(leg.duration_hours for leg in self.legs)
+
+    @property
+    def total_duration_days(self) -> float:
+        return self.total_duration_hours / HOURS_PER_DAY
+
+    @property
+    def total_fuel_units(self) -> float:
+        return sum(leg.fuel_units for leg in self.legs)
+
+    @property
+    def total_cost(self) -> float:
+        return sum(leg.journey_cost for leg in self.legs)
+
+    @property
+    def arrival_date(self) -> Optional[datetime.datetime]:
+        return self.legs[-1].arrival_date if self.legs else None
+
+def plan_itinerary(
+    legs: Sequence[Tuple[str, str, float]],
+    departure_date: datetime.datetime,
+    origin: str = ORIGIN,
+    matrix: Optional[DistanceMatrix] = None
+) -> Itinerary:
+    """
+    Build an itinerary from (destination, vehicle, velocity) legs flown in order.
+
+    Each leg departs when the previous one arrives.
+    """
+    if matrix is None:
+        matrix = get_distance_matrix([origin] + [destination for destination, _, _ in legs])
+
+    itinerary = Itinerary()
+    current, current_date = origin, departure_date
+    for destination, vehicle_name, velocity in legs:
+        vehicle = get_transportation_vehicle(vehicle_name)
+        is_valid, velocity = validate_velocity(str(velocity), vehicle.max_velocity)
+        if not is_valid:
+            raise ValueError(
+                f"Velocity for the leg to {destination} must be positive and cannot exceed "
+                f"{vehicle.max_velocity:,.0f} km/h."
+            )
+        distance = matrix.distance(current, destination)
+        duration_hours, fuel_units = journey_duration_and_fuel(distance, velocity, vehicle)
+        arrival_date = current_date + datetime.timedelta(hours=duration_hours)
+        itinerary.legs.append(Leg(
+            origin=current,
+            destination=destination,
+            vehicle=vehicle.name,
+            velocity=velocity,
+            distance=distance,
+            duration_hours=duration_hours,
+            fuel_units=fuel_units,
+            journey_cost=(distance / 1000000) * COST_PER_MILLION_KM,
+            departure_date=current_date,
+            arrival_date=arrival_date,
+        ))
+        current, current_date = destination, arrival_date
+    return itinerary
+
+def _held_karp(cost: np.ndarray, return_to_start: bool) -> List[int]:
+    """Exact minimum-cost order visiting nodes 1..n-1 starting from node 0"""
+    n = len(cost)
+    stops = n - 1
+    full = (1 << stops) - 1
+    # best[mask, j]: cheapest path from 0 through the stops in mask, ending at stop j
+    best = np.full((1 << stops, stops), np.inf)
+    parent = np.full((1 << stops, stops), -1, dtype=np.int64)
+    for j in range(stops):
+        best[1 << j, j] = cost[0, j + 1]
+
+    stop_cost = cost[1:, 1:]
+    for mask in range(1, full + 1):
+        row = best[mask]
+        if not np.isfinite(row).any():
+            continue
+        # Extend every path ending in mask to every stop not yet in mask
+        candidates = row[:, None] + stop_cost
+        for k in range(stops):
+            if mask & (1 << k):
+                continue
+            j = int(np.argmin(candidates[:, k]))
+            value = candidates[j, k]
+            next_mask = mask | (1 << k)
+            if value < best[next_mask, k]:
+                best[next_mask, k] = value
+                parent[next_mask, k] = j
+
+    final = best[full] + (cost[1:, 0] if return_to_start else 0.0)
+    last = int(np.argmin(final))
+    order, mask = [], full
+    while last != -1:
+        order.append(last + 1)
+        previous = int(parent[mask, last])
+        mask &= ~(1 << last)
+        last = previous
+    return order[::-1]
+
+def _nearest_neighbour(cost: np.ndarray) -> List[int]:
+    n = len(cost)
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    order, current = [], 0
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, cost[current])
+        current = int(np.argmin(row))
+        visited[current] = True
+        order.append(current)
+    return order
+
+def _two_opt(cost: np.ndarray, order: List[int], return_to_start: bool, max_passes: int = 20) -> List[int]:
+    """Improve a route by reversing segments while that lowers the total cost"""
+    route = np.array([0] + order + ([0] if return_to_start else []), dtype=np.int64)
+    last = len(route) - 1 if return_to_start else len(route)
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, last - 1):
+            a, b = route[i - 1], route[i]
+            ends = np.arange(i + 1, last)
+            c = route[ends]
+            # Cost of the edge after each candidate segment end (none past the last stop)
+            after = route[np.minimum(ends + 1, len(route) - 1)]
+            has_after = ends + 1 < len(route)
+            old = cost[a, b] + np.where(has_after, cost[c, after], 0.0)
+            new = cost[a, c] + np.where(has_after, cost[b, after], 0.0)
+            gain = old - new
+            best = int(np.argmax(gain))
+            if gain[best] > 1e-9:
+                j = int(ends[best])
+                route[i:j + 1] = route[i:j + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    stops = route[1:-1] if return_to_start else route[1:]
+    return [int(stop) for stop in stops]
+
+def optimize_route(
+    bodies: Sequence[str],
+    vehicle: str,
+    velocity: float,
+    objective: str = "duration",
+    origin: str = ORIGIN,
+    return_to_start: bool = False,
+    departure_date: Optional[datetime.datetime] = None,
+    matrix: Optional[DistanceMatrix] = None
+) -> Itinerary:
+    """
+    Find the visiting order of bodies with the lowest total duration or fuel.
+
+    Uses Held-Karp dynamic programming for up to HELD_KARP_MAX_STOPS stops and
+    nearest-neighbour plus 2-opt improvement for larger sets.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Choose from {', '.join(OBJECTIVES)}.")
+    selected_vehicle = get_transportation_vehicle(vehicle)
+    is_valid, velocity = validate_velocity(str(velocity), selected_vehicle.max_velocity)
+    if not is_valid:
+        raise ValueError(
+            f"Velocity must be positive and cannot exceed {selected_vehicle.max_velocity:,.0f} km/h."
+        )
+    stops = [name for name in dict.fromkeys(bodies) if name != origin]
+    if matrix is None:
+        matrix = get_distance_matrix([origin] + stops)
+
+    # Legs of vehicles with an acceleration limit follow its trajectory profile,
+    # so duration and fuel are not proportional to distance
+    duration_hours, fuel_units = vehicle_columns(matrix.submatrix([origin] + stops), velocity, selected_vehicle)
+    cost = duration_hours if objective == "duration" else fuel_units
+
+    if len(stops) <= 1:
+        order = list(range(1, len(stops) + 1))
+    elif len(stops) <= HELD_KARP_MAX_STOPS:
+        order = _held_karp(cost, return_to_start)
+    else:
+        order = _two_opt(cost, _nearest_neighbour(cost), return_to_start)
+
+    visit = [stops[i - 1] for i in order] + ([origin] if return_to_start else [])
+    return plan_itinerary(
+        [(name, vehicle, velocity) for name in visit],
+        departure_date or datetime.datetime.now(),
+        origin,
+        matrix
+    )
+
+def shortest_path(
+    origin: str,
+    destination: str,
+    max_leg_distance: float,
+    bodies: Optional[Sequence[str]] = None,
+    matrix: Optional[DistanceMatrix] = None
+) -> Tuple[List[str], float]:
+    """
+    Dijkstra over bodies where a single leg may not exceed max_leg_distance km
+    (e.g. a vehicle's range between refuelling stops).
+
+    Returns:
+        (path of body names from origin to destination, total distance in km)
+    """
+    if matrix is None:
+        matrix = get_distance_matrix(list(bodies or []) + [origin, destination])
+    start, goal = matrix.index[origin], matrix.index[destination]
+    distances = matrix.matrix
+    best = np.full(len(distances), np.inf)
+    previous = np.full(len(distances), -1, dtype=np.int64)
+    done = np.zeros(len(distances), dtype=bool)
+    best[start] = 0.0
+    heap = [(0.0, start)]
+
+    while heap:
+        so_far, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = True
+        if node == goal:
+            break
+        # Relax every reachable neighbour at once
+        reach = so_far + distances[node]
+        better = (distances[node] <= max_leg_distance) & ~done & (reach < best)
+        for neighbour in np.flatnonzero(better):
+            best[neighbour] = reach[neighbour]
+            previous[neighbour] = node
+            heapq.heappush(heap, (float(reach[neighbour]), int(neighbour)))
+
+    if not np.isfinite(best[goal]):
+        raise ValueError(
+            f"No route from {origin} to {destination} with legs of at most {max_leg_distance:,.0f} km."
+        )
+    path, node = [], goal
+    while node != -1:
+        path.append(matrix.names[node])
+        node = int(previous[node])
+    return path[::-1], float(best[goal])
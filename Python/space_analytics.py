@@ -0,0 +1,578 @@
+#!/usr/bin/env python
+# Space Journey Analytics - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import re
+import sys
+import glob
+import gzip
+import json
+import time
+import hashlib
+import argparse
+import datetime
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from journey_journal import list_segments
+from space_logger import LogLevel
+from space_logquery import parse_line
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CHECKPOINT = "analytics_checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+# Work is handed to worker processes in chunks of about this many bytes:
+# large files are split into line-aligned ranges, small files are bundled
+CHUNK_BYTES = 16 * 1024 * 1024
+FILES_PER_CHUNK = 512
+
+# Velocity histogram bin width (km/h)
+VELOCITY_BIN = 10000
+
+# Files that only ever grow (logs, journal segments) are recognized again
+# after rotation, renaming or gzip by a hash of their first bytes
+FINGERPRINT_BYTES = 512
+
+# Source kinds
+LOG, JOURNAL, DETAILS = "log", "journal", "details"
+
+@dataclass
+class JourneyAnalytics:
+    """Mergeable totals over journey records, journey detail files and logs"""
+    # Journeys (journal records and JourneyDetails_*.txt reports)
+    journeys: int = 0
+    destinations: Counter = field(default_factory=Counter)
+    vehicles: Counter = field(default_factory=Counter)
+    countries: Counter = field(default_factory=Counter)
+    journeys_by_day: Counter = field(default_factory=Counter)
+    velocity_bins: Counter = field(default_factory=Counter)     # bin start (km/h) -> journeys
+    velocity_sum: float = 0.0
+    velocity_min: Optional[float] = None
+    velocity_max: Optional[float] = None
+    cost_sum: float = 0.0
+    fuel_sum: float = 0.0
+    duration_days_sum: float = 0.0
+    # Calculator log
+    log_lines: int = 0
+    log_levels: Counter = field(default_factory=Counter)
+    sessions: int = 0
+    calculations: int = 0
+    calculation_errors: int = 0
+    invalid_inputs: int = 0
+    errors_by_day: Counter = field(default_factory=Counter)
+
+    def add_journey(
+        self,
+        day: str,
+        destination: str,
+        vehicle: str,
+        country: str,
+        velocity: float,
+        cost: float,
+        fuel: float,
+        duration_days: float
+    ) -> None:
+        self.journeys += 1
+        self.destinations[destination] += 1
+        self.vehicles[vehicle] += 1
+        self.countries[country] += 1
+        self.journeys_by_day[day] += 1
+        self.velocity_bins[int(velocity // VELOCITY_BIN) * VELOCITY_BIN] += 1
+        self.velocity_sum += velocity
+        self.velocity_min = velocity if self.velocity_min is None else min(self.velocity_min, velocity)
+        self.velocity_max = velocity if self.velocity_max is None else max(self.velocity_max, velocity)
+        self.cost_sum += cost
+        self.fuel_sum += fuel
+        self.duration_days_sum += duration_days
+
+    def merge(self, other: "JourneyAnalytics") -> "JourneyAnalytics":
+        """Add other's totals into this one and return self"""
+        for f in fields(self):
+            mine, theirs = getattr(self, f.name), getattr(other, f.name)
+            if isinstance(mine, Counter):
+                mine.update(theirs)
+            elif f.name == "velocity_min":
+                setattr(self, f.name, theirs if mine is None else mine if theirs is None else min(mine, theirs))
+            elif f.name == "velocity_max":
+                setattr(self, f.name, theirs if mine is None else mine if theirs is None else max(mine, theirs))
+            else:
+                setattr(self, f.name, mine + theirs)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            f.name: dict(getattr(self, f.name)) if isinstance(getattr(self, f.name), Counter) else getattr(self, f.name)
+            for f in fields(self)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JourneyAnalytics":
+        values: Dict[str, Any] = {}
+        for f in fields(cls):
+            if f.name not in data:
+                continue
+            value = data[f.name]
+            if f.name == "velocity_bins":
+                value = Counter({int(float(key)): count for key, count in value.items()})
+            elif isinstance(value, dict):
+                value = Counter(value)
+            values[f.name] = value
+        return cls(**values)
+
+    def summary(self) -> Dict[str, Any]:
+        """Derived figures for the report"""
+        attempts = self.calculations + self.calculation_errors
+        return {
+            "journeys": self.journeys,
+            "average_cost": self.cost_sum / self.journeys if self.journeys else None,
+            "average_fuel": self.fuel_sum / self.journeys if self.journeys else None,
+            "average_duration_days": self.duration_days_sum / self.journeys if self.journeys else None,
+            "average_velocity": self.velocity_sum / self.journeys if self.journeys else None,
+            "velocity_min": self.velocity_min,
+            "velocity_max": self.velocity_max,
+            "calculation_error_rate": self.calculation_errors / attempts if attempts else None,
+            "log_error_rate": (
+                (self.log_levels["ERROR"] + self.log_levels["CRITICAL"]) / self.log_lines if self.log_lines else None
+            ),
+        }
+
+# ===== Parsing =====
+
+_LEVEL_NAMES = {level.name.encode(): level.name for level in LogLevel}
+
+def _add_log_line(totals: JourneyAnalytics, line: bytes) -> None:
+    # Text lines are sliced at their fixed offsets:
+    # [2026-10-18 15:30:00] [INFO    ] message
+    if line[20:23] == b"] [" and line[31:33] == b"] " and line.startswith(b"["):
+        level = _LEVEL_NAMES.get(line[23:31].rstrip())
+        day = line[1:11].decode()
+        message = line[33:]
+    else:
+        entry = parse_line(line)
+        if entry is None:
+            return
+        level, day, message = entry.level, entry.time[:10], entry.message.encode()
+    if level is None:
+        return
+    totals.log_lines += 1
+    totals.log_levels[level] += 1
+    if level == "ERROR" or level == "CRITICAL":
+        totals.errors_by_day[day] += 1
+    if message.startswith(b"Journey calculations completed"):
+        totals.calculations += 1
+    elif message.startswith(b"Error in journey calculations"):
+        totals.calculation_errors += 1
+    elif message.startswith(b"Invalid input:"):
+        totals.invalid_inputs += 1
+    elif message == b"Space Journey Calculator started":
+        totals.sessions += 1
+
+def _add_journal_line(totals: JourneyAnalytics, line: bytes) -> None:
+    try:
+        record = json.loads(line)
+        totals.add_journey(
+            str(record.get("recorded_at", ""))[:10],
+            record["destination"],
+            record["vehicle"],
+            record.get("country", ""),
+            float(record["velocity"]),
+            float(record.get("journey_cost", 0.0)),
+            float(record.get("fuel_units", 0.0)),
+            float(record.get("duration_days", 0.0)),
+        )
+    except (ValueError, KeyError, TypeError):
+        pass
+
+_DETAILS_FIELDS = {
+    "country": re.compile(r"^Country: (.*)$", re.MULTILINE),
+    "vehicle": re.compile(r"^Vehicle: (.*)$", re.MULTILINE),
+    "velocity": re.compile(r"^Selected Velocity: ([\d,.]+) km/h", re.MULTILINE),
+    "destination": re.compile(r"^Destination: (.*)$", re.MULTILINE),
+    "duration_days": re.compile(r"^\s+([\d.]+) days$", re.MULTILINE),
+    "fuel": re.compile(r"^- Fuel Required: ([\d,.]+) units", re.MULTILINE),
+    "cost": re.compile(r"^- Estimated Cost: \$([\d,.]+)", re.MULTILINE),
+}
+_DETAILS_STAMP = re.compile(r"_(\d{8})_\d{6}\.txt$")
+
+def _number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+def _add_details_file(totals: JourneyAnalytics, path: str) -> None:
+    """Parse one JourneyDetails_<traveler>_<YYYYmmdd_HHMMSS>.txt report"""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+    except OSError:
+        return
+    values = {}
+    for name, pattern in _DETAILS_FIELDS.items():
+        match = pattern.search(text)
+        if match is None:
+            return
+        values[name] = match.group(1).strip()
+    stamp = _DETAILS_STAMP.search(path)
+    if stamp:
+        day = datetime.datetime.strptime(stamp.group(1), "%Y%m%d").strftime("%Y-%m-%d")
+    else:
+        day = datetime.date.fromtimestamp(os.path.getmtime(path)).isoformat()
+    totals.add_journey(
+        day, values["destination"], values["vehicle"], values["country"],
+        _number(values["velocity"]), _number(values["cost"]), _number(values["fuel"]),
+        _number(values["duration_days"]),
+    )
+
+# ===== Work units =====
+
+# (kind, path, start, end, aligned): lines starting in [start, end) of the
+# uncompressed file. Unless aligned, the partial line at start belongs to the
+# previous range and is skipped. end is -1 for "to the end" (gzip files).
+Task = Tuple[str, str, int, int, bool]
+
+# Files are read in blocks and split into lines, rather than line by line
+READ_BLOCK = 1024 * 1024
+
+def _block_lines(f: BinaryIO, limit: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Complete lines from the current position of f, without newlines.
+    With limit, stops after the last line that starts within limit bytes.
+    A torn last line (no newline yet) is left for the next run.
+    """
+    remainder = b""
+    consumed = 0
+    while True:
+        block = f.read(READ_BLOCK)
+        if not block:
+            return
+        lines = (remainder + block).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            if limit is not None and consumed >= limit:
+                return
+            consumed += len(line) + 1
+            yield line.rstrip(b"\r")
+
+def _range_lines(path: str, start: int, end: int, aligned: bool) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        if aligned:
+            f.seek(start)
+            position = start
+        else:
+            f.seek(start - 1)
+            position = start - 1 + len(f.readline())
+        yield from _block_lines(f, end - position)
+
+def _gzip_lines(path: str, skip: int) -> Iterator[bytes]:
+    with gzip.open(path, "rb") as f:
+        if skip:
+            f.seek(skip)
+        yield from _block_lines(f)
+
+def analyze_tasks(tasks: List[Task]) -> JourneyAnalytics:
+    """Totals for one chunk of work; runs in a worker process"""
+    totals = JourneyAnalytics()
+    for kind, path, start, end, aligned in tasks:
+        if kind == DETAILS:
+            _add_details_file(totals, path)
+            continue
+        add_line = _add_log_line if kind == LOG else _add_journal_line
+        lines = _gzip_lines(path, start) if path.endswith(".gz") else _range_lines(path, start, end, aligned)
+        try:
+            for line in lines:
+                add_line(totals, line)
+        except (OSError, EOFError):
+            # Removed by retention, or a gzip still being written: picked up next run
+            continue
+    return totals
+
+def _chunk_tasks(tasks: List[Tuple[Task, int]]) -> List[List[Task]]:
+    """Split large ranges and bundle small ones into chunks of about CHUNK_BYTES"""
+    chunks: List[List[Task]] = []
+    bundle: List[Task] = []
+    bundle_bytes = 0
+    for (kind, path, start, end, aligned), size in tasks:
+        if size > CHUNK_BYTES and end >= 0:
+            for piece_start in range(start, end, CHUNK_BYTES):
+                piece_end = min(piece_start + CHUNK_BYTES, end)
+                chunks.append([(kind, path, piece_start, piece_end, aligned and piece_start == start)])
+            continue
+        bundle.append((kind, path, start, end, aligned))
+        bundle_bytes += size
+        if bundle_bytes >= CHUNK_BYTES or len(bundle) >= FILES_PER_CHUNK:
+            chunks.append(bundle)
+            bundle, bundle_bytes = [], 0
+    if bundle:
+        chunks.append(bundle)
+    return chunks
+
+# ===== Discovery and checkpoints =====
+
+def discover_sources(directory: str) -> List[Tuple[str, str]]:
+    """(kind, path) for every calculator log, journal segment and journey details file"""
+    sources: List[Tuple[str, str]] = []
+    for path in sorted(glob.glob(os.path.join(directory, "SpaceTravel_Log*"))):
+        if path.endswith((".txt", ".jsonl", ".gz")):
+            sources.append((LOG, path))
+    for path in list_segments(os.path.join(directory, "journeys")):
+        sources.append((JOURNAL, path))
+    for path in sorted(glob.glob(os.path.join(directory, "JourneyDetails_*.txt"))):
+        sources.append((DETAILS, path))
+    return sources
+
+def _read_prefix(path: str, length: int) -> bytes:
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rb") as f:
+            return f.read(length)
+    except (OSError, EOFError):
+        return b""
+
+def _fingerprint(prefix: bytes) -> str:
+    return hashlib.blake2b(prefix, digest_size=16).hexdigest()
+
+def _complete_end(path: str, size: int) -> int:
+    """Offset just past the last complete line of a plain file"""
+    with open(path, "rb") as f:
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            block = f.read(end - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return 0
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Previously processed files and the totals so far (empty if there is no usable checkpoint)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        checkpoint = {}
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        return {"version": CHECKPOINT_VERSION, "files": {}, "totals": JourneyAnalytics().to_dict()}
+    return checkpoint
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write the checkpoint atomically"""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(temporary, path)
+
+def plan_work(
+    sources: List[Tuple[str, str]],
+    previous: Dict[str, Dict[str, Any]]
+) -> Tuple[List[Tuple[Task, int]], Dict[str, Dict[str, Any]]]:
+    """
+    Decide what still has to be read and build the next checkpoint entries.
+
+    Unchanged files (same mtime and size) are skipped. A log or journal
+    segment resumes from the offset recorded for it, or for the file it
+    was before being rotated, renamed or gzipped (matched by fingerprint).
+    Journey details files are written once per journey, so they are read
+    whole the first time they are seen and never again: reading a changed
+    one again would count its journey twice.
+    """
+    by_fingerprint: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
+    for entry in previous.values():
+        if "fingerprint" in entry:
+            by_fingerprint[(entry["kind"], entry["fingerprint_bytes"], entry["fingerprint"])] = entry
+    prefix_lengths = sorted({key[1] for key in by_fingerprint}, reverse=True)
+
+    tasks: List[Tuple[Task, int]] = []
+    files: Dict[str, Dict[str, Any]] = {}
+    for kind, path in sources:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entry = {"kind": kind, "mtime": stat.st_mtime, "size": stat.st_size}
+        old = previous.get(path)
+        if old is not None and (
+            kind == DETAILS or (old["mtime"] == stat.st_mtime and old["size"] == stat.st_size)
+        ):
+            files[path] = old
+            continue
+
+        if kind == DETAILS:
+            files[path] = entry
+            tasks.append(((kind, path, 0, stat.st_size, True), stat.st_size))
+            continue
+
+        prefix = _read_prefix(path, FINGERPRINT_BYTES)
+        entry["fingerprint_bytes"] = len(prefix)
+        entry["fingerprint"] = _fingerprint(prefix)
+        start = 0
+        for length in prefix_lengths:
+            if length <= len(prefix):
+                match = by_fingerprint.get((kind, length, _fingerprint(prefix[:length])))
+                if match is not None:
+                    start = match["offset"]
+                    break
+
+        if path.endswith(".gz"):
+            # Closed segments: everything is read; the offset is only
+            # needed if the same content shows up again
+            entry["offset"] = max(start, _gzip_length(path))
+            if entry["offset"] > start:
+                tasks.append(((kind, path, start, -1, True), stat.st_size))
+        else:
+            end = _complete_end(path, stat.st_size)
+            if start > end:
+                start = 0               # truncated or replaced: read it again
+            entry["offset"] = end
+            if end > start:
+                tasks.append(((kind, path, start, end, True), end - start))
+        files[path] = entry
+    return tasks, files
+
+def _gzip_length(path: str) -> int:
+    # Uncompressed size from the gzip trailer (modulo 4 GiB)
+    try:
+        with open(path, "rb") as f:
+            f.seek(-4, os.SEEK_END)
+            return int.from_bytes(f.read(4), "little")
+    except OSError:
+        return 0
+
+def run_analytics(
+    directory: str = _SCRIPT_DIR,
+    checkpoint_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    full: bool = False
+) -> Tuple[JourneyAnalytics, Dict[str, Any]]:
+    """
+    Bring the totals up to date and return them with run statistics.
+
+    With a checkpoint, only data added since the last run is read and the
+    totals are stored back. full=True starts over from nothing.
+    max_workers=1 runs everything in the calling process.
+    """
+    started = time.perf_counter()
+    if checkpoint_path and not full:
+        checkpoint = load_checkpoint(checkpoint_path)
+    else:
+        checkpoint = {"files": {}, "totals": {}}
+    totals = JourneyAnalytics.from_dict(checkpoint["totals"])
+
+    sources = discover_sources(directory)
+    tasks, files = plan_work(sources, checkpoint["files"])
+    chunks = _chunk_tasks(tasks)
+    if max_workers == 1 or len(chunks) <= 1:
+        partials = [analyze_tasks(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            partials = list(executor.map(analyze_tasks, chunks))
+    for partial in partials:
+        totals.merge(partial)
+
+    if checkpoint_path:
+        save_checkpoint(checkpoint_path, {
+            "version": CHECKPOINT_VERSION,
+            "updated": datetime.datetime.now().isoformat(timespec="seconds"),
+            "files": files,
+            "totals": totals.to_dict(),
+        })
+    run = {
+        "files_found": len(sources),
+        "files_read": len({task[1] for task, _ in tasks}),
+        "bytes_read": sum(size for _, size in tasks),
+        "chunks": len(chunks),
+        "seconds": time.perf_counter() - started,
+    }
+    return totals, run
+
+# ===== Report =====
+
+def format_report(totals: JourneyAnalytics, run: Optional[Dict[str, Any]] = None, top: int = 10) -> str:
+    """Plain-text summary of the totals"""
+    summary = totals.summary()
+    money = lambda value: f"${value:,.2f}" if value is not None else "n/a"
+    number = lambda value, unit="": f"{value:,.2f}{unit}" if value is not None else "n/a"
+    percent = lambda value: f"{value:.2%}" if value is not None else "n/a"
+
+    lines = ["===== SPACE TRAVEL ANALYTICS ====="]
+    if run:
+        lines.append(
+            f"Files: {run['files_found']:,} found, {run['files_read']:,} read "
+            f"({run['bytes_read'] / 1e6:,.1f} MB in {run['chunks']} chunks, {run['seconds']:.2f} s)"
+        )
+    lines += [
+        "",
+        f"Journeys: {totals.journeys:,}",
+        f"Average cost: {money(summary['average_cost'])}",
+        f"Average fuel: {number(summary['average_fuel'], ' units')}",
+        f"Average duration: {number(summary['average_duration_days'], ' days')}",
+        f"Velocity: {number(summary['velocity_min'])} - {number(summary['velocity_max'])} km/h "
+        f"(mean {number(summary['average_velocity'])})",
+    ]
+
+    def ranking(title: str, counts: Counter) -> None:
+        lines.extend(["", f"{title}:"])
+        if not counts:
+            lines.append("  (none)")
+        for name, count in counts.most_common(top):
+            lines.append(f"  {name:<28}{count:>10,}  {count / totals.journeys:>7.1%}")
+
+    ranking("Popular destinations", totals.destinations)
+    ranking("Vehicle mix", totals.vehicles)
+    ranking("Countries", totals.countries)
+
+    lines.extend(["", f"Velocity distribution ({VELOCITY_BIN:,} km/h bins):"])
+    for bin_start in sorted(totals.velocity_bins):
+        count = totals.velocity_bins[bin_start]
+        bar = "#" * max(1, round(40 * count / max(totals.velocity_bins.values())))
+        lines.append(f"  {bin_start:>9,}-{bin_start + VELOCITY_BIN - 1:<9,}{count:>10,}  {bar}")
+
+    lines += [
+        "",
+        f"Log lines: {totals.log_lines:,}  "
+        + "  ".join(f"{level}={count:,}" for level, count in sorted(totals.log_levels.items())),
+        f"Sessions: {totals.sessions:,}   Invalid inputs: {totals.invalid_inputs:,}",
+        f"Calculations: {totals.calculations:,}   Errors: {totals.calculation_errors:,}   "
+        f"Error rate: {percent(summary['calculation_error_rate'])}",
+        f"ERROR/CRITICAL share of log lines: {percent(summary['log_error_rate'])}",
+    ]
+
+    days = sorted(set(totals.journeys_by_day) | set(totals.errors_by_day))
+    if days:
+        lines.extend(["", "Daily:", f"  {'Day':<12}{'Journeys':>10}{'Errors':>10}"])
+        for day in days[-top:]:
+            lines.append(f"  {day or '?':<12}{totals.journeys_by_day[day]:>10,}{totals.errors_by_day[day]:>10,}")
+    lines.append("==================================")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Summarize calculator logs, journey journals and journey detail files."
+    )
+    parser.add_argument("--dir", default=_SCRIPT_DIR, help="Directory holding the logs (default: this script's)")
+    parser.add_argument(
+        "--checkpoint", default=None,
+        help=f"Checkpoint file for incremental runs (default: {DEFAULT_CHECKPOINT} in --dir)"
+    )
+    parser.add_argument("--no-checkpoint", action="store_true", help="Read everything and keep no checkpoint")
+    parser.add_argument("--full", action="store_true", help="Ignore the checkpoint and rebuild it from scratch")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--output", help="Also write the totals and summary as JSON to this file")
+    parser.add_argument("--top", type=int, default=10, help="Entries per ranking (default: 10)")
+    args = parser.parse_args(argv)
+
+    checkpoint_path = None if args.no_checkpoint else (args.checkpoint or os.path.join(args.dir, DEFAULT_CHECKPOINT))
+    totals, run = run_analytics(args.dir, checkpoint_path, args.workers, args.full)
+    print(format_report(totals, run, args.top))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summary": totals.summary(), "totals": totals.to_dict(), "run": run}, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
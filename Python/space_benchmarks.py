@@ -0,0 +1,390 @@
+#!/usr/bin/env python
+# Space Travel Benchmark Suite - Python Version
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import io
+import sys
+import atexit
+import json
+import time
+import shutil
+import platform
+import datetime
+import tempfile
+import statistics
+import subprocess
+import contextlib
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_MAX_SLOWDOWN = 0.10       # fail the gate on more than 10% slower
+SAMPLE_SECONDS = 0.1              # target duration of one timed sample
+SAMPLES = 7
+IMPORT_SAMPLES = 5
+# Headless requests are validated against this date rather than the clock,
+# so their years stay bookable and the workload stays the same year to year
+BENCHMARK_TODAY = datetime.datetime(2026, 10, 18)
+
+# Modules timed for cold import, each in a fresh interpreter
+IMPORT_MODULES = [
+    "space_data",
+    "space_logger",
+    "space_journey",
+    "space_batch",
+    "space_catalog",
+    "space_headless",
+    "quote_cache",
+    "space_metrics",
+    "EnhancedSpaceJourneyCalculator",
+]
+
+# name -> setup(); setup returns (run, ops) where one run() call performs ops operations
+Setup = Callable[[], Tuple[Callable[[], Any], int]]
+BENCHMARKS: Dict[str, Setup] = {}
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function under a dotted name"""
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+# ===== QUOTES =====
+def _journey_inputs() -> tuple:
+    from space_data import get_planetary_body, get_transportation_vehicle
+    return (
+        get_planetary_body("Mars"),
+        get_transportation_vehicle("Interplanetary Cruiser"),
+        60000.0,
+        datetime.datetime(2030, 6, 1),
+    )
+
+@benchmark("quote.scalar")
+def _quote_scalar():
+    from space_journey import calculate_journey
+    planet, vehicle, velocity, travel_date = _journey_inputs()
+    return (lambda: calculate_journey(planet, vehicle, velocity, travel_date)), 1
+
+@benchmark("quote.cached")
+def _quote_cached():
+    from quote_cache import QuoteCache
+    cache = QuoteCache()
+    planet, vehicle, velocity, travel_date = _journey_inputs()
+    cache.quote(planet, vehicle, velocity, travel_date)
+    return (lambda: cache.quote(planet, vehicle, velocity, travel_date)), 1
+
+def _batch_inputs(rows: int) -> tuple:
+    import numpy as np
+    from space_data import get_all_planetary_bodies, get_all_transportation_vehicles
+    rng = np.random.default_rng(42)
+    planet_codes = rng.integers(0, len(get_all_planetary_bodies()), rows)
+    vehicle_codes = rng.integers(0, len(get_all_transportation_vehicles()), rows)
+    velocities = rng.uniform(1000, 28000, rows)
+    departures = np.datetime64("2030-01-01") + rng.integers(0, 365 * 30, rows).astype("timedelta64[D]")
+    return planet_codes, vehicle_codes, velocities, departures
+
+@benchmark("quote.batch_codes")
+def _quote_batch_codes():
+    from space_batch import calculate_journeys
+    rows = 100000
+    inputs = _batch_inputs(rows)
+    return (lambda: calculate_journeys(*inputs)), rows
+
+@benchmark("quote.batch_names")
+def _quote_batch_names():
+    import numpy as np
+    from space_batch import calculate_journeys
+    from space_data import get_all_planetary_bodies, get_all_transportation_vehicles
+    rows = 100000
+    planet_codes, vehicle_codes, velocities, departures = _batch_inputs(rows)
+    planets = np.array(list(get_all_planetary_bodies()))[planet_codes]
+    vehicles = np.array(list(get_all_transportation_vehicles()))[vehicle_codes]
+    return (lambda: calculate_journeys(planets, vehicles, velocities, departures)), rows
+
+@benchmark("quote.headless")
+def _quote_headless():
+    from quote_cache import QuoteCache
+    from space_headless import quote_requests
+    requests = [
+        {"name": f"Traveler {i}", "country": "United States", "year": BENCHMARK_TODAY.year + 4 + i % 20,
+         "vehicle": 1 + i % 4, "velocity": 10000 + i % 97, "destination": 1 + i % 4}
+        for i in range(1000)
+    ]
+    # A fresh cache per run so every request is computed
+    return (lambda: list(quote_requests(requests, today=BENCHMARK_TODAY, cache=QuoteCache()))), len(requests)
+
+# ===== LOGGING =====
+def _temp_logger(**options):
+    from space_logger import SpaceLogger
+    directory = tempfile.mkdtemp(prefix="space_bench_")
+    # Registered before the logger's writer, so it runs after the writer closes
+    atexit.register(shutil.rmtree, directory, True)
+    logger = SpaceLogger(log_file=os.path.join(directory, "bench_log.txt"), **options)
+    return logger, directory
+
+LOG_LINES = 1000
+
+@benchmark("logger.filtered")
+def _logger_filtered():
+    from space_logger import SpaceLogger, LogLevel
+    logger = SpaceLogger(log_to_console=False, min_level=LogLevel.WARNING)
+
+    def run():
+        for i in range(LOG_LINES):
+            logger.log("Journey cost: $%.2f", LogLevel.INFO, i * 1.5)
+    return run, LOG_LINES
+
+@benchmark("logger.console")
+def _logger_console():
+    from space_logger import SpaceLogger, LogLevel
+    logger = SpaceLogger(log_to_console=True)
+    sink = io.StringIO()
+
+    def run():
+        sink.seek(0)
+        sink.truncate()
+        with contextlib.redirect_stdout(sink):
+            for i in range(LOG_LINES):
+                logger.log("Journey cost: $%.2f", LogLevel.INFO, i * 1.5)
+    return run, LOG_LINES
+
+@benchmark("logger.file_background")
+def _logger_file_background():
+    from space_logger import LogLevel
+    logger, _ = _temp_logger(log_to_file=True, log_to_console=False, background=True)
+
+    def run():
+        for i in range(LOG_LINES):
+            logger.log("Journey cost: $%.2f", LogLevel.INFO, i * 1.5)
+        # Count the writer thread's work, not just queueing
+        logger.flush()
+    return run, LOG_LINES
+
+@benchmark("logger.file_direct")
+def _logger_file_direct():
+    from space_logger import LogLevel
+    logger, _ = _temp_logger(log_to_file=True, log_to_console=False, background=False)
+
+    def run():
+        for i in range(LOG_LINES):
+            logger.log("Journey cost: $%.2f", LogLevel.INFO, i * 1.5)
+    return run, LOG_LINES
+
+# ===== CATALOG =====
+@benchmark("catalog.get_planetary_body")
+def _catalog_planetary_body():
+    from space_data import get_planetary_body
+    return (lambda: get_planetary_body("Venus")), 1
+
+@benchmark("catalog.get_transportation_vehicle")
+def _catalog_transportation_vehicle():
+    from space_data import get_transportation_vehicle
+    return (lambda: get_transportation_vehicle("Space Shuttle")), 1
+
+@benchmark("catalog.columnar_get")
+def _catalog_columnar_get():
+    from space_catalog import ColumnarCatalog
+    from catalog_memory_benchmark import generate_bodies
+    catalog = ColumnarCatalog.from_records(generate_bodies(100000))
+    catalog.get("Body-00000000")
+    return (lambda: catalog.get("Body-00054321")), 1
+
+# ===== REPORTS =====
+@benchmark("report.render")
+def _report_render():
+    from space_journey import calculate_journey, format_journey_report
+    planet, vehicle, velocity, travel_date = _journey_inputs()
+    journey = calculate_journey(planet, vehicle, velocity, travel_date)
+    return (lambda: format_journey_report("Jane Smith", "Canada", travel_date, vehicle, planet, journey)), 1
+
+# ===== METRICS =====
+@benchmark("metrics.span_disabled")
+def _metrics_span_disabled():
+    import space_metrics
+    space_metrics.disable()
+
+    def run():
+        with space_metrics.span("bench_span_seconds"):
+            pass
+    return run, 1
+
+@benchmark("metrics.observe")
+def _metrics_observe():
+    import space_metrics
+    series = space_metrics.histogram("bench_observe_seconds").labels(stage="bench")
+    return (lambda: series.observe(0.0001)), 1
+
+# ===== HARNESS =====
+def time_benchmark(run: Callable[[], Any], ops: int, samples: int = SAMPLES,
+                   sample_seconds: float = SAMPLE_SECONDS) -> Dict[str, Any]:
+    """Time run() in samples of a calibrated number of calls; report nanoseconds per operation"""
+    run()  # warm up caches and lazy imports
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            run()
+        elapsed = time.perf_counter() - started
+        if elapsed >= sample_seconds / 4 or calls >= 1 << 20:
+            break
+        calls *= 2
+    calls = max(1, int(calls * sample_seconds / max(elapsed, 1e-9)))
+
+    per_op = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        for _ in range(calls):
+            run()
+        per_op.append((time.perf_counter() - started) / (calls * ops) * 1e9)
+    median = statistics.median(per_op)
+    return {
+        "ns_per_op": median,
+        "min_ns_per_op": min(per_op),
+        "ops_per_second": 1e9 / median,
+        "samples": per_op,
+    }
+
+def time_import(module: str, samples: int = IMPORT_SAMPLES) -> Dict[str, Any]:
+    """Cold import time of a module, each sample in a fresh interpreter"""
+    code = (
+        "import time, importlib\n"
+        "started = time.perf_counter()\n"
+        f"importlib.import_module({module!r})\n"
+        "print(time.perf_counter() - started)\n"
+    )
+    per_import = []
+    for _ in range(samples):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=_SCRIPT_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        per_import.append(float(output.strip().splitlines()[-1]) * 1e9)
+    median = statistics.median(per_import)
+    return {
+        "ns_per_op": median,
+        "min_ns_per_op": min(per_import),
+        "ops_per_second": 1e9 / median,
+        "samples": per_import,
+    }
+
+def run_suite(pattern: Optional[str] = None, imports: bool = True,
+              samples: int = SAMPLES, sample_seconds: float = SAMPLE_SECONDS) -> Dict[str, Any]:
+    """Run every benchmark whose name contains pattern and return the results document"""
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        run, ops = setup()
+        results[name] = time_benchmark(run, ops, samples, sample_seconds)
+    if imports:
+        for module in IMPORT_MODULES:
+            name = f"import.{module}"
+            if pattern and pattern not in name:
+                continue
+            results[name] = time_import(module)
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": results,
+    }
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    max_slowdown: float = DEFAULT_MAX_SLOWDOWN) -> List[Dict[str, Any]]:
+    """Per-benchmark change in median time between two results documents"""
+    rows = []
+    for name, stats in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            continue
+        change = stats["ns_per_op"] / before["ns_per_op"] - 1
+        rows.append({
+            "name": name,
+            "baseline_ns": before["ns_per_op"],
+            "current_ns": stats["ns_per_op"],
+            "change": change,
+            "regressed": change > max_slowdown,
+        })
+    return rows
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:,.2f} {unit}"
+    return f"{ns:,.1f} ns"
+
+def print_results(document: Dict[str, Any]) -> None:
+    print("===== SPACE TRAVEL BENCHMARKS =====")
+    print(f"{'Benchmark':<38}{'Time/op':>14}{'Ops/s':>16}")
+    for name, stats in document["benchmarks"].items():
+        print(f"{name:<38}{_format_ns(stats['ns_per_op']):>14}{stats['ops_per_second']:>16,.0f}")
+
+def print_comparison(rows: List[Dict[str, Any]], max_slowdown: float) -> None:
+    print(f"\n===== COMPARISON (gate: {max_slowdown:.0%} slower) =====")
+    print(f"{'Benchmark':<38}{'Baseline':>14}{'Current':>14}{'Change':>10}")
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['name']:<38}{_format_ns(row['baseline_ns']):>14}"
+            f"{_format_ns(row['current_ns']):>14}{row['change']:>+10.1%}{flag}"
+        )
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results format in '{path}'.")
+    return document
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the space travel hot paths.")
+    parser.add_argument("--output", "-o", help="Write results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a saved results JSON")
+    parser.add_argument("--current", metavar="RESULTS", help="Compare this saved results JSON instead of running")
+    parser.add_argument("--max-slowdown", type=float, default=DEFAULT_MAX_SLOWDOWN,
+                        help="Fail when any benchmark is slower than baseline by more than this fraction")
+    parser.add_argument("--filter", "-k", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--no-imports", action="store_true", help="Skip the cold import benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Fewer, shorter samples (noisier)")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in list(BENCHMARKS) + [f"import.{module}" for module in IMPORT_MODULES]:
+            print(name)
+        return 0
+
+    if args.current:
+        document = _load(args.current)
+    else:
+        samples, sample_seconds = (3, 0.03) if args.quick else (SAMPLES, SAMPLE_SECONDS)
+        document = run_suite(args.filter, not args.no_imports, samples, sample_seconds)
+    print_results(document)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        rows = compare_results(_load(args.compare), document, args.max_slowdown)
+        print_comparison(rows, args.max_slowdown)
+        regressions = [row["name"] for row in rows if row["regressed"]]
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,411 @@
+# Space Catalog Store - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import sys
+import json
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from space_data import PlanetaryBody, TransportationVehicle, attach_catalogs
+
+# On-disk layout: one directory per catalog holding a catalog.json manifest
+# and one .npy file per column, so every column can be memory-mapped and
+# only the pages a query touches are read. Strings are stored as a UTF-8
+# blob plus an offsets array; secondary indexes are stored next to them.
+# Descriptions are dictionary-encoded: each distinct text is stored once
+# and rows hold an index into that table.
+MANIFEST_FILE = "catalog.json"
+CATALOG_FORMAT_VERSION = 1
+
+CATALOG_KINDS = {
+    "planetary_bodies": PlanetaryBody,
+    "transportation_vehicles": TransportationVehicle,
+}
+
+# Numeric columns that get a sorted index for range queries
+RANGE_COLUMNS = {
+    "planetary_bodies": ["distance_from_earth", "diameter", "gravity"],
+    "transportation_vehicles": ["max_velocity", "fuel_efficiency", "passenger_capacity", "cargo_capacity"],
+}
+
+STRING_COLUMNS = ("name", "description")
+# Numeric columns whose records may hold None, stored as NaN
+OPTIONAL_COLUMNS = ("acceleration",)
+# String columns stored as a table of distinct values plus per-row codes
+DICTIONARY_COLUMNS = ("description",)
+
+def _name_key(name: str) -> bytes:
+    """Case-insensitive index key for a name"""
+    return name.casefold().encode("utf-8")
+
+def _encode_strings(column: str, values: Sequence[str]) -> Dict[str, np.ndarray]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return {f"{column}_blob": blob, f"{column}_offsets": offsets}
+
+def _encode_dictionary(column: str, values: Sequence[str]) -> Dict[str, np.ndarray]:
+    table: Dict[str, int] = {}
+    codes = np.array([table.setdefault(value, len(table)) for value in values], dtype=np.int32)
+    arrays = _encode_strings(f"{column}_values", list(table))
+    arrays[f"{column}_codes"] = codes
+    return arrays
+
+def _name_index(names: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Case-insensitive name index: sorted keys plus the row each key belongs to"""
+    keys = np.array([_name_key(name) for name in names], dtype=bytes)
+    order = np.argsort(keys, kind="stable")
+    return {"name_keys": keys[order], "name_order": order}
+
+def _range_index(column: str, values: np.ndarray) -> Dict[str, np.ndarray]:
+    """Rows in value order plus the sorted values, for range queries"""
+    order = np.argsort(values, kind="stable")
+    return {f"{column}_order": order, f"{column}_sorted": values[order]}
+
+def build_columns(
+    records: Iterable[Union[PlanetaryBody, TransportationVehicle]],
+    kind: Optional[str] = None,
+    indexes: bool = True
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Encode records as (column arrays, manifest) in the catalog layout.
+
+    With indexes=False the name and range indexes are left out; an
+    in-memory ColumnarCatalog builds them on first use.
+    """
+    records = list(records)
+    if kind is None:
+        if not records:
+            raise ValueError("Cannot infer the catalog kind from an empty record list.")
+        kind = next(k for k, cls in CATALOG_KINDS.items() if isinstance(records[0], cls))
+    if kind not in CATALOG_KINDS:
+        raise ValueError(f"Unknown catalog kind '{kind}'.")
+
+    record_fields = [f for f in fields(CATALOG_KINDS[kind]) if f.init]
+    arrays: Dict[str, np.ndarray] = {}
+
+    for field in record_fields:
+        values = [getattr(record, field.name) for record in records]
+        if field.name in DICTIONARY_COLUMNS:
+            arrays.update(_encode_dictionary(field.name, values))
+        elif field.name in STRING_COLUMNS:
+            arrays.update(_encode_strings(field.name, values))
+        else:
+            dtype = np.int64 if field.type is int else np.float64
+            column = np.array(values, dtype=dtype)
+            arrays[field.name] = column
+            if indexes and field.name in RANGE_COLUMNS[kind]:
+                arrays.update(_range_index(field.name, column))
+
+    if indexes:
+        arrays.update(_name_index([record.name for record in records]))
+
+    manifest = {
+        "format_version": CATALOG_FORMAT_VERSION,
+        "kind": kind,
+        "count": len(records),
+        "columns": [field.name for field in record_fields],
+        "dictionary_columns": list(DICTIONARY_COLUMNS),
+        "range_indexes": RANGE_COLUMNS[kind],
+    }
+    return arrays, manifest
+
+def write_catalog(
+    directory: str,
+    records: Iterable[Union[PlanetaryBody, TransportationVehicle]],
+    kind: Optional[str] = None
+) -> int:
+    """
+    Write planetary bodies or transportation vehicles to a columnar catalog directory.
+
+    Returns:
+        Number of records written
+    """
+    arrays, manifest = build_columns(records, kind)
+    os.makedirs(directory, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+    with open(os.path.join(directory, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest["count"]
+
+class CatalogRow:
+    """
+    Lightweight view of one catalog row.
+
+    Has the same attributes as the record it stands for, read from the
+    columns on access, so millions of rows can be handled without building
+    a record per row. Use to_record() for a standalone record.
+    """
+    __slots__ = ("_catalog", "row")
+
+    def __init__(self, catalog: "ColumnarCatalog", row: int):
+        self._catalog = catalog
+        self.row = row
+
+    def __getattr__(self, name: str) -> Any:
+        # Looked up directly: a row whose slots are not set yet (as while
+        # copying or unpickling) must raise AttributeError, not recurse
+        catalog = object.__getattribute__(self, "_catalog")
+        if name in catalog.manifest["columns"]:
+            return catalog.value(name, self.row)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CatalogRow) and other._catalog is self._catalog and other.row == self.row
+
+    def __hash__(self) -> int:
+        return hash((id(self._catalog), self.row))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(row={self.row}, name={self.name!r})"
+
+    def to_record(self) -> Union[PlanetaryBody, TransportationVehicle]:
+        """Build the standalone record for this row"""
+        return self._catalog.record(self.row)
+
+class PlanetaryBodyRow(CatalogRow):
+    __slots__ = ()
+    distance_from_earth_formatted = PlanetaryBody.distance_from_earth_formatted
+
+class TransportationVehicleRow(CatalogRow):
+    __slots__ = ()
+    max_velocity_formatted = TransportationVehicle.max_velocity_formatted
+
+ROW_CLASSES = {
+    "planetary_bodies": PlanetaryBodyRow,
+    "transportation_vehicles": TransportationVehicleRow,
+}
+
+class ColumnarCatalog:
+    """
+    Read-only catalog backed by column arrays.
+
+    Opened from a directory, nothing is parsed up front; each column file is
+    memory-mapped the first time it is used and records are built only for
+    the rows a lookup returns. from_records() builds the same structure in
+    memory, as a compact store for large generated catalogs.
+    """
+    def __init__(self, directory: Optional[str], manifest: Optional[Dict[str, Any]] = None,
+                 arrays: Optional[Dict[str, np.ndarray]] = None):
+        self.directory = directory
+        if manifest is None:
+            with open(os.path.join(directory, MANIFEST_FILE)) as f:
+                manifest = json.load(f)
+        self.manifest = manifest
+        if self.manifest.get("format_version") != CATALOG_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported catalog format version {self.manifest.get('format_version')} in '{directory}'."
+            )
+        self.kind = self.manifest["kind"]
+        self.record_class = CATALOG_KINDS[self.kind]
+        self.row_class = ROW_CLASSES[self.kind]
+        self._dictionary_columns = set(self.manifest["dictionary_columns"])
+        self._dictionaries: Dict[str, List[str]] = {}
+        self._arrays: Dict[str, np.ndarray] = dict(arrays or {})
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Union[PlanetaryBody, TransportationVehicle]],
+        kind: Optional[str] = None
+    ) -> "ColumnarCatalog":
+        """
+        Build an in-memory catalog with the same columns as a written one.
+
+        Name and range indexes are built the first time a lookup needs them,
+        so a catalog that is only scanned by column never pays for them.
+        """
+        arrays, manifest = build_columns(records, kind, indexes=False)
+        return cls(None, manifest, arrays)
+
+    def _array(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            if self.directory is None:
+                self._arrays.update(self._build_index(name))
+                return self._arrays[name]
+            array = np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode="r")
+            self._arrays[name] = array
+        return array
+
+    def _build_index(self, name: str) -> Dict[str, np.ndarray]:
+        if name in ("name_keys", "name_order"):
+            return _name_index([self.name(row) for row in range(len(self))])
+        for column in self.manifest["range_indexes"]:
+            if name in (f"{column}_order", f"{column}_sorted"):
+                return _range_index(column, self._arrays[column])
+        raise KeyError(f"Catalog has no array '{name}'.")
+
+    def _decode(self, column: str, row: int) -> str:
+        offsets = self._array(f"{column}_offsets")
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        return self._array(f"{column}_blob")[start:end].tobytes().decode("utf-8")
+
+    def _string(self, column: str, row: int) -> str:
+        if column not in self._dictionary_columns:
+            return self._decode(column, row)
+        # Distinct values are decoded once and shared by every row using them
+        values = self._dictionaries.get(column)
+        if values is None:
+            count = len(self._array(f"{column}_values_offsets")) - 1
+            values = [sys.intern(self._decode(f"{column}_values", i)) for i in range(count)]
+            self._dictionaries[column] = values
+        return values[self._array(f"{column}_codes")[row]]
+
+    def value(self, column: str, row: int) -> Any:
+        """Return one field of one row"""
+        if column in STRING_COLUMNS:
+            return self._string(column, row)
+        value = self._array(column)[row].item()
+        if column in OPTIONAL_COLUMNS and value != value:
+            return None
+        return value
+
+    def __len__(self) -> int:
+        return self.manifest["count"]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a numeric column as a (memory-mapped) array"""
+        if name in STRING_COLUMNS or name not in self.manifest["columns"]:
+            raise ValueError(f"'{name}' is not a numeric column of this catalog.")
+        return self._array(name)
+
+    def __getitem__(self, row: int) -> CatalogRow:
+        """Row view with the record's attributes, read lazily"""
+        if row < 0:
+            row += len(self)
+        if row < 0 or row >= len(self):
+            raise IndexError(f"Catalog row {row} out of range.")
+        return self.row_class(self, row)
+
+    def __iter__(self) -> Iterator[CatalogRow]:
+        for row in range(len(self)):
+            yield self.row_class(self, row)
+
+    def record(self, row: int) -> Union[PlanetaryBody, TransportationVehicle]:
+        """Build the record stored at a row"""
+        if row < 0 or row >= len(self):
+            raise IndexError(f"Catalog row {row} out of range.")
+        return self.record_class(**{name: self.value(name, row) for name in self.manifest["columns"]})
+
+    def records(self, rows: Iterable[int]) -> Iterator[Union[PlanetaryBody, TransportationVehicle]]:
+        """Build records for a sequence of rows"""
+        for row in rows:
+            yield self.record(int(row))
+
+    def name(self, row: int) -> str:
+        """Return the name stored at a row without building the whole record"""
+        return self._string("name", row)
+
+    def _key_range(self, low: bytes, high: bytes, high_side: str = "left") -> np.ndarray:
+        keys = self._array("name_keys")
+        start = np.searchsorted(keys, low, side="left")
+        end = np.searchsorted(keys, high, side=high_side)
+        return self._array("name_order")[start:end]
+
+    def find_rows(self, name: str) -> np.ndarray:
+        """Rows whose name matches case-insensitively"""
+        key = _name_key(name)
+        return self._key_range(key, key, high_side="right")
+
+    def prefix_rows(self, prefix: str) -> np.ndarray:
+        """Rows whose name starts with prefix, case-insensitively, in name order"""
+        key = _name_key(prefix)
+        # 0xFF never occurs in UTF-8, so it sorts after every key with this prefix
+        return self._key_range(key, key + b"\xff")
+
+    def range_rows(self, column: str, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Rows with low <= column <= high (either bound optional), in value order"""
+        if column not in self.manifest["range_indexes"]:
+            raise ValueError(f"No range index on '{column}'.")
+        sorted_values = self._array(f"{column}_sorted")
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side="left")
+        end = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side="right")
+        return self._array(f"{column}_order")[start:end]
+
+    def get(self, name: str) -> Optional[Union[PlanetaryBody, TransportationVehicle]]:
+        """Exact (case-sensitive) name lookup, None if absent"""
+        for row in self.find_rows(name):
+            if self.name(int(row)) == name:
+                return self.record(int(row))
+        return None
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def find(self, name: str) -> List[Union[PlanetaryBody, TransportationVehicle]]:
+        """Case-insensitive name lookup"""
+        return list(self.records(self.find_rows(name)))
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[Union[PlanetaryBody, TransportationVehicle]]:
+        """Case-insensitive prefix lookup, in name order"""
+        rows = self.prefix_rows(prefix)
+        return list(self.records(rows[:limit] if limit is not None else rows))
+
+    def range(
+        self,
+        column: str,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[Union[PlanetaryBody, TransportationVehicle]]:
+        """Records with low <= column <= high, in value order"""
+        rows = self.range_rows(column, low, high)
+        return list(self.records(rows[:limit] if limit is not None else rows))
+
+class PlanetaryBodyCatalog(ColumnarCatalog):
+    """Columnar catalog of planetary bodies"""
+    def __init__(self, directory: Optional[str], manifest: Optional[Dict[str, Any]] = None,
+                 arrays: Optional[Dict[str, np.ndarray]] = None):
+        super().__init__(directory, manifest, arrays)
+        if self.kind != "planetary_bodies":
+            raise ValueError(f"'{directory or 'records'}' is not a planetary body catalog.")
+
+    def within_distance(self, low: Optional[float] = None, high: Optional[float] = None) -> List[PlanetaryBody]:
+        """Bodies whose distance_from_earth lies in [low, high]"""
+        return self.range("distance_from_earth", low, high)
+
+class TransportationVehicleCatalog(ColumnarCatalog):
+    """Columnar catalog of transportation vehicles"""
+    def __init__(self, directory: Optional[str], manifest: Optional[Dict[str, Any]] = None,
+                 arrays: Optional[Dict[str, np.ndarray]] = None):
+        super().__init__(directory, manifest, arrays)
+        if self.kind != "transportation_vehicles":
+            raise ValueError(f"'{directory or 'records'}' is not a transportation vehicle catalog.")
+
+    def with_max_velocity(self, low: Optional[float] = None, high: Optional[float] = None) -> List[TransportationVehicle]:
+        """Vehicles whose max_velocity lies in [low, high]"""
+        return self.range("max_velocity", low, high)
+
+    def with_cargo_capacity(self, low: Optional[int] = None, high: Optional[int] = None) -> List[TransportationVehicle]:
+        """Vehicles whose cargo_capacity lies in [low, high]"""
+        return self.range("cargo_capacity", low, high)
+
+def open_catalog(directory: str) -> ColumnarCatalog:
+    """Open a catalog directory with the class matching its kind"""
+    with open(os.path.join(directory, MANIFEST_FILE)) as f:
+        kind = json.load(f).get("kind")
+    if kind == "planetary_bodies":
+        return PlanetaryBodyCatalog(directory)
+    if kind == "transportation_vehicles":
+        return TransportationVehicleCatalog(directory)
+    raise ValueError(f"Unknown catalog kind '{kind}' in '{directory}'.")
+
+def load_catalogs(directory: str) -> None:
+    """
+    Attach the catalogs under directory/planetary_bodies and
+    directory/transportation_vehicles to space_data, so get_planetary_body()
+    and get_transportation_vehicle() also find their records.
+    """
+    bodies_dir = os.path.join(directory, "planetary_bodies")
+    vehicles_dir = os.path.join(directory, "transportation_vehicles")
+    attach_catalogs(
+        PlanetaryBodyCatalog(bodies_dir) if os.path.isdir(bodies_dir) else None,
+        TransportationVehicleCatalog(vehicles_dir) if os.path.isdir(vehicles_dir) else None
+    )
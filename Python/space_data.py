@@ -2,11 +2,16 @@
 # For www.spacetravel.com innovative solutions
 # Created: May 25, 2025
 
-from typing import Dict, Any, Union, Optional, List
-from dataclasses import dataclass
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Dict, Any, Union, Optional, List, Callable, Tuple, Mapping, Iterator
 
-# Define planetary bodies with fixed data (will never change)
-@dataclass
+# Define planetary bodies with fixed data (will never change).
+# Records use __slots__ (no per-instance __dict__); for very large catalogs
+# see space_catalog.ColumnarCatalog.
+@dataclass(frozen=True, slots=True)
 class PlanetaryBody:
     name: str
     distance_from_earth: float  # kilometers
@@ -19,8 +24,9 @@ class PlanetaryBody:
         """Return the distance with proper formatting and units"""
         return f"{self.distance_from_earth:,.0f} km"
 
-# Define transportation vehicles with variable data (expected to change)
-@dataclass
+# Define transportation vehicles with variable data (expected to change
+# by publishing an updated copy, see update_transportation_vehicle)
+@dataclass(frozen=True, slots=True)
 class TransportationVehicle:
     name: str
     max_velocity: float       # km/h
@@ -28,6 +34,9 @@ class TransportationVehicle:
     passenger_capacity: int   # people
     cargo_capacity: int       # kg
     description: str
+    # Thrust limit in m/s² for the accelerate-coast-decelerate model
+    # (space_trajectory); None travels at the selected velocity throughout
+    acceleration: Optional[float] = None
     
     @property
     def max_velocity_formatted(self) -> str:
@@ -102,28 +111,118 @@ TRANSPORTATION_VEHICLES: Dict[str, TransportationVehicle] = {
     ),
 }
 
+# Optional large catalogs (space_catalog.ColumnarCatalog) consulted after the
+# built-in dictionaries. Anything with a get(name) method returning a record or
+# None can be attached.
+_planetary_body_store: Optional[Any] = None
+_transportation_vehicle_store: Optional[Any] = None
+
+def attach_catalogs(planetary_bodies: Optional[Any] = None, transportation_vehicles: Optional[Any] = None) -> None:
+    """Attach file-backed catalogs to extend name lookups beyond the built-in data"""
+    global _planetary_body_store, _transportation_vehicle_store
+    _planetary_body_store = planetary_bodies
+    _transportation_vehicle_store = transportation_vehicles
+
+# Called as listener(vehicle, changes) after update_transportation_vehicle
+# publishes a changed vehicle; changes maps each changed field to (old, new)
+VehicleListener = Callable[[TransportationVehicle, Dict[str, Tuple[Any, Any]]], None]
+_vehicle_listeners: List[VehicleListener] = []
+
+def add_vehicle_listener(listener: VehicleListener) -> None:
+    """Register a callback for transportation vehicle updates"""
+    if listener not in _vehicle_listeners:
+        _vehicle_listeners.append(listener)
+
+def remove_vehicle_listener(listener: VehicleListener) -> None:
+    """Unregister a callback added with add_vehicle_listener"""
+    if listener in _vehicle_listeners:
+        _vehicle_listeners.remove(listener)
+
+# Versioned, read-only view of the built-in data. Records are frozen and a
+# snapshot never changes after it is published: writers build a new snapshot
+# and swap it in with a single assignment, so readers need no lock and always
+# see every field of a vehicle from the same version.
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    planetary_bodies: Mapping[str, PlanetaryBody]
+    transportation_vehicles: Mapping[str, TransportationVehicle]
+
+    def get_planetary_body(self, name: str) -> PlanetaryBody:
+        """Get a planetary body by name from this snapshot"""
+        if name in self.planetary_bodies:
+            return self.planetary_bodies[name]
+        body = _planetary_body_store.get(name) if _planetary_body_store is not None else None
+        if body is not None:
+            return body
+        raise ValueError(f"Planetary body '{name}' not found in database.")
+
+    def get_transportation_vehicle(self, name: str) -> TransportationVehicle:
+        """Get a transportation vehicle by name from this snapshot"""
+        if name in self.transportation_vehicles:
+            return self.transportation_vehicles[name]
+        vehicle = _transportation_vehicle_store.get(name) if _transportation_vehicle_store is not None else None
+        if vehicle is not None:
+            return vehicle
+        raise ValueError(f"Transportation vehicle '{name}' not found in database.")
+
+_snapshot = CatalogSnapshot(
+    version=1,
+    planetary_bodies=MappingProxyType(dict(PLANETARY_BODIES)),
+    transportation_vehicles=MappingProxyType(dict(TRANSPORTATION_VEHICLES)),
+)
+# The module-level names are rebound to the new snapshot's mappings on every
+# update, so a copy taken with `from space_data import TRANSPORTATION_VEHICLES`
+# keeps the version it was imported with. Use get_all_planetary_bodies() and
+# get_all_transportation_vehicles() to read the current data.
+PLANETARY_BODIES = _snapshot.planetary_bodies
+TRANSPORTATION_VEHICLES = _snapshot.transportation_vehicles
+
+# Serializes writers only; readers never take it
+_publish_lock = threading.RLock()
+# Per-thread snapshot pinned with pin_snapshot(). The class-level default
+# keeps unpinned reads from raising and catching AttributeError internally.
+class _PinnedSnapshot(threading.local):
+    snapshot: Optional[CatalogSnapshot] = None
+
+_pinned = _PinnedSnapshot()
+
+def current_snapshot() -> CatalogSnapshot:
+    """The snapshot this thread reads: its pinned one, else the latest published"""
+    return _pinned.snapshot or _snapshot
+
+@contextmanager
+def pin_snapshot(snapshot: Optional[CatalogSnapshot] = None) -> Iterator[CatalogSnapshot]:
+    """
+    Make every lookup in this thread read one snapshot until the block exits.
+
+    Batch jobs pin a snapshot so all their quotes use the same vehicle data
+    even if it is updated while they run. Defaults to the current snapshot.
+    """
+    previous = _pinned.snapshot
+    snapshot = snapshot or current_snapshot()
+    _pinned.snapshot = snapshot
+    try:
+        yield snapshot
+    finally:
+        _pinned.snapshot = previous
+
 # Functions to access the data
 def get_planetary_body(name: str) -> PlanetaryBody:
     """Get a planetary body by name"""
-    if name in PLANETARY_BODIES:
-        return PLANETARY_BODIES[name]
-    else:
-        raise ValueError(f"Planetary body '{name}' not found in database.")
+    return current_snapshot().get_planetary_body(name)
 
 def get_transportation_vehicle(name: str) -> TransportationVehicle:
     """Get a transportation vehicle by name"""
-    if name in TRANSPORTATION_VEHICLES:
-        return TRANSPORTATION_VEHICLES[name]
-    else:
-        raise ValueError(f"Transportation vehicle '{name}' not found in database.")
+    return current_snapshot().get_transportation_vehicle(name)
 
-def get_all_planetary_bodies() -> Dict[str, PlanetaryBody]:
+def get_all_planetary_bodies() -> Mapping[str, PlanetaryBody]:
     """Get all planetary bodies"""
-    return PLANETARY_BODIES
+    return current_snapshot().planetary_bodies
 
-def get_all_transportation_vehicles() -> Dict[str, TransportationVehicle]:
+def get_all_transportation_vehicles() -> Mapping[str, TransportationVehicle]:
     """Get all transportation vehicles"""
-    return TRANSPORTATION_VEHICLES
+    return current_snapshot().transportation_vehicles
 
 def update_transportation_vehicle(
     name: str,
@@ -131,27 +230,62 @@ def update_transportation_vehicle(
     fuel_efficiency: Optional[float] = None,
     passenger_capacity: Optional[int] = None,
     cargo_capacity: Optional[int] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    acceleration: Optional[float] = None,
+    clear_acceleration: bool = False
 ) -> TransportationVehicle:
-    """Update a transportation vehicle's properties"""
-    if name not in TRANSPORTATION_VEHICLES:
-        raise ValueError(f"Transportation vehicle '{name}' not found in database.")
-    
-    vehicle = TRANSPORTATION_VEHICLES[name]
-    
-    if max_velocity is not None:
-        vehicle.max_velocity = max_velocity
-    
-    if fuel_efficiency is not None:
-        vehicle.fuel_efficiency = fuel_efficiency
-    
-    if passenger_capacity is not None:
-        vehicle.passenger_capacity = passenger_capacity
-    
-    if cargo_capacity is not None:
-        vehicle.cargo_capacity = cargo_capacity
+    """
+    Update a transportation vehicle's properties.
+
+    Properties left as None keep their value; clear_acceleration=True removes
+    the acceleration limit so the vehicle flies at constant speed again.
+    The vehicle is replaced rather than modified: a new snapshot holding the
+    updated copy is published, and readers holding the previous snapshot or
+    vehicle keep seeing the old values.
+    """
+    global _snapshot, TRANSPORTATION_VEHICLES
+    if acceleration is not None:
+        if clear_acceleration:
+            raise ValueError("Cannot both set and clear the acceleration.")
+        if not acceleration > 0:
+            raise ValueError("Acceleration must be positive.")
+    updates = {
+        "max_velocity": max_velocity,
+        "fuel_efficiency": fuel_efficiency,
+        "passenger_capacity": passenger_capacity,
+        "cargo_capacity": cargo_capacity,
+        "description": description,
+        "acceleration": acceleration,
+    }
     
-    if description is not None:
-        vehicle.description = description
+    with _publish_lock:
+        vehicles = _snapshot.transportation_vehicles
+        if name not in vehicles:
+            raise ValueError(f"Transportation vehicle '{name}' not found in database.")
+        
+        vehicle = vehicles[name]
+        changes: Dict[str, Tuple[Any, Any]] = {
+            field_name: (getattr(vehicle, field_name), value)
+            for field_name, value in updates.items()
+            if value is not None and getattr(vehicle, field_name) != value
+        }
+        if clear_acceleration and vehicle.acceleration is not None:
+            changes["acceleration"] = (vehicle.acceleration, None)
+        if not changes:
+            return vehicle
+        
+        vehicle = replace(vehicle, **{field_name: new for field_name, (_, new) in changes.items()})
+        updated = dict(vehicles)
+        updated[name] = vehicle
+        _snapshot = CatalogSnapshot(
+            version=_snapshot.version + 1,
+            planetary_bodies=_snapshot.planetary_bodies,
+            transportation_vehicles=MappingProxyType(updated),
+        )
+        TRANSPORTATION_VEHICLES = _snapshot.transportation_vehicles
+        
+        # Listeners run in publish order, after the new snapshot is visible
+        for listener in list(_vehicle_listeners):
+            listener(vehicle, changes)
     
     return vehicle
@@ -0,0 +1,209 @@
+# Space Ephemeris - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import datetime
+import threading
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from space_data import get_planetary_body
+from space_journey import RESERVATION_YEARS
+
+AU_KM = 149597870.7
+J2000 = np.datetime64("2000-01-01T12:00:00", "s")
+SECONDS_PER_DAY = 86400.0
+
+# Keplerian elements and their rates per Julian century, J2000 ecliptic
+# (JPL "Approximate Positions of the Planets"):
+# (a [AU], e, I [deg], L [deg], longitude of perihelion [deg], longitude of ascending node [deg])
+ORBITAL_ELEMENTS: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = {
+    "Mercury": (
+        (0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593),
+        (0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081),
+    ),
+    "Venus": (
+        (0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255),
+        (0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418),
+    ),
+    "Earth": (
+        (1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0),
+        (0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0),
+    ),
+    "Mars": (
+        (1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891),
+        (0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343),
+    ),
+}
+
+# The Moon orbits Earth directly: semi-major axis [km], eccentricity,
+# mean anomaly at J2000 [deg] and mean motion [deg/day]
+LUNAR_ORBIT = (384399.0, 0.0549, 134.963, 13.064993)
+
+# Ephemeris tables are cached next to this module
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ephemeris_cache")
+
+DateLike = Union[datetime.date, datetime.datetime, np.datetime64, str]
+
+def _to_datetime64(dates) -> np.ndarray:
+    return np.asarray(dates, dtype="datetime64[s]")
+
+def _solve_kepler(mean_anomaly: np.ndarray, eccentricity: np.ndarray) -> np.ndarray:
+    """Solve E - e sin E = M for E (radians) with Newton's method"""
+    eccentric_anomaly = mean_anomaly + eccentricity * np.sin(mean_anomaly)
+    for _ in range(8):
+        delta = (eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly) - mean_anomaly) / (
+            1 - eccentricity * np.cos(eccentric_anomaly)
+        )
+        eccentric_anomaly -= delta
+        if np.all(np.abs(delta) < 1e-12):
+            break
+    return eccentric_anomaly
+
+def heliocentric_position(body: str, dates) -> np.ndarray:
+    """Heliocentric ecliptic x, y, z in km for each date (shape (n, 3))"""
+    elements, rates = ORBITAL_ELEMENTS[body]
+    centuries = ((_to_datetime64(dates) - J2000).astype(np.float64) / SECONDS_PER_DAY / 36525.0)
+    centuries = np.atleast_1d(centuries)
+    a, e, inclination, mean_longitude, perihelion, node = (
+        element + rate * centuries for element, rate in zip(elements, rates)
+    )
+
+    inclination, node = np.radians(inclination), np.radians(node)
+    argument_of_perihelion = np.radians(perihelion) - node
+    mean_anomaly = np.radians((mean_longitude - perihelion + 180.0) % 360.0 - 180.0)
+    eccentric_anomaly = _solve_kepler(mean_anomaly, e)
+
+    # Position in the orbital plane, then rotated into the ecliptic frame
+    x_orbit = a * (np.cos(eccentric_anomaly) - e)
+    y_orbit = a * np.sqrt(1 - e * e) * np.sin(eccentric_anomaly)
+    cos_w, sin_w = np.cos(argument_of_perihelion), np.sin(argument_of_perihelion)
+    cos_n, sin_n = np.cos(node), np.sin(node)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+
+    x = (cos_w * cos_n - sin_w * sin_n * cos_i) * x_orbit + (-sin_w * cos_n - cos_w * sin_n * cos_i) * y_orbit
+    y = (cos_w * sin_n + sin_w * cos_n * cos_i) * x_orbit + (-sin_w * sin_n + cos_w * cos_n * cos_i) * y_orbit
+    z = (sin_w * sin_i) * x_orbit + (cos_w * sin_i) * y_orbit
+    return np.stack([x, y, z], axis=-1) * AU_KM
+
+def has_orbit(body: str) -> bool:
+    """Return True if the distance to body can be modelled over time"""
+    return body == "Moon" or (body in ORBITAL_ELEMENTS and body != "Earth")
+
+def compute_distances(body: str, dates) -> np.ndarray:
+    """
+    Earth-to-body distance in km for each date, computed directly from the
+    orbital elements. Bodies without orbital data keep their fixed
+    distance_from_earth.
+    """
+    dates = np.atleast_1d(_to_datetime64(dates))
+    if body == "Moon":
+        semi_major_axis, eccentricity, mean_anomaly_j2000, mean_motion = LUNAR_ORBIT
+        days = (dates - J2000).astype(np.float64) / SECONDS_PER_DAY
+        mean_anomaly = np.radians((mean_anomaly_j2000 + mean_motion * days) % 360.0)
+        eccentric_anomaly = _solve_kepler(mean_anomaly, np.full_like(mean_anomaly, eccentricity))
+        return semi_major_axis * (1 - eccentricity * np.cos(eccentric_anomaly))
+    if not has_orbit(body):
+        return np.full(len(dates), float(get_planetary_body(body).distance_from_earth))
+    offset = heliocentric_position(body, dates) - heliocentric_position("Earth", dates)
+    return np.sqrt(np.einsum("ij,ij->i", offset, offset))
+
+class EphemerisTable:
+    """
+    Daily Earth-to-body distances over a fixed window with linear interpolation.
+
+    Lookups are O(1): the day offset selects two table entries directly.
+    """
+    def __init__(self, body: str, start: DateLike, days: int, cache_dir: Optional[str] = CACHE_DIR):
+        self.body = body
+        self.start = np.datetime64(_to_datetime64(start), "D")
+        self.days = days
+        self.distances = self._load_or_build(cache_dir)
+
+    @property
+    def end(self) -> np.datetime64:
+        return self.start + np.timedelta64(self.days - 1, "D")
+
+    def _cache_path(self, cache_dir: str) -> str:
+        return os.path.join(cache_dir, f"ephemeris_{self.body}_{self.start}_{self.days}.npy")
+
+    def _load_or_build(self, cache_dir: Optional[str]) -> np.ndarray:
+        if cache_dir:
+            path = self._cache_path(cache_dir)
+            if os.path.exists(path):
+                return np.load(path)
+
+        dates = self.start + np.arange(self.days).astype("timedelta64[D]")
+        distances = compute_distances(self.body, dates)
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary name first so readers never see a partial table
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as f:
+                np.save(f, distances)
+            os.replace(temporary_path, path)
+        return distances
+
+    def distances_on(self, dates) -> np.ndarray:
+        """Interpolated distances in km for an array of dates"""
+        offsets = (_to_datetime64(dates) - self.start.astype("datetime64[s]")).astype(np.float64) / SECONDS_PER_DAY
+        if np.any(offsets < 0) or np.any(offsets > self.days - 1):
+            raise ValueError(f"Date outside the ephemeris window {self.start} to {self.end}.")
+        index = np.minimum(offsets.astype(np.int64), self.days - 2)
+        weight = offsets - index
+        return self.distances[index] * (1 - weight) + self.distances[index + 1] * weight
+
+    def distance_on(self, date: DateLike) -> float:
+        """Interpolated distance in km on a single date"""
+        return float(self.distances_on(np.atleast_1d(_to_datetime64(date)))[0])
+
+def reservation_window(today: Optional[datetime.date] = None) -> Tuple[np.datetime64, int]:
+    """
+    Start day and length of the table covering the reservation window:
+    January 1 of this year through the end of the last bookable year, plus
+    one extra year so arrival dates of late departures stay covered.
+    """
+    today = today or datetime.date.today()
+    start = np.datetime64(f"{today.year}-01-01", "D")
+    end = np.datetime64(f"{today.year + RESERVATION_YEARS + 2}-01-01", "D")
+    return start, int((end - start).astype(np.int64)) + 1
+
+_tables: Dict[str, EphemerisTable] = {}
+_tables_lock = threading.Lock()
+
+def get_ephemeris(body: str, cache_dir: Optional[str] = CACHE_DIR) -> EphemerisTable:
+    """Return the reservation-window table for body, building or loading it once"""
+    start, days = reservation_window()
+    with _tables_lock:
+        table = _tables.get(body)
+        if table is None or table.start != start:
+            table = EphemerisTable(body, start, days, cache_dir)
+            _tables[body] = table
+        return table
+
+def distance_on(body: str, date: DateLike) -> float:
+    """Earth-to-body distance in km on a date"""
+    if not has_orbit(body):
+        return float(get_planetary_body(body).distance_from_earth)
+    return get_ephemeris(body).distance_on(date)
+
+def distances_for(bodies: Union[str, Sequence[str], np.ndarray], dates) -> np.ndarray:
+    """
+    Vectorized distances for arrays of bodies and dates, for the batch quoting
+    path. bodies may be a single name or one name per date.
+    """
+    dates = np.atleast_1d(_to_datetime64(dates))
+    if isinstance(bodies, str):
+        if not has_orbit(bodies):
+            return np.full(len(dates), float(get_planetary_body(bodies).distance_from_earth))
+        return get_ephemeris(bodies).distances_on(dates)
+
+    bodies = np.asarray(bodies).astype(str)
+    distances = np.empty(len(dates), dtype=np.float64)
+    for body in np.unique(bodies):
+        mask = bodies == body
+        distances[mask] = distances_for(str(body), dates[mask])
+    return distances
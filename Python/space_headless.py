@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# Headless Space Journey Quoting - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import sys
+import csv
+import json
+import argparse
+import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from space_data import (
+    current_snapshot,
+    CatalogSnapshot,
+    PlanetaryBody,
+    TransportationVehicle
+)
+from space_journey import (
+    calculate_journey,
+    validate_text,
+    validate_year,
+    validate_velocity,
+    validate_choice,
+    RESERVATION_YEARS
+)
+from quote_cache import QuoteCache, get_quote_cache
+
+# Fields a journey request may carry. vehicle and destination accept either
+# the catalog name or the 1-based menu number shown by the interactive prompt.
+REQUEST_FIELDS = ["name", "country", "year", "vehicle", "velocity", "destination"]
+
+RESULT_FIELDS = [
+    "row", "name", "country", "travel_date", "vehicle", "destination",
+    "velocity", "distance", "duration_hours", "duration_days",
+    "duration_months", "duration_years", "arrival_date", "fuel_units",
+    "journey_cost", "error"
+]
+
+FORMATS = ("csv", "jsonl")
+
+def detect_format(path: Optional[str], default: str = "jsonl") -> str:
+    """Guess csv/jsonl from a file extension"""
+    if path:
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            return "csv"
+        if extension in (".jsonl", ".json", ".ndjson"):
+            return "jsonl"
+    return default
+
+def read_requests(
+    stream: Iterable[str],
+    input_format: str,
+    fieldnames: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield raw journey requests one at a time from a CSV or JSONL stream.
+    CSV columns come from the header line unless fieldnames are given.
+    """
+    if input_format == "csv":
+        yield from csv.DictReader(stream, fieldnames=fieldnames)
+    elif input_format == "jsonl":
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"_error": f"Invalid JSON: {e.msg}"}
+                continue
+            if not isinstance(request, dict):
+                yield {"_error": "Request must be a JSON object."}
+                continue
+            yield request
+    else:
+        raise ValueError(f"Unsupported input format '{input_format}'.")
+
+def _resolve_option(value: Any, options: List[str]) -> Optional[str]:
+    """Resolve a catalog name or 1-based menu number to a catalog name"""
+    text = str(value).strip()
+    if text in options:
+        return text
+    is_valid, choice = validate_choice(text, len(options))
+    if is_valid:
+        return options[choice - 1]
+    return None
+
+def _quote_fields(
+    planet: PlanetaryBody,
+    vehicle: TransportationVehicle,
+    velocity: float,
+    travel_date: datetime.datetime
+) -> Dict[str, Any]:
+    """The traveler-independent part of a result record"""
+    journey = calculate_journey(planet, vehicle, velocity, travel_date)
+    return {
+        "travel_date": travel_date.strftime('%Y-%m-%d'),
+        "vehicle": vehicle.name,
+        "destination": planet.name,
+        "velocity": velocity,
+        "distance": journey.distance,
+        "duration_hours": journey.duration_hours,
+        "duration_days": journey.duration_days,
+        "duration_months": journey.duration_months,
+        "duration_years": journey.duration_years,
+        "arrival_date": journey.arrival_date.isoformat(),
+        "fuel_units": journey.fuel_units,
+        "journey_cost": journey.journey_cost,
+        "error": ""
+    }
+
+def quote_requests(
+    requests: Iterable[Dict[str, Any]],
+    today: Optional[datetime.datetime] = None,
+    cache: Optional[QuoteCache] = None,
+    snapshot: Optional[CatalogSnapshot] = None,
+    first_row: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate and quote each request, yielding one result record per request.
+
+    Invalid requests produce a record with only the row number and an error
+    message, so the output stays aligned with the input. The formatted quote
+    fields are cached per (destination, vehicle, velocity, travel date) in
+    cache, which defaults to the shared quote cache. Every request is quoted
+    against one catalog snapshot (the current one unless given), so vehicle
+    updates published mid-run do not mix versions within a job. Rows are
+    numbered from first_row, for requests that continue an earlier part.
+    """
+    today = today or datetime.datetime.now()
+    cache = get_quote_cache() if cache is None else cache
+    snapshot = current_snapshot() if snapshot is None else snapshot
+    current_year = today.year
+    planets = snapshot.planetary_bodies
+    vehicles = snapshot.transportation_vehicles
+    planet_names = list(planets)
+    vehicle_names = list(vehicles)
+
+    for row, request in enumerate(requests, first_row):
+        if "_error" in request:
+            yield {"row": row, "error": request["_error"]}
+            continue
+
+        def field(key: str) -> str:
+            value = request.get(key)
+            return "" if value is None else str(value)
+
+        is_valid, name = validate_text(field("name"))
+        if not is_valid:
+            yield {"row": row, "error": "Name cannot be empty."}
+            continue
+
+        is_valid, country = validate_text(field("country"))
+        if not is_valid:
+            yield {"row": row, "error": "Country cannot be empty."}
+            continue
+
+        is_valid, year = validate_year(field("year"), current_year)
+        if not is_valid:
+            yield {"row": row, "error": f"Year must be between {current_year} and {current_year + RESERVATION_YEARS}."}
+            continue
+
+        vehicle_name = _resolve_option(field("vehicle"), vehicle_names)
+        if vehicle_name is None:
+            yield {"row": row, "error": f"Unknown transportation vehicle '{field('vehicle')}'."}
+            continue
+        vehicle = vehicles[vehicle_name]
+
+        is_valid, velocity = validate_velocity(field("velocity"), vehicle.max_velocity)
+        if not is_valid:
+            yield {
+                "row": row,
+                "error": f"Velocity must be positive and cannot exceed {vehicle.max_velocity:,.0f} km/h."
+            }
+            continue
+
+        planet_name = _resolve_option(field("destination"), planet_names)
+        if planet_name is None:
+            yield {"row": row, "error": f"Unknown destination '{field('destination')}'."}
+            continue
+        planet = planets[planet_name]
+
+        try:
+            travel_date = datetime.datetime(year, today.month, today.day)
+            key = ("headless", planet.name, vehicle, velocity, travel_date)
+            quote = cache.get_or_compute(
+                key, vehicle.name, lambda: _quote_fields(planet, vehicle, velocity, travel_date)
+            )
+        except (ValueError, OverflowError) as e:
+            yield {"row": row, "error": f"Error in journey calculations: {str(e)}"}
+            continue
+
+        record = {"row": row, "name": name, "country": country}
+        record.update(quote)
+        yield record
+
+def write_results(
+    results: Iterable[Dict[str, Any]],
+    stream: TextIO,
+    output_format: str,
+    flush_every: int = 1,
+    header: bool = True
+) -> Dict[str, int]:
+    """
+    Write result records as they arrive and return ok/error counts.
+    header=False leaves out the CSV header, for parts of a larger output.
+    """
+    counts = {"ok": 0, "error": 0}
+    writer = None
+    if output_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+        if header:
+            writer.writeheader()
+    elif output_format != "jsonl":
+        raise ValueError(f"Unsupported output format '{output_format}'.")
+
+    for i, result in enumerate(results, 1):
+        counts["error" if result.get("error") else "ok"] += 1
+        if writer is not None:
+            writer.writerow(result)
+        else:
+            stream.write(json.dumps(result) + "\n")
+        if flush_every and i % flush_every == 0:
+            stream.flush()
+
+    stream.flush()
+    return counts
+
+def run_headless(
+    input_path: Optional[str] = None,
+    output_path: Optional[str] = None,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None
+) -> Dict[str, int]:
+    """Quote every request from input_path (or stdin) into output_path (or stdout)"""
+    input_format = input_format or detect_format(input_path)
+    output_format = output_format or detect_format(output_path, default=input_format)
+
+    in_stream = open(input_path, newline="") if input_path and input_path != "-" else sys.stdin
+    out_stream = open(output_path, "w", newline="") if output_path and output_path != "-" else sys.stdout
+    try:
+        return write_results(
+            quote_requests(read_requests(in_stream, input_format)),
+            out_stream,
+            output_format
+        )
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """Create the command line parser for headless mode"""
+    parser = argparse.ArgumentParser(
+        description="Quote space journeys from CSV or JSONL without interactive prompts."
+    )
+    parser.add_argument("--input", "-i", default="-",
+                        help="Request file (default: stdin)")
+    parser.add_argument("--output", "-o", default="-",
+                        help="Result file (default: stdout)")
+    parser.add_argument("--input-format", choices=FORMATS,
+                        help="Request format (default: from file extension, else jsonl)")
+    parser.add_argument("--output-format", choices=FORMATS,
+                        help="Result format (default: from file extension, else input format)")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_argument_parser().parse_args(argv)
+    counts = run_headless(args.input, args.output, args.input_format, args.output_format)
+    print(f"Quoted {counts['ok']} journeys, {counts['error']} invalid requests.", file=sys.stderr)
+    return 0 if counts["error"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
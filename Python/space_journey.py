@@ -0,0 +1,175 @@
+# Space Journey Math - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import math
+import datetime
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from space_data import PlanetaryBody, TransportationVehicle
+from space_trajectory import TrajectoryProfile, solve_trajectory, solve_vehicle_trajectory
+
+# Conversion constants shared by the scalar and batch calculation paths
+HOURS_PER_DAY = 24
+DAYS_PER_MONTH = 30.44    # Average month length
+DAYS_PER_YEAR = 365.25    # Account for leap years
+COST_PER_MILLION_KM = 1000  # Fictional rate of $1000 per million km
+RESERVATION_YEARS = 30      # How far ahead the reservation system accepts bookings
+
+# Validation rules shared by the interactive prompts and the headless mode.
+# Each returns (is_valid, validated_value) like get_input_with_validation expects.
+def validate_text(text: str) -> tuple[bool, str]:
+    """Validate a required free-text field such as a name or country"""
+    if text.strip() == "":
+        return False, ""
+    return True, text.strip()
+
+def validate_year(year_str: str, current_year: int) -> tuple[bool, int]:
+    """Validate a travel year within the reservation window"""
+    try:
+        year = int(year_str)
+        if year < current_year or year > (current_year + RESERVATION_YEARS):
+            return False, 0
+        return True, year
+    except ValueError:
+        return False, 0
+
+def validate_velocity(velocity_str: str, max_velocity: float) -> tuple[bool, float]:
+    """Validate a travel velocity against the vehicle's maximum"""
+    try:
+        velocity = float(velocity_str)
+        if not math.isfinite(velocity):
+            return False, 0
+        if velocity <= 0:
+            return False, 0
+        if velocity > max_velocity:
+            return False, 0
+        return True, velocity
+    except ValueError:
+        return False, 0
+
+def validate_choice(choice_str: str, option_count: int) -> tuple[bool, int]:
+    """Validate a 1-based menu choice"""
+    try:
+        choice = int(choice_str)
+        if choice < 1 or choice > option_count:
+            return False, 0
+        return True, choice
+    except ValueError:
+        return False, 0
+
+@dataclass
+class JourneyResult:
+    distance: float           # kilometers
+    velocity: float           # km/h
+    duration_hours: float
+    duration_days: float
+    duration_months: float
+    duration_years: float
+    whole_days: int
+    whole_hours: int
+    whole_minutes: int
+    arrival_date: datetime.datetime
+    fuel_units: float
+    journey_cost: float       # dollars
+
+def journey_duration_and_fuel(
+    distance: float,
+    velocity: float,
+    vehicle: TransportationVehicle,
+    trajectory: Optional[TrajectoryProfile] = None
+) -> Tuple[float, float]:
+    """Duration in hours and fuel units for one journey, as calculate_journey() quotes it"""
+    if trajectory is None and vehicle.acceleration is None:
+        # Perform calculation (distance / velocity)
+        return distance / velocity, distance / vehicle.fuel_efficiency
+    if trajectory is None:
+        path = solve_vehicle_trajectory(distance, velocity, vehicle.acceleration)
+    else:
+        path = solve_trajectory(distance, velocity, trajectory)
+    return path.duration_hours, path.fuel_units(vehicle.fuel_efficiency)
+
+def calculate_journey(
+    planet: PlanetaryBody,
+    vehicle: TransportationVehicle,
+    velocity: float,
+    travel_date: datetime.datetime,
+    distance: Optional[float] = None,
+    trajectory: Optional[TrajectoryProfile] = None
+) -> JourneyResult:
+    """
+    Calculate duration, arrival date, fuel and cost for a single journey.
+    
+    distance overrides the body's fixed distance_from_earth, e.g. with
+    space_ephemeris.distance_on(planet.name, travel_date).
+
+    Vehicles with an acceleration limit (or any journey given a trajectory
+    profile) accelerate, coast at the selected velocity and decelerate, see
+    space_trajectory; otherwise the whole trip is flown at the selected velocity.
+    """
+    # Extract the distance from the planetary body
+    if distance is None:
+        distance = planet.distance_from_earth
+
+    duration_hours, fuel_units = journey_duration_and_fuel(distance, velocity, vehicle, trajectory)
+
+    # Convert to various time formats for better understanding
+    duration_days = duration_hours / HOURS_PER_DAY
+    duration_months = duration_days / DAYS_PER_MONTH
+    duration_years = duration_days / DAYS_PER_YEAR
+
+    return JourneyResult(
+        distance=distance,
+        velocity=velocity,
+        duration_hours=duration_hours,
+        duration_days=duration_days,
+        duration_months=duration_months,
+        duration_years=duration_years,
+        # Format remaining hours and minutes for display
+        whole_days=math.floor(duration_days),
+        whole_hours=math.floor(duration_hours % HOURS_PER_DAY),
+        whole_minutes=math.floor((duration_hours * 60) % 60),
+        arrival_date=travel_date + datetime.timedelta(hours=duration_hours),
+        fuel_units=fuel_units,
+        journey_cost=(distance / 1000000) * COST_PER_MILLION_KM,
+    )
+
+def format_journey_report(
+    traveler_name: str,
+    country: str,
+    travel_date: datetime.datetime,
+    vehicle: TransportationVehicle,
+    planet: PlanetaryBody,
+    journey: JourneyResult
+) -> str:
+    """Render the colored journey report shown by the interactive calculator"""
+    return f"""
+\033[92m===== SPACE TRAVEL JOURNEY CALCULATION =====
+Traveler: {traveler_name}
+Country: {country}
+Travel Date: {travel_date.strftime('%Y-%m-%d')}
+
+Vehicle: {vehicle.name}
+Maximum Velocity: {vehicle.max_velocity:,.2f} km/h
+Selected Velocity: {journey.velocity:,.2f} km/h
+Fuel Efficiency: {vehicle.fuel_efficiency:,.2f} km per unit
+
+Destination: {planet.name}
+Distance: {journey.distance:,.0f} km
+
+Estimated Journey Details:
+- Duration: {journey.duration_hours:.5f} hours
+           {journey.duration_days:.5f} days
+           {journey.duration_months:.5f} months
+           {journey.duration_years:.5f} years
+
+- Plain English: Your journey to {planet.name} will take approximately
+  {journey.whole_days} days, {journey.whole_hours} hours, and {journey.whole_minutes} minutes
+  at your selected speed of {journey.velocity:,.2f} km/h.
+
+- Fuel Required: {journey.fuel_units:.2f} units
+- Estimated Arrival: {journey.arrival_date.strftime('%Y-%m-%d %H:%M')}
+- Estimated Cost: ${journey.journey_cost:,.2f}
+============================================\033[0m
+"""
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# Space Quoting Server Load Generator - Python Version
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import datetime
+from typing import List, Optional
+
+from space_data import get_all_planetary_bodies, get_all_transportation_vehicles
+
+def random_request(rng: random.Random) -> dict:
+    """A valid journey request with random vehicle, destination and velocity"""
+    vehicles = get_all_transportation_vehicles()
+    vehicle = rng.choice(list(vehicles.values()))
+    return {
+        "name": f"Traveler {rng.randint(1, 100000)}",
+        "country": "United States",
+        "year": datetime.date.today().year + rng.randint(0, 30),
+        "vehicle": vehicle.name,
+        "velocity": round(rng.uniform(1000, vehicle.max_velocity), 2),
+        "destination": rng.choice(list(get_all_planetary_bodies())),
+    }
+
+async def _client(host: str, port: int, path: str, deadline: float, batch: int,
+                  latencies: List[float], errors: List[int], seed: int) -> None:
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            if batch > 1:
+                payload = {"requests": [random_request(rng) for _ in range(batch)]}
+            else:
+                payload = random_request(rng)
+            body = json.dumps(payload).encode("utf-8")
+            request = (
+                f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode("latin-1") + body
+
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if not status_line.startswith(b"HTTP/1.1 200"):
+                errors.append(1)
+    finally:
+        writer.close()
+
+async def run_load(host: str, port: int, concurrency: int, duration: float, batch: int) -> dict:
+    """Drive the server with keep-alive clients and return throughput/latency stats"""
+    path = "/quotes" if batch > 1 else "/quote"
+    latencies: List[float] = []
+    errors: List[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _client(host, port, path, deadline, batch, latencies, errors, seed)
+        for seed in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "quotes": len(latencies) * batch,
+        "errors": len(errors),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "quotes_per_second": len(latencies) * batch / elapsed,
+        "latency_ms_p50": percentile(0.50),
+        "latency_ms_p90": percentile(0.90),
+        "latency_ms_p99": percentile(0.99),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate load against space_server.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--concurrency", type=int, default=32, help="Keep-alive connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--batch", type=int, default=1, help="Quotes per request (uses /quotes when > 1)")
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(run_load(args.host, args.port, args.concurrency, args.duration, args.batch))
+    print(json.dumps(stats, indent=2))
+    return 0 if stats["errors"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
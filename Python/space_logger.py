@@ -3,9 +3,32 @@
 # Created: May 25, 2025
 
 import os
+import re
+import gzip
+import queue
+import sys
+import shutil
+import atexit
+import contextlib
 import datetime
 import enum
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Set, Tuple, Union
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:              # Windows
+    fcntl = None
+    import msvcrt
+
+import space_metrics
+
+# Log files are kept next to this module
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class LogLevel(enum.Enum):
     DEBUG = 0
@@ -14,10 +37,495 @@ class LogLevel(enum.Enum):
     ERROR = 3
     CRITICAL = 4
 
+# Instrumentation (recorded only while space_metrics is enabled)
+# The _count series of this histogram is the number of messages per level
+_log_seconds = space_metrics.histogram(
+    "space_logger_log_seconds", "Time spent in SpaceLogger.log for emitted messages, by level"
+)
+_lines_written = space_metrics.counter(
+    "space_logger_lines_written_total", "Lines written to log files by the background writer"
+)
+_file_flush_seconds = space_metrics.histogram(
+    "space_logger_file_flush_seconds", "Time the background writer spends flushing a log file"
+)
+
+@dataclass(frozen=True)
+class LogRotation:
+    """
+    When to rotate a log file and how many rotated files to keep.
+
+    The file is rotated once it has reached max_bytes, or when a new
+    interval starts (aligned to local midnight, so 86400 rotates daily);
+    either limit can be None. Rotated files are renamed with the time of
+    rotation (SpaceTravel_Log.20261018-153000.txt) and gzipped on a
+    background thread. Only the newest backup_count are kept (0 keeps all).
+    Logs do not rotate unless given a policy.
+    """
+    max_bytes: Optional[int] = 10 * 1024 * 1024
+    interval: Optional[float] = None        # seconds
+    backup_count: int = 10
+    compress: bool = True
+
+@contextlib.contextmanager
+def _interprocess_lock(path: str, shared: bool = False) -> Iterator[None]:
+    """
+    Lock shared by every process that writes this log file: exclusive to
+    rotate it, shared to append to it. Windows has no shared locks, so
+    appends there take the exclusive lock too.
+    """
+    with open(path + ".lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue            # LK_LOCK gives up after about 10 seconds
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _interval_end(timestamp: float, interval: float) -> float:
+    """End of the rotation interval containing timestamp, aligned to local time"""
+    offset = datetime.datetime.fromtimestamp(timestamp).astimezone().utcoffset().total_seconds()
+    return ((timestamp + offset) // interval + 1) * interval - offset
+
+def _rotated_pattern(path: str) -> Pattern:
+    stem, extension = os.path.splitext(os.path.basename(path))
+    return re.compile(rf"^{re.escape(stem)}\.(\d{{8}}-\d{{6}})(?:\.(\d+))?{re.escape(extension)}(\.gz)?$")
+
+def list_rotated_logs(path: str) -> List[str]:
+    """Rotated copies of a log file (plain or gzipped), oldest first"""
+    directory = os.path.dirname(os.path.abspath(path))
+    pattern = _rotated_pattern(path)
+    rotated = []
+    for file_name in os.listdir(directory):
+        match = pattern.match(file_name)
+        if match:
+            rotated.append(((match.group(1), int(match.group(2) or 0)), os.path.join(directory, file_name)))
+    return [file_path for _, file_path in sorted(rotated)]
+
+def _prune_rotated_logs(path: str, backup_count: int) -> None:
+    if backup_count <= 0:
+        return
+    pattern = _rotated_pattern(path)
+    # A file being compressed exists both plain and gzipped; count it once
+    by_key: Dict[Tuple[str, int], List[str]] = {}
+    for file_path in list_rotated_logs(path):
+        match = pattern.match(os.path.basename(file_path))
+        by_key.setdefault((match.group(1), int(match.group(2) or 0)), []).append(file_path)
+    for key in sorted(by_key)[:-backup_count]:
+        for file_path in by_key[key]:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+# Background compression threads, waited for at exit
+_compressors: List[threading.Thread] = []
+
+def _compress_log(source: str) -> None:
+    target = source + ".gz"
+    try:
+        with open(source, "rb") as f_in, gzip.open(target + ".tmp", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        shutil.copystat(source, target + ".tmp")
+        os.replace(target + ".tmp", target)
+        os.remove(source)
+    except FileNotFoundError:
+        # Pruned by retention (possibly in another process) while compressing
+        if os.path.exists(target + ".tmp"):
+            os.remove(target + ".tmp")
+
+def _start_compression(source: str) -> None:
+    thread = threading.Thread(target=_compress_log, args=(source,), name=f"compress({os.path.basename(source)})", daemon=True)
+    thread.start()
+    _compressors[:] = [t for t in _compressors if t.is_alive()] + [thread]
+
+def wait_for_compression() -> None:
+    """Block until every rotated log started compressing in this process is gzipped"""
+    for thread in list(_compressors):
+        thread.join()
+
+atexit.register(wait_for_compression)
+
+class _LogFile:
+    """
+    Append-only handle on a log file that applies a rotation policy.
+
+    Every write is a single unbuffered append of whole lines, so several
+    processes can share the file without interleaving partial lines.
+    Rotation takes a lock file next to the log; a process that finds the
+    file already rotated by another simply reopens the new one.
+    """
+    def __init__(self, path: str, rotation: Optional[LogRotation] = None):
+        self.path = path
+        self.rotation = rotation
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab", buffering=0)
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        # Time-based rotation is measured from the newest content in the file
+        self._opened_at = stat.st_mtime if stat.st_size else time.time()
+        self._interval_end: Optional[float] = None
+
+    def _rotation_due(self, stat: os.stat_result) -> bool:
+        rotation = self.rotation
+        if not stat.st_size:
+            return False
+        if rotation.max_bytes is not None and stat.st_size >= rotation.max_bytes:
+            return True
+        if rotation.interval is not None:
+            if self._interval_end is None:
+                self._interval_end = _interval_end(self._opened_at, rotation.interval)
+            return time.time() >= self._interval_end
+        return False
+
+    def write(self, data: bytes) -> None:
+        if self.rotation is None:
+            self._file.write(data)
+            return
+        if self._rotation_due(os.fstat(self._file.fileno())):
+            self._rotate()
+        # Appends hold the lock shared, so another process cannot rename the
+        # file (and start gzipping and deleting it) between the check and
+        # the write; a file already renamed is left for the current one
+        with _interprocess_lock(self.path, shared=True):
+            if self._moved():
+                self._file.close()
+                self._open()
+            self._file.write(data)
+
+    def _moved(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        return (stat.st_dev, stat.st_ino) != self._identity
+
+    def _rotate(self) -> None:
+        rotated = None
+        with _interprocess_lock(self.path):
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and (stat.st_dev, stat.st_ino) == self._identity and self._rotation_due(stat):
+                rotated = self._rotated_path()
+                # Closed first: Windows cannot rename a file that is open
+                self._file.close()
+                try:
+                    os.rename(self.path, rotated)
+                except OSError:
+                    rotated = None      # still open elsewhere (Windows); retry later
+                self._open()
+                if rotated is not None:
+                    _prune_rotated_logs(self.path, self.rotation.backup_count)
+            else:
+                # Already rotated by another process (or deleted): follow the new file
+                self._file.close()
+                self._open()
+        if rotated is not None and self.rotation.compress:
+            _start_compression(rotated)
+
+    def _rotated_path(self) -> str:
+        stem, extension = os.path.splitext(self.path)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Several rotations in one second are numbered after the highest
+        # number in use, never into a gap left by pruning: list_rotated_logs
+        # orders them by number, and a reused one would be pruned as oldest
+        pattern = _rotated_pattern(self.path)
+        numbers = [
+            int(match.group(2) or 0)
+            for match in map(pattern.match, os.listdir(os.path.dirname(os.path.abspath(self.path))))
+            if match is not None and match.group(1) == stamp
+        ]
+        if not numbers:
+            return f"{stem}.{stamp}{extension}"
+        return f"{stem}.{stamp}.{max(numbers) + 1}{extension}"
+
+    def close(self) -> None:
+        self._file.close()
+
+class BatchedFileWriter:
+    """
+    Append lines to a file from a background thread.
+
+    The file stays open for the writer's lifetime. Lines are queued by any
+    number of threads and written in batches whenever max_batch_lines lines
+    are pending or flush_interval seconds have passed, and once more at
+    interpreter exit, when one atexit hook closes every live writer. Each
+    batch is one append of whole lines, so lines from concurrent callers
+    (or processes) never interleave. With a rotation
+    policy the writer thread also rotates the file, so logging calls never
+    wait for a rename or for gzip.
+
+    If the file cannot be opened or written (missing directory, read-only
+    install, full disk) the writer reports the error once on stderr, drops
+    further lines and stops; get_file_writer() replaces it after
+    WRITER_RETRY_SECONDS.
+    """
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        max_batch_lines: int = 1000,
+        flush_interval: float = 0.5,
+        rotation: Optional[LogRotation] = None
+    ):
+        self.path = path
+        self.max_batch_lines = max_batch_lines
+        self.flush_interval = flush_interval
+        self.rotation = rotation
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._closed = False
+        self.failed: Optional[OSError] = None
+        self._failed_at = 0.0
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"BatchedFileWriter({os.path.basename(path)})", daemon=True
+        )
+        with _live_writers_lock:
+            _live_writers.add(self)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """Queue a complete line (including its newline) for writing"""
+        if self.failed is not None:
+            return
+        if self._closed:
+            raise ValueError(f"Writer for '{self.path}' is closed.")
+        self._queue.put(line)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every line queued so far is on disk. Returns False on
+        timeout, or at once if the writer failed.
+        """
+        if self.failed is not None:
+            return False
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout) and self.failed is None
+
+    def close(self) -> None:
+        """Write out pending lines and stop the background thread"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+        _forget_writer(self)
+
+    def is_dead(self) -> bool:
+        """True once the writer can no longer write: closed, failed or its thread gone"""
+        return self._closed or not self._thread.is_alive()
+
+    def _fail(self, error: OSError, waiters: List[threading.Event]) -> None:
+        self.failed = error
+        self._failed_at = time.monotonic()
+        self._closed = True
+        _report_writer_error(self.path, error)
+        # Release everyone waiting on a flush, including flushes queued
+        # after the error
+        while True:
+            for waiter in waiters:
+                waiter.set()
+            waiters.clear()
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+
+    def _run(self) -> None:
+        try:
+            self._write_batches()
+        finally:
+            # However the thread ends, loggers holding this writer see it as
+            # closed and fetch a replacement from get_file_writer()
+            self._closed = True
+            _forget_writer(self)
+
+    def _write_batches(self) -> None:
+        try:
+            log = _LogFile(self.path, self.rotation)
+        except OSError as e:
+            self._fail(e, [])
+            return
+        batch: List[str] = []
+        waiters: List[threading.Event] = []
+        last_flush = time.monotonic()
+        stopping = False
+
+        try:
+            while not stopping:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                # Drain whatever else is already queued without blocking
+                while item is not None:
+                    if item is self._STOP:
+                        stopping = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+                        if len(batch) >= self.max_batch_lines:
+                            break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        item = None
+
+                if (
+                    len(batch) >= self.max_batch_lines or waiters or stopping
+                    or time.monotonic() - last_flush >= self.flush_interval
+                ):
+                    if batch:
+                        flush_started = time.perf_counter()
+                        log.rotation = self.rotation
+                        try:
+                            log.write("".join(batch).encode("utf-8"))
+                        except OSError as e:
+                            self._fail(e, waiters)
+                            return
+                        if space_metrics.enabled:
+                            _file_flush_seconds.observe(time.perf_counter() - flush_started)
+                            _lines_written.inc(len(batch))
+                        batch.clear()
+                    last_flush = time.monotonic()
+                    for waiter in waiters:
+                        waiter.set()
+                    waiters.clear()
+        finally:
+            log.close()
+
+# One writer per log file, shared by every logger that writes to it
+_writers: Dict[str, BatchedFileWriter] = {}
+_writers_lock = threading.Lock()
+
+# Writers whose thread is still running, closed together at interpreter exit
+_live_writers: Set[BatchedFileWriter] = set()
+_live_writers_lock = threading.Lock()
+
+def _forget_writer(writer: BatchedFileWriter) -> None:
+    with _live_writers_lock:
+        _live_writers.discard(writer)
+
+def _close_live_writers() -> None:
+    with _live_writers_lock:
+        writers = list(_live_writers)
+    for writer in writers:
+        writer.close()
+
+# Registered after wait_for_compression, so it runs first and files rotated
+# by the final batches are still compressed
+atexit.register(_close_live_writers)
+
+# A failed writer is replaced (and the file tried again) no sooner than this
+WRITER_RETRY_SECONDS = 5.0
+_reported_errors: Set[Tuple[str, str]] = set()
+
+def _report_writer_error(path: str, error: OSError) -> None:
+    """Print a log file error to stderr, once per file and error"""
+    key = (path, str(error))
+    if key in _reported_errors:
+        return
+    _reported_errors.add(key)
+    print(f"SpaceLogger: cannot write '{path}': {error}. Messages for it are dropped.", file=sys.stderr)
+
+def get_file_writer(path: str, rotation: Optional[LogRotation] = None) -> BatchedFileWriter:
+    """
+    Return the shared background writer for a log file path, applying
+    rotation to it if given (the writer keeps its current policy otherwise).
+    SpaceLogger keeps the writer it gets and only calls this again once
+    that writer has closed, so log calls skip the path lookup and the lock.
+    """
+    path = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None or (
+            writer.is_dead()
+            and (writer.failed is None or time.monotonic() - writer._failed_at >= WRITER_RETRY_SECONDS)
+        ):
+            writer = BatchedFileWriter(path, rotation=rotation)
+            _writers[path] = writer
+        elif rotation is not None and writer.rotation is not rotation:
+            writer.rotation = rotation
+        return writer
+
+def flush_file_writers(timeout: Optional[float] = None) -> None:
+    """Flush every background log file writer"""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush(timeout)
+
+# Per-level series, bound once so log() does no label handling
+_LEVEL_SERIES = {level: _log_seconds.labels(level=level.name) for level in LogLevel}
+
+# Log file formats: "text" lines ([2026-10-18 15:30:00] [INFO    ] message), or
+# "jsonl" objects that always start {"time": "2026-10-18 15:30:00", "level": ...
+# Both keep a fixed-width, sortable timestamp at a fixed offset, which is what
+# lets space_logquery binary-search a log by time.
+LOG_FORMATS = ("text", "jsonl")
+
+# Longest SpaceLogger.flush() waits for the background writer by default
+FLUSH_TIMEOUT = 10.0
+
+# Messages can be plain strings, %-style templates with args, or callables
+# that build the string only if the message is actually emitted
+Message = Union[str, Callable[[], str]]
+
 class SpaceLogger:
-    def __init__(self, log_to_file: bool = False, log_file: str = "SpaceTravel_Log.txt"):
-        self.log_to_file = log_to_file
+    def __init__(
+        self,
+        log_to_file: bool = False,
+        log_file: str = "SpaceTravel_Log.txt",
+        log_to_console: bool = True,
+        background: bool = True,
+        min_level: LogLevel = LogLevel.DEBUG,
+        console_level: LogLevel = LogLevel.DEBUG,
+        file_level: LogLevel = LogLevel.DEBUG,
+        rotation: Optional[LogRotation] = None,
+        log_format: str = "text"
+    ):
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format '{log_format}'. Choose one of: {', '.join(LOG_FORMATS)}.")
+        self.log_format = log_format
+        self._log_to_file = log_to_file
+        self._log_to_console = log_to_console
+        self._min_level = min_level
+        self._console_level = console_level
+        self._file_level = file_level
+        self._update_thresholds()
+        # Background writer for log_file_path, kept until it closes; changing
+        # the file or the rotation policy drops it
+        self._writer: Optional[BatchedFileWriter] = None
         self.log_file = log_file
+        self.background = background
+        # Rotation policy for the log file (None lets it grow without limit)
+        self.rotation = rotation
+        
+        # Timestamp string cached for the current second
+        self._timestamp_cache = (-1, "")
         
         # Colors for terminal output (ANSI color codes)
         self.colors = {
@@ -29,68 +537,224 @@ class SpaceLogger:
             "RESET": "\033[0m"              # Reset color
         }
     
-    def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
-        """Log a message with the specified level"""
+    def _update_thresholds(self) -> None:
+        # Precompute the lowest level each sink accepts so log() only compares ints
+        disabled = LogLevel.CRITICAL.value + 1
+        self._console_threshold = (
+            max(self._min_level.value, self._console_level.value) if self._log_to_console else disabled
+        )
+        self._file_threshold = (
+            max(self._min_level.value, self._file_level.value) if self._log_to_file else disabled
+        )
+        self._threshold = min(self._console_threshold, self._file_threshold)
+    
+    @property
+    def log_to_file(self) -> bool:
+        return self._log_to_file
+    
+    @log_to_file.setter
+    def log_to_file(self, enabled: bool) -> None:
+        self._log_to_file = enabled
+        self._update_thresholds()
+    
+    @property
+    def log_to_console(self) -> bool:
+        return self._log_to_console
+    
+    @log_to_console.setter
+    def log_to_console(self, enabled: bool) -> None:
+        self._log_to_console = enabled
+        self._update_thresholds()
+    
+    @property
+    def min_level(self) -> LogLevel:
+        """Minimum level for the logger as a whole"""
+        return self._min_level
+    
+    @min_level.setter
+    def min_level(self, level: LogLevel) -> None:
+        self._min_level = level
+        self._update_thresholds()
+    
+    @property
+    def console_level(self) -> LogLevel:
+        """Minimum level printed to the console"""
+        return self._console_level
+    
+    @console_level.setter
+    def console_level(self, level: LogLevel) -> None:
+        self._console_level = level
+        self._update_thresholds()
+    
+    @property
+    def file_level(self) -> LogLevel:
+        """Minimum level written to the log file"""
+        return self._file_level
+    
+    @file_level.setter
+    def file_level(self, level: LogLevel) -> None:
+        self._file_level = level
+        self._update_thresholds()
+    
+    @property
+    def log_file(self) -> str:
+        return self._log_file
+
+    @log_file.setter
+    def log_file(self, log_file: str) -> None:
+        # Resolve the path once instead of on every log call
+        self._log_file = log_file
+        self.log_file_path = os.path.join(_SCRIPT_DIR, log_file)
+        self._writer = None
+
+    @property
+    def rotation(self) -> Optional[LogRotation]:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, rotation: Optional[LogRotation]) -> None:
+        self._rotation = rotation
+        self._writer = None
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Return True if a message at this level would be emitted anywhere"""
+        return level.value >= self._threshold
+    
+    def _timestamp(self) -> str:
+        """Return the formatted current time, calling strftime at most once per second"""
+        now = time.time()
+        second = int(now)
+        cached_second, cached = self._timestamp_cache
+        if second != cached_second:
+            cached = datetime.datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            self._timestamp_cache = (second, cached)
+        return cached
+    
+    def log(self, message: Message, level: LogLevel = LogLevel.INFO, *args: Any) -> None:
+        """
+        Log a message with the specified level.
+        
+        Formatting is deferred until the level check passes: args are applied
+        %-style and a callable message is only called when it will be emitted.
+        """
+        if level.value < self._threshold:
+            return
+        started = time.perf_counter() if space_metrics.enabled else None
+        
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+        
         # Create timestamp
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp()
         
         # Format the log message
         level_str = level.name.ljust(8)
         formatted_message = f"[{timestamp}] [{level_str}] {message}"
         
         # Print to console with color
-        color = self.colors.get(level, self.colors[LogLevel.INFO])
-        print(f"{color}{formatted_message}{self.colors['RESET']}")
+        if level.value >= self._console_threshold:
+            color = self.colors.get(level, self.colors[LogLevel.INFO])
+            print(f"{color}{formatted_message}{self.colors['RESET']}")
         
         # Write to file if requested
-        if self.log_to_file:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            log_file_path = os.path.join(script_dir, self.log_file)
-            
-            with open(log_file_path, "a") as f:
-                f.write(f"{formatted_message}\n")
-    
-    def debug(self, message: str) -> None:
+        if level.value >= self._file_threshold:
+            if self.log_format == "jsonl":
+                line = (
+                    f'{{"time": "{timestamp}", "level": "{level.name}", '
+                    f'"message": {encode_basestring(str(message))}}}\n'
+                )
+            else:
+                line = f"{formatted_message}\n"
+            if self.background:
+                writer = self._writer
+                if writer is None or writer._closed:
+                    writer = self._writer = get_file_writer(self.log_file_path, self._rotation)
+                writer.write(line)
+            else:
+                log = _LogFile(self.log_file_path, self.rotation)
+                try:
+                    log.write(line.encode("utf-8"))
+                finally:
+                    log.close()
+        
+        if started is not None:
+            _LEVEL_SERIES[level].observe(time.perf_counter() - started)
+    
+    def flush(self, timeout: Optional[float] = FLUSH_TIMEOUT) -> bool:
+        """
+        Make sure every message logged so far has reached the log file.
+        Returns False if that did not happen within timeout seconds.
+        """
+        writer = self._writer
+        if self.log_to_file and self.background and writer is not None:
+            return writer.flush(timeout)
+        return True
+    
+    def debug(self, message: Message, *args: Any) -> None:
         """Log a debug message"""
-        self.log(message, LogLevel.DEBUG)
+        if LogLevel.DEBUG.value >= self._threshold:
+            self.log(message, LogLevel.DEBUG, *args)
     
-    def info(self, message: str) -> None:
+    def info(self, message: Message, *args: Any) -> None:
         """Log an info message"""
-        self.log(message, LogLevel.INFO)
+        if LogLevel.INFO.value >= self._threshold:
+            self.log(message, LogLevel.INFO, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: Message, *args: Any) -> None:
         """Log a warning message"""
-        self.log(message, LogLevel.WARNING)
+        if LogLevel.WARNING.value >= self._threshold:
+            self.log(message, LogLevel.WARNING, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: Message, *args: Any) -> None:
         """Log an error message"""
-        self.log(message, LogLevel.ERROR)
+        if LogLevel.ERROR.value >= self._threshold:
+            self.log(message, LogLevel.ERROR, *args)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: Message, *args: Any) -> None:
         """Log a critical message"""
-        self.log(message, LogLevel.CRITICAL)
+        if LogLevel.CRITICAL.value >= self._threshold:
+            self.log(message, LogLevel.CRITICAL, *args)
 
 # Create a default logger instance
 default_logger = SpaceLogger()
 
 # Functions to use the default logger
-def debug(message: str) -> None:
-    default_logger.debug(message)
+def debug(message: Message, *args: Any) -> None:
+    default_logger.debug(message, *args)
 
-def info(message: str) -> None:
-    default_logger.info(message)
+def info(message: Message, *args: Any) -> None:
+    default_logger.info(message, *args)
 
-def warning(message: str) -> None:
-    default_logger.warning(message)
+def warning(message: Message, *args: Any) -> None:
+    default_logger.warning(message, *args)
 
-def error(message: str) -> None:
-    default_logger.error(message)
+def error(message: Message, *args: Any) -> None:
+    default_logger.error(message, *args)
 
-def critical(message: str) -> None:
-    default_logger.critical(message)
+def critical(message: Message, *args: Any) -> None:
+    default_logger.critical(message, *args)
 
 # Enable file logging
-def enable_file_logging(log_file: Optional[str] = None) -> None:
+def enable_file_logging(log_file: Optional[str] = None, log_format: Optional[str] = None) -> None:
     default_logger.log_to_file = True
     if log_file:
         default_logger.log_file = log_file
+    if log_format:
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format '{log_format}'. Choose one of: {', '.join(LOG_FORMATS)}.")
+        default_logger.log_format = log_format
+
+# Adjust the default logger's thresholds
+def set_level(
+    min_level: Optional[LogLevel] = None,
+    console_level: Optional[LogLevel] = None,
+    file_level: Optional[LogLevel] = None
+) -> None:
+    if min_level is not None:
+        default_logger.min_level = min_level
+    if console_level is not None:
+        default_logger.console_level = console_level
+    if file_level is not None:
+        default_logger.file_level = file_level
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# Space Log Query - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import re
+import sys
+import gzip
+import json
+import mmap
+import argparse
+import datetime
+from dataclasses import dataclass, asdict
+from typing import BinaryIO, Collection, Iterator, List, Optional, Tuple
+
+from space_logger import LogLevel, list_rotated_logs
+
+DEFAULT_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SpaceTravel_Log.txt")
+
+# Timestamps are "YYYY-MM-DD HH:MM:SS" at a fixed offset in both formats:
+#   [2026-10-18 15:30:00] [INFO    ] message
+#   {"time": "2026-10-18 15:30:00", "level": "INFO", "message": "..."}
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIMESTAMP_WIDTH = 19
+_TEXT_TIMESTAMP = slice(1, 1 + TIMESTAMP_WIDTH)
+_JSONL_PREFIX = b'{"time": "'
+_JSONL_TIMESTAMP = slice(len(_JSONL_PREFIX), len(_JSONL_PREFIX) + TIMESTAMP_WIDTH)
+_TEXT_LINE = re.compile(rb"^\[(.{19})\] \[(\w+)\s*\] ?(.*)$", re.DOTALL)
+
+# Lines from concurrent writers (threads batching, or several processes) are
+# only nearly in time order; a search starts this many seconds early and a
+# scan runs this many seconds past the end of the range before stopping
+DEFAULT_SKEW = 5.0
+
+@dataclass
+class LogEntry:
+    time: str
+    level: str
+    message: str
+    path: str
+    offset: int           # byte offset of the line in an uncompressed file
+
+def _line_timestamp(line: bytes) -> Optional[bytes]:
+    """The timestamp of a log line, or None for lines without one"""
+    if line.startswith(b"["):
+        stamp = line[_TEXT_TIMESTAMP]
+    elif line.startswith(_JSONL_PREFIX):
+        stamp = line[_JSONL_TIMESTAMP]
+    else:
+        return None
+    return stamp if len(stamp) == TIMESTAMP_WIDTH and stamp[4:5] == b"-" else None
+
+def parse_line(line: bytes, path: str = "", offset: int = 0) -> Optional[LogEntry]:
+    """Parse one text or JSONL log line (without its newline); None if it is neither"""
+    if line.startswith(_JSONL_PREFIX):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        return LogEntry(record.get("time", ""), record.get("level", ""), str(record.get("message", "")), path, offset)
+    match = _TEXT_LINE.match(line)
+    if match is None:
+        return None
+    time_text, level, message = (part.decode("utf-8", "replace") for part in match.groups())
+    return LogEntry(time_text, level, message, path, offset)
+
+def parse_time(value: str) -> str:
+    """
+    Normalize a user-supplied time ("2026-10-18", "2026-10-18 15:00",
+    "2026-10-18T15:00:30") to the log's timestamp format
+    """
+    value = value.strip().replace("T", " ")
+    for pattern in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d %H", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(value, pattern).strftime(TIMESTAMP_FORMAT)
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid time '{value}'. Use YYYY-MM-DD[ HH:MM[:SS]].")
+
+def _shift(timestamp: str, seconds: float) -> bytes:
+    shifted = datetime.datetime.strptime(timestamp, TIMESTAMP_FORMAT) + datetime.timedelta(seconds=seconds)
+    return shifted.strftime(TIMESTAMP_FORMAT).encode()
+
+def _timestamp_at(data: mmap.mmap, start: int, floor: int) -> bytes:
+    """
+    Timestamp of the line starting at start. Continuation lines (a text
+    message containing newlines) take the timestamp of the line they belong
+    to; nothing before floor is examined.
+    """
+    while True:
+        end = data.find(b"\n", start)
+        stamp = _line_timestamp(data[start:end if end >= 0 else len(data)])
+        if stamp is not None or start <= floor:
+            return stamp or b""
+        start = data.rfind(b"\n", floor, start - 1) + 1
+        start = max(start, floor)
+
+def find_offset(data: mmap.mmap, timestamp: bytes) -> int:
+    """
+    Byte offset of the first line stamped at or after timestamp, by binary
+    search over the mapped file; only the pages of the probed lines are read
+    """
+    low, high = 0, len(data)
+    while low < high:
+        middle = (low + high) // 2
+        line_start = data.rfind(b"\n", low, middle) + 1 if middle > low else low
+        line_start = max(line_start, low)
+        if _timestamp_at(data, line_start, low) < timestamp:
+            line_end = data.find(b"\n", middle)
+            low = line_end + 1 if line_end >= 0 else len(data)
+        else:
+            high = line_start
+    return low
+
+def _matches(
+    entry: LogEntry,
+    since: Optional[str],
+    until: Optional[str],
+    levels: Optional[Collection[str]],
+    contains: Optional[str],
+    ignore_case: bool
+) -> bool:
+    if since is not None and entry.time < since:
+        return False
+    if until is not None and entry.time >= until:
+        return False
+    if levels is not None and entry.level not in levels:
+        return False
+    if contains is not None:
+        message = entry.message.lower() if ignore_case else entry.message
+        if contains not in message:
+            return False
+    return True
+
+def _scan_lines(stream: BinaryIO, start: int = 0) -> Iterator[Tuple[int, bytes]]:
+    offset = start
+    for line in stream:
+        yield offset, line.rstrip(b"\r\n")
+        offset += len(line)
+
+def _mapped_lines(data: mmap.mmap, start: int) -> Iterator[Tuple[int, bytes]]:
+    position = start
+    size = len(data)
+    while position < size:
+        end = data.find(b"\n", position)
+        if end < 0:
+            end = size
+        yield position, data[position:end].rstrip(b"\r")
+        position = end + 1
+
+def _rotation_time(path: str) -> Optional[str]:
+    # Rotated files are named <stem>.YYYYmmdd-HHMMSS[.n]<ext>[.gz] after the time
+    # they were rotated, which bounds the newest entry they can hold
+    match = re.search(r"\.(\d{8}-\d{6})(?:\.\d+)?\.[^.]+(?:\.gz)?$", os.path.basename(path))
+    if match is None:
+        return None
+    return datetime.datetime.strptime(match.group(1), "%Y%m%d-%H%M%S").strftime(TIMESTAMP_FORMAT)
+
+def query_file(
+    path: str,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    levels: Optional[Collection[str]] = None,
+    contains: Optional[str] = None,
+    ignore_case: bool = False,
+    skew: float = DEFAULT_SKEW
+) -> Iterator[LogEntry]:
+    """
+    Yield the entries of one log file that match every given filter.
+
+    since is inclusive and until exclusive, both in TIMESTAMP_FORMAT.
+    Uncompressed files are memory-mapped and the start of the time range is
+    found by binary search; gzipped (rotated) files are streamed.
+    """
+    if ignore_case and contains is not None:
+        contains = contains.lower()
+    stop = _shift(until, skew) if until is not None else None
+    since_stamp = since.encode() if since is not None else None
+
+    def select(lines: Iterator[Tuple[int, bytes]]) -> Iterator[LogEntry]:
+        # An entry is held back until the next stamped line, in case it is a
+        # multi-line text message whose continuation lines follow
+        pending: Optional[LogEntry] = None
+        for offset, line in lines:
+            stamp = _line_timestamp(line)
+            if stamp is None:
+                if pending is not None:
+                    pending.message += "\n" + line.decode("utf-8", "replace")
+                continue
+            if pending is not None and _matches(pending, since, until, levels, contains, ignore_case):
+                yield pending
+            pending = None
+            if stop is not None and stamp > stop:
+                return
+            if since_stamp is None or stamp >= since_stamp:
+                pending = parse_line(line, path, offset)
+        if pending is not None and _matches(pending, since, until, levels, contains, ignore_case):
+            yield pending
+
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as stream:
+            yield from select(_scan_lines(stream))
+        return
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = find_offset(data, _shift(since, -skew)) if since is not None else 0
+            yield from select(_mapped_lines(data, start))
+
+def query_log(
+    path: str = DEFAULT_LOG_FILE,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    levels: Optional[Collection[str]] = None,
+    contains: Optional[str] = None,
+    ignore_case: bool = False,
+    include_rotated: bool = False,
+    skew: float = DEFAULT_SKEW
+) -> Iterator[LogEntry]:
+    """
+    Yield matching entries from a log file, oldest first, optionally
+    including its rotated (possibly gzipped) predecessors. Rotated files
+    rotated before the range starts are skipped without being opened.
+    """
+    paths: List[str] = []
+    if include_rotated:
+        floor = _shift(since, -skew).decode() if since is not None else None
+        for rotated in list_rotated_logs(path):
+            rotated_at = _rotation_time(rotated)
+            if floor is None or rotated_at is None or rotated_at >= floor:
+                paths.append(rotated)
+    if os.path.exists(path):
+        paths.append(path)
+    for file_path in paths:
+        yield from query_file(file_path, since, until, levels, contains, ignore_case, skew)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Search SpaceLogger logs (text or JSONL) by time range, level and message text."
+    )
+    parser.add_argument("logs", nargs="*", default=[DEFAULT_LOG_FILE], help="Log files (default: SpaceTravel_Log.txt)")
+    parser.add_argument("--since", help="Earliest time, inclusive (YYYY-MM-DD[ HH:MM[:SS]])")
+    parser.add_argument("--until", help="Latest time, exclusive (YYYY-MM-DD[ HH:MM[:SS]])")
+    parser.add_argument(
+        "--level", action="append", choices=[level.name for level in LogLevel],
+        help="Only this level (repeatable)"
+    )
+    parser.add_argument(
+        "--min-level", choices=[level.name for level in LogLevel], help="Only this level and above"
+    )
+    parser.add_argument("--contains", help="Only messages containing this text")
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="Case-insensitive --contains")
+    parser.add_argument("--rotated", action="store_true", help="Also search rotated and gzipped copies of each log")
+    parser.add_argument("--json", action="store_true", help="Print matches as JSON lines")
+    parser.add_argument("--count", action="store_true", help="Print only the number of matches")
+    parser.add_argument(
+        "--skew", type=float, default=DEFAULT_SKEW,
+        help="Seconds of out-of-order writes to tolerate at the range edges (default: 5)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        since = parse_time(args.since) if args.since else None
+        until = parse_time(args.until) if args.until else None
+    except ValueError as e:
+        parser.error(str(e))
+
+    levels = set(args.level) if args.level else None
+    if args.min_level:
+        minimum = LogLevel[args.min_level].value
+        at_least = {level.name for level in LogLevel if level.value >= minimum}
+        levels = levels & at_least if levels is not None else at_least
+
+    count = 0
+    for log in args.logs:
+        for entry in query_log(log, since, until, levels, args.contains, args.ignore_case, args.rotated, args.skew):
+            count += 1
+            if args.count:
+                continue
+            if args.json:
+                print(json.dumps(asdict(entry), ensure_ascii=False))
+            else:
+                print(f"[{entry.time}] [{entry.level.ljust(8)}] {entry.message}")
+    if args.count:
+        print(count)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+# Space Metrics - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import time
+import atexit
+import bisect
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Instrumentation is off unless enabled here or with SPACE_METRICS=1 (or by
+# naming an export file in SPACE_METRICS_FILE). Instrumented code checks
+# `space_metrics.enabled` before doing any work, so the disabled cost is one
+# attribute read.
+enabled = False
+
+# Latency buckets in seconds, 1 us to 10 s
+DEFAULT_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+class Counter:
+    """Monotonically increasing count, optionally split by labels"""
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str = ""):
+        self.name = name
+        self.help_text = help_text
+        # Per label set: a one-element list, so bound series can update it in place
+        self._values: Dict[LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, key: LabelKey) -> List[float]:
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0]
+            return series
+
+    def labels(self, **labels: str) -> "CounterSeries":
+        """Series bound to one label set, for hot paths that always use the same labels"""
+        return CounterSeries(self, self._series(_label_key(labels)))
+
+    def inc(self, amount: float = 1, labels: Optional[Dict[str, str]] = None) -> None:
+        series = self._series(_label_key(labels))
+        with self._lock:
+            series[0] += amount
+
+    def clear(self) -> None:
+        with self._lock:
+            for series in self._values.values():
+                series[0] = 0
+
+    def value(self, labels: Optional[Dict[str, str]] = None) -> float:
+        series = self._values.get(_label_key(labels))
+        return series[0] if series else 0
+
+    def _items(self) -> List[Tuple[LabelKey, float]]:
+        with self._lock:
+            return [(key, series[0]) for key, series in self._values.items() if series[0]]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [{"labels": dict(key), "value": value} for key, value in self._items()]
+
+    def prometheus_lines(self) -> Iterator[str]:
+        for key, value in self._items():
+            yield f"{self.name}{_format_labels(key)} {value:g}"
+
+class CounterSeries:
+    __slots__ = ("_lock", "_series")
+
+    def __init__(self, metric: Counter, series: List[float]):
+        self._lock = metric._lock
+        self._series = series
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._series[0] += amount
+
+# Observations are appended to a pending list (atomic under the GIL) and
+# folded into the bucket counts in batches, so observing takes no lock
+FOLD_BATCH = 256
+
+class Histogram:
+    """Distribution of observed values (latencies in seconds) over fixed buckets"""
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (+Inf last), count, sum, pending observations]
+        self._values: Dict[LabelKey, list] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, key: LabelKey) -> list:
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0, 0.0, []]
+            return series
+
+    def _fold(self, series: list) -> None:
+        with self._lock:
+            pending = series[3]
+            count = len(pending)
+            values = pending[:count]
+            # Only the folded prefix is removed; concurrent appends stay pending
+            del pending[:count]
+            counts = series[0]
+            buckets = self.buckets
+            for value in values:
+                counts[bisect.bisect_left(buckets, value)] += 1
+            series[1] += count
+            series[2] += sum(values)
+
+    def labels(self, **labels: str) -> "HistogramSeries":
+        """Series bound to one label set, for hot paths that always use the same labels"""
+        return HistogramSeries(self, self._series(_label_key(labels)))
+
+    def observe(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        series = self._series(_label_key(labels))
+        series[3].append(value)
+        if len(series[3]) >= FOLD_BATCH:
+            self._fold(series)
+
+    def clear(self) -> None:
+        with self._lock:
+            for series in self._values.values():
+                series[0][:] = [0] * len(series[0])
+                series[1] = 0
+                series[2] = 0.0
+                series[3].clear()
+
+    def _items(self) -> List[Tuple[LabelKey, List[int], int, float]]:
+        with self._lock:
+            all_series = list(self._values.items())
+        for _, series in all_series:
+            self._fold(series)
+        with self._lock:
+            return [(key, list(series[0]), series[1], series[2]) for key, series in all_series if series[1]]
+
+    def count(self, labels: Optional[Dict[str, str]] = None) -> int:
+        key = _label_key(labels)
+        return next((count for item_key, _, count, _ in self._items() if item_key == key), 0)
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> float:
+        rank = q * total
+        seen = 0
+        for i, bucket_count in enumerate(counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def quantile(self, q: float, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket (None if empty)"""
+        key = _label_key(labels)
+        for item_key, counts, count, _ in self._items():
+            if item_key == key:
+                return self._quantile(counts, count, q)
+        return None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "labels": dict(key),
+                "count": count,
+                "sum": total,
+                "mean": total / count,
+                "p50": self._quantile(counts, count, 0.50),
+                "p90": self._quantile(counts, count, 0.90),
+                "p99": self._quantile(counts, count, 0.99),
+                "buckets": {str(bound): n for bound, n in zip(self.buckets + (float("inf"),), counts)},
+            }
+            for key, counts, count, total in self._items()
+        ]
+
+    def prometheus_lines(self) -> Iterator[str]:
+        for key, counts, count, total in self._items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {cumulative}"
+            yield f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {count}"
+            yield f"{self.name}_sum{_format_labels(key)} {total:.9g}"
+            yield f"{self.name}_count{_format_labels(key)} {count}"
+
+class HistogramSeries:
+    __slots__ = ("_metric", "_series", "_pending")
+
+    def __init__(self, metric: Histogram, series: list):
+        self._metric = metric
+        self._series = series
+        self._pending = series[3]
+
+    def observe(self, value: float) -> None:
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= FOLD_BATCH:
+            self._metric._fold(self._series)
+
+# Every metric created through counter()/histogram(), by name
+_registry: Dict[str, Any] = {}
+_registry_lock = threading.Lock()
+
+def counter(name: str, help_text: str = "") -> Counter:
+    """Get or create the counter with this name"""
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = Counter(name, help_text)
+        return metric
+
+def histogram(name: str, help_text: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    """Get or create the histogram with this name"""
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = Histogram(name, help_text, buckets)
+        return metric
+
+class _Span:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Optional[Dict[str, str]]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, self.labels)
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+def span(name: str, labels: Optional[Dict[str, str]] = None, help_text: str = ""):
+    """
+    Time a block into the histogram `name` (seconds):
+
+        with space_metrics.span("space_journey_calculation_seconds"):
+            ...
+
+    Returns a shared no-op context manager while instrumentation is disabled.
+    """
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(histogram(name, help_text), labels)
+
+def enable() -> None:
+    """Start recording metrics"""
+    global enabled
+    enabled = True
+
+def disable() -> None:
+    """Stop recording metrics (already recorded values are kept)"""
+    global enabled
+    enabled = False
+
+def reset() -> None:
+    """Zero every metric (metrics stay registered)"""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.clear()
+
+def snapshot() -> Dict[str, Any]:
+    """All metrics as a JSON-serializable dict"""
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda metric: metric.name)
+    return {
+        "created": time.time(),
+        "metrics": {
+            metric.name: {"type": metric.kind, "help": metric.help_text, "series": metric.snapshot()}
+            for metric in metrics
+        },
+    }
+
+def prometheus_text() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda metric: metric.name)
+    lines: List[str] = []
+    for metric in metrics:
+        if metric.help_text:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.prometheus_lines())
+    return "\n".join(lines) + "\n"
+
+def write_metrics(path: str) -> str:
+    """
+    Write all metrics to path: a JSON snapshot for .json files, Prometheus
+    text otherwise. The file is replaced atomically so scrapers never read a
+    partial export.
+    """
+    if path.endswith(".json"):
+        import json
+        content = json.dumps(snapshot(), indent=2)
+    else:
+        content = prometheus_text()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        f.write(content)
+    os.replace(temporary, path)
+    return path
+
+# Environment switches for scripts that are not otherwise configured
+METRICS_FILE = os.environ.get("SPACE_METRICS_FILE")
+if os.environ.get("SPACE_METRICS", "").lower() in ("1", "true", "yes") or METRICS_FILE:
+    enable()
+if METRICS_FILE:
+    atexit.register(write_metrics, METRICS_FILE)
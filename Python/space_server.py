@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# Space Journey Quoting Server - Python Version
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import sys
+import json
+import asyncio
+import argparse
+from dataclasses import asdict
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from space_logger import SpaceLogger, LogLevel
+from space_headless import quote_requests
+from quote_cache import get_quote_cache
+import space_metrics
+
+# Requests larger than this are rejected instead of being read into memory
+MAX_BODY_BYTES = 1024 * 1024
+MAX_BATCH_SIZE = 10000
+
+# File-only logger: lines are queued to the background writer thread, so
+# logging never performs file I/O on the event loop
+logger = SpaceLogger(log_to_file=True, log_to_console=False, file_level=LogLevel.INFO)
+
+def _quote_one(request: Any) -> Dict[str, Any]:
+    if not isinstance(request, dict):
+        return {"row": 1, "error": "Each journey request must be a JSON object."}
+    return next(quote_requests([request]))
+
+def route(method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Any]:
+    """Dispatch one HTTP request and return (status, JSON-serializable payload)"""
+    if path == "/health":
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use GET."}
+        return HTTPStatus.OK, {"status": "ok", "quote_cache": asdict(get_quote_cache().stats())}
+
+    if path == "/metrics":
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use GET."}
+        return HTTPStatus.OK, space_metrics.snapshot()
+
+    if path not in ("/quote", "/quotes"):
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{path}'."}
+    if method != "POST":
+        return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST."}
+
+    try:
+        payload = json.loads(body or b"null")
+    except json.JSONDecodeError as e:
+        return HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e.msg}"}
+
+    if path == "/quote":
+        result = _quote_one(payload)
+        logger.info("Quote %s -> %s", payload.get("destination") if isinstance(payload, dict) else None,
+                    result.get("error") or "ok")
+        return (HTTPStatus.UNPROCESSABLE_ENTITY if result.get("error") else HTTPStatus.OK), result
+
+    requests = payload.get("requests") if isinstance(payload, dict) else payload
+    if not isinstance(requests, list):
+        return HTTPStatus.BAD_REQUEST, {"error": "Expected a list of requests or {\"requests\": [...]}."}
+    if len(requests) > MAX_BATCH_SIZE:
+        return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": f"Batches are limited to {MAX_BATCH_SIZE} requests."}
+
+    if all(isinstance(request, dict) for request in requests):
+        results = list(quote_requests(requests))
+    else:
+        results = [dict(_quote_one(request), row=row) for row, request in enumerate(requests, 1)]
+    errors = sum(1 for result in results if result.get("error"))
+    logger.info("Batch of %d quotes, %d invalid", len(results), errors)
+    return HTTPStatus.OK, {"results": results}
+
+def _response(status: HTTPStatus, payload: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve HTTP/1.1 requests on one connection until the client closes it"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(_response(HTTPStatus.BAD_REQUEST, {"error": "Malformed request line."}, False))
+                break
+
+            headers: Dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+            length = int(headers.get("content-length") or 0)
+            if length > MAX_BODY_BYTES:
+                writer.write(_response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large."}, False))
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            path = target.split("?", 1)[0]
+            try:
+                with space_metrics.span("space_server_request_seconds", {"path": path}):
+                    status, payload = route(method, path, body)
+            except Exception as e:
+                logger.error("Error handling %s %s: %s", method, target, e)
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(host: str = "127.0.0.1", port: int = 8080) -> None:
+    """Run the quoting server until cancelled"""
+    server = await asyncio.start_server(handle_connection, host, port, backlog=1024)
+    logger.info("Space quoting server listening on %s:%d", host, port)
+    print(f"Space quoting server listening on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        logger.info("Space quoting server stopped")
+        logger.flush()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve space journey quotes over HTTP on localhost.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--metrics", action="store_true", help="Record metrics and serve them on GET /metrics")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        space_metrics.enable()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
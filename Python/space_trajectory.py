@@ -0,0 +1,436 @@
+# Space Trajectory Profiles - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from space_data import TransportationVehicle
+
+# Accelerations are given in m/s² and converted to the km and hours used by
+# the journey math: 1 m/s² = 3.6 km/h gained per second = 12,960 km/h²
+KMH2_PER_MS2 = 3600 * 3600 / 1000
+
+# Burns use fuel at this multiple of the cruising rate per km
+BURN_FUEL_FACTOR = 2.0
+
+# Relative tolerance of the adaptive integrator, per step
+INTEGRATION_TOLERANCE = 1e-10
+MAX_INTEGRATION_ROUNDS = 60
+
+# Scalar results kept by solve_trajectory(), and integrated thrust tables
+TRAJECTORY_CACHE_SIZE = 4096
+THRUST_TABLE_CACHE_SIZE = 64
+
+ThrustCurve = Callable[[np.ndarray], np.ndarray]
+
+@dataclass(frozen=True)
+class TrajectoryProfile:
+    """
+    Accelerate, coast at the selected velocity, decelerate to a stop.
+
+    acceleration and deceleration are the thrust limits in m/s² (deceleration
+    defaults to acceleration). Without a thrust curve the profile has a
+    closed-form solution. thrust_curve, if given, scales both limits by a
+    factor of the current velocity in km/h (e.g. thrust falling off as the
+    vehicle speeds up) and the profile is integrated numerically. The curve
+    must be vectorized and positive; it is part of the cache key, so pass the
+    same function object for repeated profiles.
+    """
+    acceleration: float
+    deceleration: Optional[float] = None
+    thrust_curve: Optional[ThrustCurve] = None
+
+    def __post_init__(self):
+        if not self.acceleration > 0:
+            raise ValueError("Acceleration must be positive.")
+        if self.deceleration is not None and not self.deceleration > 0:
+            raise ValueError("Deceleration must be positive.")
+
+    @property
+    def acceleration_kmh2(self) -> float:
+        return self.acceleration * KMH2_PER_MS2
+
+    @property
+    def deceleration_kmh2(self) -> float:
+        return (self.deceleration if self.deceleration is not None else self.acceleration) * KMH2_PER_MS2
+
+    @classmethod
+    def for_vehicle(cls, vehicle: TransportationVehicle) -> Optional["TrajectoryProfile"]:
+        """The vehicle's profile, or None if it has no acceleration limit (constant speed)"""
+        if vehicle.acceleration is None:
+            return None
+        return cls(vehicle.acceleration)
+
+@dataclass(frozen=True)
+class TrajectoryResult:
+    distance: float               # kilometers
+    cruise_velocity: float        # km/h, as selected
+    peak_velocity: float          # km/h; below cruise_velocity if there is no coast phase
+    accelerate_hours: float
+    coast_hours: float
+    decelerate_hours: float
+    accelerate_km: float
+    coast_km: float
+    decelerate_km: float
+
+    @property
+    def duration_hours(self) -> float:
+        return self.accelerate_hours + self.coast_hours + self.decelerate_hours
+
+    def phase_fuel(self, fuel_efficiency: float) -> Tuple[float, float, float]:
+        """Fuel units burned while accelerating, coasting and decelerating"""
+        return (
+            self.accelerate_km * BURN_FUEL_FACTOR / fuel_efficiency,
+            self.coast_km / fuel_efficiency,
+            self.decelerate_km * BURN_FUEL_FACTOR / fuel_efficiency,
+        )
+
+    def fuel_units(self, fuel_efficiency: float) -> float:
+        # The same expression as phase_totals(), so scalar and batch quotes agree exactly
+        return (self.coast_km + BURN_FUEL_FACTOR * (self.accelerate_km + self.decelerate_km)) / fuel_efficiency
+
+PHASE_COLUMNS = (
+    "peak_velocity",
+    "accelerate_hours", "coast_hours", "decelerate_hours",
+    "accelerate_km", "coast_km", "decelerate_km",
+)
+
+def _closed_form(
+    distance: np.ndarray,
+    velocity: np.ndarray,
+    acceleration: np.ndarray,
+    deceleration: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Phase columns for constant acceleration limits (km, km/h, km/h²).
+
+    A trapezoid profile reaches the cruise velocity and coasts; when the
+    distance is too short to reach it, the profile is a triangle whose peak
+    velocity satisfies v²/2a + v²/2b = distance. Pass the same array as
+    acceleration and deceleration for symmetric limits, which need fewer
+    operations.
+    """
+    if deceleration is acceleration:
+        return _symmetric_closed_form(distance, velocity, acceleration)
+    reaches_cruise = velocity * velocity * (0.5 / acceleration + 0.5 / deceleration) <= distance
+    triangle_peak = np.sqrt(2 * distance * acceleration * deceleration / (acceleration + deceleration))
+    peak = np.where(reaches_cruise, velocity, triangle_peak)
+    accelerate_km = peak * peak / (2 * acceleration)
+    decelerate_km = peak * peak / (2 * deceleration)
+    coast_km = np.where(reaches_cruise, np.maximum(distance - accelerate_km - decelerate_km, 0.0), 0.0)
+    return {
+        "peak_velocity": peak,
+        "accelerate_hours": peak / acceleration,
+        "coast_hours": coast_km / velocity,
+        "decelerate_hours": peak / deceleration,
+        "accelerate_km": accelerate_km,
+        "coast_km": coast_km,
+        "decelerate_km": decelerate_km,
+    }
+
+def _symmetric_closed_form(distance: np.ndarray, velocity: np.ndarray, acceleration: np.ndarray) -> Dict[str, np.ndarray]:
+    # Equal limits: the cruise velocity is reached when v²/a <= distance and
+    # the triangle peaks at sqrt(distance * a); solve_trajectory() mirrors this
+    reaches_cruise = velocity * velocity <= distance * acceleration
+    peak = np.sqrt(distance * acceleration)
+    np.copyto(peak, velocity, where=reaches_cruise)
+    burn_km = peak * peak / (2 * acceleration)
+    coast_km = distance - 2 * burn_km
+    np.maximum(coast_km, 0.0, out=coast_km)
+    coast_km[~reaches_cruise] = 0.0
+    burn_hours = peak / acceleration
+    return {
+        "peak_velocity": peak,
+        "accelerate_hours": burn_hours,
+        "coast_hours": coast_km / velocity,
+        "decelerate_hours": burn_hours.copy(),
+        "accelerate_km": burn_km,
+        "coast_km": coast_km,
+        "decelerate_km": burn_km.copy(),
+    }
+
+def _integrands(velocity: np.ndarray, acceleration: float, deceleration: float,
+                thrust_curve: ThrustCurve) -> np.ndarray:
+    """d/dv of (accelerate hours, accelerate km, decelerate hours, decelerate km)"""
+    factor = np.asarray(thrust_curve(velocity), dtype=np.float64)
+    inverse_a = 1.0 / (acceleration * factor)
+    inverse_b = 1.0 / (deceleration * factor)
+    return np.stack((inverse_a, velocity * inverse_a, inverse_b, velocity * inverse_b))
+
+def _partial_simpson(f0: np.ndarray, fm: np.ndarray, f1: np.ndarray, h: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Integral over the first fraction s of a step h of the quadratic through f0, fm, f1"""
+    s2 = s * s
+    s3 = s2 * s
+    return h * (f0 * (s - 1.5 * s2 + s3 * 2 / 3) + fm * (2 * s2 - s3 * 4 / 3) + f1 * (s3 * 2 / 3 - 0.5 * s2))
+
+def _solve_fraction(
+    f0: np.ndarray, fm: np.ndarray, f1: np.ndarray, h: np.ndarray, target: np.ndarray
+) -> np.ndarray:
+    """Fraction s of a step where _partial_simpson reaches target, by Newton's method"""
+    s = np.clip(target / np.maximum(_partial_simpson(f0, fm, f1, h, np.ones_like(h)), 1e-300), 0.0, 1.0)
+    for _ in range(50):
+        # The derivative of the partial integral is the quadratic itself
+        slope = h * (f0 * (1 - 3 * s + 2 * s * s) + fm * (4 * s - 4 * s * s) + f1 * (2 * s * s - s))
+        update = (_partial_simpson(f0, fm, f1, h, s) - target) / np.maximum(slope, 1e-300)
+        s = np.clip(s - update, 0.0, 1.0)
+        if np.all(np.abs(update) <= 1e-14):
+            break
+    return s
+
+class ThrustTable:
+    """
+    Time and distance of both burns as functions of velocity, for one pair of
+    thrust limits and a thrust curve, over [0, max_velocity].
+
+    Built by a vectorized adaptive integrator: every pending step is
+    evaluated at once, steps where Simpson's rule over the step and over its
+    two halves disagree by more than the tolerance are split, and the rest
+    are kept. Each kept half step stores the integrand at its ends and
+    midpoint, so the integrals to any velocity inside it come from the
+    quadratic through those points.
+    """
+    def __init__(self, acceleration: float, deceleration: float, thrust_curve: ThrustCurve,
+                 max_velocity: float, tolerance: float = INTEGRATION_TOLERANCE):
+        self.max_velocity = max_velocity
+        starts: List[np.ndarray] = []
+        widths: List[np.ndarray] = []
+        samples: List[np.ndarray] = []
+        edges = np.linspace(0.0, max_velocity, 17)
+        low, width = edges[:-1], np.diff(edges)
+        for _ in range(MAX_INTEGRATION_ROUNDS):
+            if len(low) == 0:
+                break
+            f = _integrands(
+                (low[:, None] + width[:, None] * np.arange(5) / 4).ravel(),
+                acceleration, deceleration, thrust_curve
+            ).reshape(4, len(low), 5)
+            whole = width / 6 * (f[..., 0] + 4 * f[..., 2] + f[..., 4])
+            halves = width / 12 * (f[..., 0] + 4 * f[..., 1] + 2 * f[..., 2] + 4 * f[..., 3] + f[..., 4])
+            error = np.max(np.abs(halves - whole) / (np.abs(halves) + 1e-300), axis=0)
+            done = error <= tolerance
+            half = width[done] / 2
+            starts += [low[done], low[done] + half]
+            widths += [half, half]
+            samples += [f[:, done, 0:3], f[:, done, 2:5]]
+            low = np.concatenate((low[~done], low[~done] + width[~done] / 2))
+            width = np.tile(width[~done] / 2, 2)
+        else:
+            raise ValueError("Trajectory integration did not converge; check the thrust curve.")
+
+        self.starts = np.concatenate(starts)
+        order = np.argsort(self.starts, kind="stable")
+        self.starts = self.starts[order]
+        self.widths = np.concatenate(widths)[order]
+        # (component, step, point) for the start, midpoint and end of each step
+        self.samples = np.concatenate(samples, axis=1)[:, order, :]
+        f0, fm, f1 = self.samples[..., 0], self.samples[..., 1], self.samples[..., 2]
+        # Integrals from zero to the start of each step, plus the end
+        self.cumulative = np.zeros((4, len(self.starts) + 1))
+        np.cumsum(self.widths / 6 * (f0 + 4 * fm + f1), axis=1, out=self.cumulative[:, 1:])
+        self.burn_km = self.cumulative[1] + self.cumulative[3]
+
+    def _at(self, step: np.ndarray, fraction: np.ndarray) -> np.ndarray:
+        f = self.samples[:, step, :]
+        return self.cumulative[:, step] + _partial_simpson(f[..., 0], f[..., 1], f[..., 2], self.widths[step], fraction)
+
+    def columns(self, distance: np.ndarray, velocity: np.ndarray) -> Dict[str, np.ndarray]:
+        """Phase columns for journeys with cruise velocities up to max_velocity"""
+        last = len(self.starts) - 1
+        step = np.clip(np.searchsorted(self.starts, velocity, side="right") - 1, 0, last)
+        fraction = np.clip((velocity - self.starts[step]) / self.widths[step], 0.0, 1.0)
+        totals = self._at(step, fraction)
+        peak = velocity.copy()
+
+        # Triangle profiles: the burns cover the distance before reaching the
+        # cruise velocity, somewhere inside the step found by searching the
+        # cumulative burn distance
+        triangle = np.flatnonzero(totals[1] + totals[3] > distance)
+        if len(triangle):
+            target = distance[triangle]
+            step = np.clip(np.searchsorted(self.burn_km, target, side="right") - 1, 0, last)
+            f = self.samples[:, step, :]
+            fraction = _solve_fraction(
+                f[1, :, 0] + f[3, :, 0], f[1, :, 1] + f[3, :, 1], f[1, :, 2] + f[3, :, 2],
+                self.widths[step], target - self.burn_km[step]
+            )
+            totals[:, triangle] = self._at(step, fraction)
+            peak[triangle] = self.starts[step] + fraction * self.widths[step]
+
+        accelerate_hours, accelerate_km, decelerate_hours, decelerate_km = totals
+        coast_km = np.zeros(len(distance))
+        cruising = np.ones(len(distance), dtype=bool)
+        cruising[triangle] = False
+        coast_km[cruising] = np.maximum(distance[cruising] - accelerate_km[cruising] - decelerate_km[cruising], 0.0)
+        return {
+            "peak_velocity": peak,
+            "accelerate_hours": accelerate_hours,
+            "coast_hours": coast_km / velocity,
+            "decelerate_hours": decelerate_hours,
+            "accelerate_km": accelerate_km,
+            "coast_km": coast_km,
+            "decelerate_km": decelerate_km,
+        }
+
+# Thrust tables by (acceleration, deceleration, curve), most recently used last
+_thrust_tables: "OrderedDict[Tuple[float, float, ThrustCurve], ThrustTable]" = OrderedDict()
+_thrust_tables_lock = threading.Lock()
+
+def get_thrust_table(acceleration: float, deceleration: float, thrust_curve: ThrustCurve,
+                     max_velocity: float) -> ThrustTable:
+    """
+    The cached table for these limits (km/h²) and curve, rebuilt over a
+    wider range if max_velocity (km/h) is beyond the cached one
+    """
+    key = (acceleration, deceleration, thrust_curve)
+    # Tables cover up to a power of two, so a series of growing velocities
+    # does not rebuild the table each time
+    max_velocity = 2.0 ** math.ceil(math.log2(max(max_velocity, 1.0)))
+    with _thrust_tables_lock:
+        table = _thrust_tables.get(key)
+        if table is not None and table.max_velocity >= max_velocity:
+            _thrust_tables.move_to_end(key)
+            return table
+    table = ThrustTable(acceleration, deceleration, thrust_curve, max_velocity)
+    with _thrust_tables_lock:
+        _thrust_tables[key] = table
+        _thrust_tables.move_to_end(key)
+        while len(_thrust_tables) > THRUST_TABLE_CACHE_SIZE:
+            _thrust_tables.popitem(last=False)
+    return table
+
+def trajectory_columns(
+    distance: np.ndarray,
+    velocity: np.ndarray,
+    acceleration: np.ndarray,
+    deceleration: Optional[np.ndarray] = None,
+    thrust_curve: Optional[ThrustCurve] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Phase columns (PHASE_COLUMNS) for arrays of journeys.
+
+    acceleration and deceleration are per-row limits in m/s² (or one value
+    for all rows). Constant limits are solved in closed form; with a thrust
+    curve, each distinct pair of limits is integrated once into a cached
+    ThrustTable that every row using it reads from.
+    """
+    distance = np.asarray(distance, dtype=np.float64)
+    velocity = np.asarray(velocity, dtype=np.float64)
+    acceleration = np.broadcast_to(np.asarray(acceleration, dtype=np.float64), distance.shape)
+    deceleration = acceleration if deceleration is None else np.broadcast_to(
+        np.asarray(deceleration, dtype=np.float64), distance.shape
+    )
+    if not (np.isfinite(distance).all() and np.isfinite(velocity).all()):
+        raise ValueError("Distance and velocity must be finite.")
+    if np.any(acceleration <= 0) or np.any(deceleration <= 0):
+        raise ValueError("Acceleration and deceleration must be positive.")
+
+    if thrust_curve is None:
+        acceleration_kmh2 = acceleration * KMH2_PER_MS2
+        deceleration_kmh2 = acceleration_kmh2 if deceleration is acceleration else deceleration * KMH2_PER_MS2
+        return _closed_form(distance, velocity, acceleration_kmh2, deceleration_kmh2)
+
+    if len(distance) == 0:
+        return {name: np.empty(0) for name in PHASE_COLUMNS}
+    columns = {name: np.empty(len(distance)) for name in PHASE_COLUMNS}
+    if acceleration.min() == acceleration.max() and deceleration.min() == deceleration.max():
+        limits, group = np.array([acceleration[0] + 1j * deceleration[0]]), None
+    else:
+        # Limit pairs packed into complex numbers, so one 1-D unique finds the distinct pairs
+        limits, group = np.unique(acceleration + 1j * deceleration, return_inverse=True)
+        group = group.reshape(-1)
+    for i, pair in enumerate(limits):
+        rows = np.flatnonzero(group == i) if group is not None else slice(None)
+        table = get_thrust_table(
+            pair.real * KMH2_PER_MS2, pair.imag * KMH2_PER_MS2, thrust_curve, float(velocity[rows].max())
+        )
+        for name, values in table.columns(distance[rows], velocity[rows]).items():
+            columns[name][rows] = values
+    return columns
+
+def phase_totals(phases: Dict[str, np.ndarray], fuel_efficiency: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Total duration in hours and fuel units from phase columns, with the same
+    operations as TrajectoryResult so array and scalar quotes agree exactly
+    """
+    duration_hours = phases["accelerate_hours"] + phases["coast_hours"] + phases["decelerate_hours"]
+    burn_km = phases["accelerate_km"] + phases["decelerate_km"]
+    return duration_hours, (phases["coast_km"] + BURN_FUEL_FACTOR * burn_km) / fuel_efficiency
+
+def vehicle_columns(
+    distance: np.ndarray,
+    velocity: Union[float, np.ndarray],
+    vehicle: TransportationVehicle
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Duration in hours and fuel units for arrays of journeys by one vehicle:
+    along its profile if it has an acceleration limit, otherwise at constant
+    speed, as calculate_journey() quotes them
+    """
+    distance = np.asarray(distance, dtype=np.float64)
+    if vehicle.acceleration is None:
+        return distance / velocity, distance / vehicle.fuel_efficiency
+    velocity = np.broadcast_to(np.asarray(velocity, dtype=np.float64), distance.shape)
+    phases = trajectory_columns(distance.ravel(), velocity.ravel(), vehicle.acceleration)
+    duration_hours, fuel_units = phase_totals(phases, vehicle.fuel_efficiency)
+    return duration_hours.reshape(distance.shape), fuel_units.reshape(distance.shape)
+
+@lru_cache(maxsize=TRAJECTORY_CACHE_SIZE)
+def solve_trajectory(distance: float, velocity: float, profile: TrajectoryProfile) -> TrajectoryResult:
+    """
+    Phases of one journey under a profile; results for repeated
+    (distance, velocity, profile) are served from a cache.
+    """
+    if not (math.isfinite(distance) and math.isfinite(velocity)):
+        raise ValueError("Distance and velocity must be finite.")
+    if distance < 0 or velocity <= 0:
+        raise ValueError("Distance must be non-negative and velocity positive.")
+    if profile.thrust_curve is None:
+        # Scalar closed form, without the array overhead; the same operations
+        # as _closed_form() so scalar and batch results agree exactly
+        a = profile.acceleration_kmh2
+        if profile.deceleration is None:
+            if velocity * velocity <= distance * a:
+                burn_km = velocity * velocity / (2 * a)
+                coast_km = max(distance - 2 * burn_km, 0.0)
+                return TrajectoryResult(
+                    distance, velocity, velocity,
+                    velocity / a, coast_km / velocity, velocity / a,
+                    burn_km, coast_km, burn_km,
+                )
+            peak = math.sqrt(distance * a)
+            burn_km = peak * peak / (2 * a)
+            return TrajectoryResult(distance, velocity, peak, peak / a, 0.0, peak / a, burn_km, 0.0, burn_km)
+        b = profile.deceleration_kmh2
+        if velocity * velocity * (0.5 / a + 0.5 / b) <= distance:
+            peak = velocity
+        else:
+            peak = math.sqrt(2 * distance * a * b / (a + b))
+        accelerate_km = peak * peak / (2 * a)
+        decelerate_km = peak * peak / (2 * b)
+        coast_km = max(distance - accelerate_km - decelerate_km, 0.0) if peak == velocity else 0.0
+        return TrajectoryResult(
+            distance, velocity, peak,
+            peak / a, coast_km / velocity, peak / b,
+            accelerate_km, coast_km, decelerate_km,
+        )
+
+    table = get_thrust_table(
+        profile.acceleration_kmh2, profile.deceleration_kmh2, profile.thrust_curve, velocity
+    )
+    columns = table.columns(np.array([float(distance)]), np.array([float(velocity)]))
+    return TrajectoryResult(distance, velocity, *(float(columns[name][0]) for name in PHASE_COLUMNS))
+
+@lru_cache(maxsize=TRAJECTORY_CACHE_SIZE)
+def solve_vehicle_trajectory(distance: float, velocity: float, acceleration: float) -> TrajectoryResult:
+    """
+    solve_trajectory() under a vehicle's own acceleration limit, cached by
+    plain numbers so repeated quotes skip building and hashing a profile
+    """
+    return solve_trajectory(distance, velocity, TrajectoryProfile(acceleration))
@@ -0,0 +1,122 @@
+# Space Journey Analytics tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import gzip
+import json
+import os
+import shutil
+
+import pytest
+
+import space_analytics
+from space_analytics import run_analytics
+
+MESSAGES = [
+    ("INFO", "Space Journey Calculator started"),
+    ("INFO", "Journey calculations completed for Mars"),
+    ("ERROR", "Error in journey calculations: overflow"),
+    ("WARNING", "Invalid input: velocity"),
+    ("DEBUG", "Loaded planetary data"),
+]
+DESTINATIONS = ["Moon", "Mars", "Venus", "Mercury"]
+VEHICLES = ["Space Shuttle", "Standard Spacecraft"]
+
+def _log_lines(start: int, count: int) -> str:
+    lines = []
+    for i in range(start, start + count):
+        level, message = MESSAGES[i % len(MESSAGES)]
+        lines.append(f"[2026-10-{10 + i % 9:02d} 12:00:00] [{level.ljust(8)}] {message} #{i}\n")
+    return "".join(lines)
+
+def _journal_lines(start: int, count: int) -> str:
+    # Whole-number values keep the float sums independent of reading order
+    return "".join(
+        json.dumps({
+            "recorded_at": f"2026-10-{10 + i % 9:02d}T12:00:00",
+            "destination": DESTINATIONS[i % 4],
+            "vehicle": VEHICLES[i % 2],
+            "country": "US" if i % 3 else "CA",
+            "velocity": 1000 + 37 * i,
+            "journey_cost": 10 * i,
+            "fuel_units": i,
+            "duration_days": i % 40,
+        }) + "\n"
+        for i in range(start, start + count)
+    )
+
+def _details(velocity: int) -> str:
+    return (
+        "Country: US\nVehicle: Space Shuttle\n"
+        f"Selected Velocity: {velocity:,} km/h\nDestination: Mars\n"
+        "    12.5 days\n- Fuel Required: 1,000 units\n- Estimated Cost: $2,500.00\n"
+    )
+
+def _append(path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+def _gzip(path) -> None:
+    with open(path, "rb") as f_in, gzip.open(f"{path}.gz", "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(path)
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "journeys").mkdir()
+    _append(tmp_path / "SpaceTravel_Log.txt", _log_lines(0, 400))
+    _append(tmp_path / "journeys" / "JourneyJournal.000001.jsonl", _journal_lines(0, 300))
+    _append(tmp_path / "JourneyDetails_Ann_20261012_101500.txt", _details(20000))
+    return tmp_path
+
+def _full(directory) -> dict:
+    totals, _ = run_analytics(str(directory), None, max_workers=1, full=True)
+    return totals.to_dict()
+
+def test_resume_after_rotation_and_gzip_matches_full_rebuild(data_dir):
+    checkpoint = str(data_dir / "checkpoint.json")
+    first, _ = run_analytics(str(data_dir), checkpoint, max_workers=1)
+    assert first.to_dict() == _full(data_dir)
+
+    # The log grows, is rotated (renamed) and gzipped, and a new log starts
+    log = data_dir / "SpaceTravel_Log.txt"
+    _append(log, _log_lines(400, 150))
+    rotated = data_dir / "SpaceTravel_Log.20261018-120000.txt"
+    os.rename(log, rotated)
+    _gzip(rotated)
+    _append(log, _log_lines(550, 80))
+    # The journal segment grows, is closed and gzipped; a new segment follows
+    segment = data_dir / "journeys" / "JourneyJournal.000001.jsonl"
+    _append(segment, _journal_lines(300, 50))
+    _gzip(segment)
+    _append(data_dir / "journeys" / "JourneyJournal.000002.jsonl", _journal_lines(350, 70))
+    # A new details file, and an old one touched without a new journey
+    _append(data_dir / "JourneyDetails_Bob_20261018_091000.txt", _details(25000))
+    _append(data_dir / "JourneyDetails_Ann_20261012_101500.txt", "\n")
+
+    second, run = run_analytics(str(data_dir), checkpoint, max_workers=1)
+    expected = _full(data_dir)
+    assert second.to_dict() == expected
+    assert expected["journeys"] == 300 + 50 + 70 + 2
+    assert expected["log_lines"] == 630
+
+    # Nothing new: the totals stay put
+    third, _ = run_analytics(str(data_dir), checkpoint, max_workers=1)
+    assert third.to_dict() == expected
+
+def test_truncated_log_is_read_again(data_dir):
+    checkpoint = str(data_dir / "checkpoint.json")
+    run_analytics(str(data_dir), checkpoint, max_workers=1)
+    log = data_dir / "SpaceTravel_Log.txt"
+    os.remove(log)
+    _append(log, _log_lines(1000, 20))
+    totals, _ = run_analytics(str(data_dir), checkpoint, max_workers=1)
+    assert totals.log_lines == 400 + 20
+
+def test_parallel_ranges_match_a_serial_pass(data_dir, monkeypatch):
+    _append(data_dir / "SpaceTravel_Log.txt", _log_lines(400, 3000))
+    serial = _full(data_dir)
+    # Small chunks split the log into many line-aligned ranges
+    monkeypatch.setattr(space_analytics, "CHUNK_BYTES", 4096)
+    parallel, _ = run_analytics(str(data_dir), None, max_workers=2, full=True)
+    assert parallel.to_dict() == serial
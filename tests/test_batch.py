@@ -0,0 +1,107 @@
+# Batch journey engine tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import datetime
+from dataclasses import replace
+from types import MappingProxyType
+
+import numpy as np
+import pytest
+
+from journey_simulation import simulate_journey
+from space_batch import add_hours, calculate_journeys
+from space_data import get_all_planetary_bodies, get_all_transportation_vehicles
+from space_journey import calculate_journey
+
+ROWS = 2000
+
+# Thrust limits in m/s² set on copies of the built-in vehicles, which fly at constant speed
+ACCELERATIONS = (10.0, 20.0, 29.0, 5.0)
+
+def _inputs(seed: int = 7):
+    rng = np.random.default_rng(seed)
+    planets = list(get_all_planetary_bodies().values())
+    vehicles = list(get_all_transportation_vehicles().values())
+    planet_codes = rng.integers(0, len(planets), ROWS)
+    vehicle_codes = rng.integers(0, len(vehicles), ROWS)
+    max_velocity = np.array([vehicle.max_velocity for vehicle in vehicles])[vehicle_codes]
+    velocities = rng.uniform(0.01, 1.0, ROWS) * max_velocity
+    departures = np.datetime64("2026-10-18T08:30:00") + rng.integers(0, 10 ** 12, ROWS).astype("timedelta64[us]")
+    return planets, vehicles, planet_codes, vehicle_codes, velocities, departures
+
+def _assert_matches_scalar(result, planets, vehicles, planet_codes, vehicle_codes, velocities, departures):
+    for row in range(ROWS):
+        journey = calculate_journey(
+            planets[planet_codes[row]], vehicles[vehicle_codes[row]], float(velocities[row]),
+            departures[row].astype(datetime.datetime)
+        )
+        assert result.duration_hours[row] == journey.duration_hours
+        assert result.duration_days[row] == journey.duration_days
+        assert result.fuel_units[row] == journey.fuel_units
+        assert result.journey_cost[row] == journey.journey_cost
+        assert result.whole_days[row] == journey.whole_days
+        assert result.whole_hours[row] == journey.whole_hours
+        assert result.whole_minutes[row] == journey.whole_minutes
+        assert result.arrival_date[row].astype(datetime.datetime) == journey.arrival_date
+
+def test_batch_matches_scalar_with_acceleration_limits():
+    planets, vehicles, *columns = _inputs()
+    vehicles = [replace(vehicle, acceleration=acceleration) for vehicle, acceleration in zip(vehicles, ACCELERATIONS)]
+    catalog = MappingProxyType({vehicle.name: vehicle for vehicle in vehicles})
+    result = calculate_journeys(*columns, vehicles_catalog=catalog)
+    assert (result.duration_hours > result.distance / result.velocity).all()
+    _assert_matches_scalar(result, planets, vehicles, *columns)
+
+def test_batch_matches_scalar_at_constant_speed():
+    planets, vehicles, *columns = _inputs(seed=11)
+    assert all(vehicle.acceleration is None for vehicle in vehicles)
+    result = calculate_journeys(*columns)
+    np.testing.assert_array_equal(result.duration_hours, result.distance / result.velocity)
+    _assert_matches_scalar(result, planets, vehicles, *columns)
+
+def test_names_and_codes_give_the_same_result():
+    planets, vehicles, planet_codes, vehicle_codes, velocities, departures = _inputs()
+    by_code = calculate_journeys(planet_codes, vehicle_codes, velocities, departures)
+    by_name = calculate_journeys(
+        np.array([planet.name for planet in planets])[planet_codes],
+        np.array([vehicle.name for vehicle in vehicles])[vehicle_codes],
+        velocities, departures
+    )
+    for name, column in by_code.as_dict().items():
+        np.testing.assert_array_equal(column, by_name.as_dict()[name])
+
+def test_add_hours_rounds_like_timedelta():
+    start = datetime.datetime(2026, 10, 18, 12, 0, 0)
+    hours = np.array([0.0, 1e-10, 0.5 / 3600e6, 1.5 / 3600e6, 2.5 / 3600e6, 1 / 3, 12345.678901234, 876543.21])
+    arrivals = add_hours(np.full(len(hours), np.datetime64(start, "us")), hours)
+    for value, arrival in zip(hours, arrivals):
+        assert arrival.astype(datetime.datetime) == start + datetime.timedelta(hours=float(value))
+
+def test_invalid_velocity_names_the_row():
+    with pytest.raises(ValueError, match="at row 1"):
+        calculate_journeys([0, 1], [0, 0], [1000.0, 0.0], np.array(["2026-10-18", "2026-10-18"], dtype="datetime64[us]"))
+
+@pytest.mark.parametrize("velocity", [0.001, 1e-300])
+def test_arrival_out_of_range_raises_like_scalar(velocity):
+    mars = get_all_planetary_bodies()["Mars"]
+    shuttle = get_all_transportation_vehicles()["Space Shuttle"]
+    departure = datetime.datetime(2026, 10, 18)
+    with pytest.raises(OverflowError):
+        calculate_journey(mars, shuttle, velocity, departure)
+    with pytest.raises(OverflowError, match="at row 1"):
+        calculate_journeys(["Moon", "Mars"], [2, 2], [20000.0, velocity], np.array([departure] * 2, dtype="datetime64[us]"))
+
+def test_add_hours_rejects_nan_and_keeps_the_last_representable_date():
+    start = np.array(["2026-10-18"], dtype="datetime64[us]")
+    with pytest.raises(ValueError, match="not a number"):
+        add_hours(start, [float("nan")])
+    hours = (datetime.datetime(9999, 12, 31) - datetime.datetime(2026, 10, 18)) / datetime.timedelta(hours=1)
+    assert add_hours(start, [hours])[0].astype(datetime.datetime) == datetime.datetime(2026, 10, 18) + datetime.timedelta(hours=hours)
+    with pytest.raises(OverflowError):
+        add_hours(start, [hours + 24])
+
+@pytest.mark.parametrize("velocity", [0.001, 1e-300])
+def test_simulation_raises_like_scalar_for_endless_journeys(velocity):
+    with pytest.raises(OverflowError):
+        simulate_journey("Mars", "Space Shuttle", velocity, datetime.datetime(2026, 11, 1), samples=1000, seed=1)
@@ -0,0 +1,138 @@
+# Sharded Batch Runner tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import csv
+import datetime
+import json
+
+import pytest
+
+import batch_runner
+from batch_runner import plan_shards, run_batch
+from space_data import get_all_planetary_bodies, get_all_transportation_vehicles
+from space_headless import REQUEST_FIELDS, run_headless
+
+ROWS = 300
+
+def _requests():
+    year = datetime.datetime.now().year + 5
+    planets = list(get_all_planetary_bodies())
+    vehicles = list(get_all_transportation_vehicles().values())
+    for i in range(ROWS):
+        vehicle = vehicles[i % len(vehicles)]
+        yield {
+            "name": f"Traveler {i}",
+            "country": "Canada",
+            "year": year + i % 10,
+            "vehicle": vehicle.name,
+            # Every seventh request is too fast for its vehicle
+            "velocity": vehicle.max_velocity * (1.5 if i % 7 == 0 else 0.4 + (i % 5) / 10),
+            "destination": planets[i % len(planets)],
+        }
+
+@pytest.fixture
+def jsonl_requests(tmp_path):
+    lines = []
+    for i, request in enumerate(_requests()):
+        lines.append(json.dumps(request))
+        # Blank lines are skipped; broken ones still take a row number
+        if i % 40 == 3:
+            lines.append("")
+        if i % 55 == 9:
+            lines.append("{not json")
+        if i % 70 == 11:
+            lines.append("[1, 2]")
+    path = tmp_path / "requests.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+@pytest.fixture
+def csv_requests(tmp_path):
+    path = tmp_path / "requests.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REQUEST_FIELDS)
+        writer.writeheader()
+        for i, request in enumerate(_requests()):
+            writer.writerow(request)
+            if i % 40 == 3:
+                f.write("\r\n")
+    return path
+
+def _read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+def _read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_jsonl_shards_match_headless(jsonl_requests, tmp_path, max_workers):
+    expected_path, output_path = tmp_path / "expected.jsonl", tmp_path / "results.jsonl"
+    run_headless(str(jsonl_requests), str(expected_path))
+    summary = run_batch(str(jsonl_requests), str(output_path), max_workers=max_workers, shard_bytes=2048)
+
+    expected = _read_jsonl(expected_path)
+    assert summary.shards > 10
+    assert summary.rows == len(expected) and summary.ok + summary.error == len(expected)
+    assert _read_jsonl(output_path) == expected
+    assert [record["row"] for record in expected] == list(range(1, len(expected) + 1))
+    assert any("error" in record for record in expected)
+    assert not list(tmp_path.glob(".shards-*"))
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_csv_shards_match_headless(csv_requests, tmp_path, max_workers):
+    expected_path, output_path = tmp_path / "expected.jsonl", tmp_path / "results.jsonl"
+    run_headless(str(csv_requests), str(expected_path))
+    summary = run_batch(str(csv_requests), str(output_path), max_workers=max_workers, shard_bytes=1024)
+    assert summary.shards > 10
+    assert _read_jsonl(output_path) == _read_jsonl(expected_path)
+
+    # A CSV result file has one header however many shards are merged
+    csv_expected, csv_output = tmp_path / "expected.csv", tmp_path / "results.csv"
+    run_headless(str(csv_requests), str(csv_expected))
+    run_batch(str(csv_requests), str(csv_output), max_workers=max_workers, shard_bytes=1024)
+    assert _read_csv(csv_output) == _read_csv(csv_expected)
+
+def test_shards_split_at_line_boundaries(jsonl_requests):
+    fieldnames, shards = plan_shards(str(jsonl_requests), "jsonl", 1000)
+    content = jsonl_requests.read_bytes()
+    assert fieldnames is None
+    assert shards[0].start == 0 and shards[-1].end == len(content)
+    for previous, shard in zip(shards, shards[1:]):
+        assert previous.end == shard.start and content[shard.start - 1:shard.start] == b"\n"
+
+def test_transient_failure_is_retried(jsonl_requests, tmp_path, monkeypatch):
+    quote_requests = batch_runner.quote_requests
+    failed = []
+
+    def flaky(requests, **kwargs):
+        if kwargs["first_row"] > 1 and not failed:
+            failed.append(kwargs["first_row"])
+            raise OSError("disk went away")
+        return quote_requests(requests, **kwargs)
+
+    monkeypatch.setattr(batch_runner, "quote_requests", flaky)
+    expected_path, output_path = tmp_path / "expected.jsonl", tmp_path / "results.jsonl"
+    run_headless(str(jsonl_requests), str(expected_path))
+    summary = run_batch(str(jsonl_requests), str(output_path), max_workers=1, shard_bytes=2048)
+    assert failed and summary.retries == 1
+    assert _read_jsonl(output_path) == _read_jsonl(expected_path)
+
+def test_other_errors_fail_fast_naming_shard_and_row(jsonl_requests, tmp_path, monkeypatch):
+    quote_requests = batch_runner.quote_requests
+    attempts = []
+
+    def broken(requests, **kwargs):
+        for result in quote_requests(requests, **kwargs):
+            if result["row"] == 123:
+                attempts.append(result["row"])
+                raise KeyError("boom")
+            yield result
+
+    monkeypatch.setattr(batch_runner, "quote_requests", broken)
+    with pytest.raises(RuntimeError, match=r"^Shard \d+ failed: row 123: KeyError: 'boom'$"):
+        run_batch(str(jsonl_requests), str(tmp_path / "results.jsonl"), max_workers=1, shard_bytes=2048)
+    assert attempts == [123]
+    assert not list(tmp_path.glob(".shards-*"))
@@ -0,0 +1,66 @@
+# Columnar Catalog Store tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import copy
+import json
+import os
+import pickle
+from dataclasses import replace
+
+import pytest
+
+from space_catalog import (
+    CATALOG_FORMAT_VERSION,
+    MANIFEST_FILE,
+    CatalogRow,
+    ColumnarCatalog,
+    TransportationVehicleRow,
+    open_catalog,
+    write_catalog,
+)
+from space_data import get_all_transportation_vehicles
+
+@pytest.fixture
+def vehicle_catalog(tmp_path):
+    vehicles = list(get_all_transportation_vehicles().values())
+    vehicles[1] = replace(vehicles[1], acceleration=12.5)
+    directory = str(tmp_path / "vehicles")
+    assert write_catalog(directory, vehicles) == len(vehicles)
+    return directory, vehicles
+
+def test_written_catalog_round_trips(vehicle_catalog):
+    directory, vehicles = vehicle_catalog
+    catalog = open_catalog(directory)
+    assert list(catalog.records(range(len(catalog)))) == vehicles
+    assert catalog.get(vehicles[1].name) == vehicles[1]
+    assert catalog.get(vehicles[1].name.upper()) is None
+    assert catalog.find(vehicles[1].name.upper()) == [vehicles[1]]
+    assert catalog.get("Warp Barge") is None
+    assert catalog[1].acceleration == 12.5 and catalog[0].acceleration is None
+    fast = sorted((v for v in vehicles if v.max_velocity >= 50000), key=lambda v: v.max_velocity)
+    assert [v.max_velocity for v in catalog.with_max_velocity(50000)] == [v.max_velocity for v in fast]
+    assert ColumnarCatalog.from_records(vehicles).get(vehicles[2].name) == vehicles[2]
+
+def test_other_format_versions_are_rejected(vehicle_catalog):
+    directory, _ = vehicle_catalog
+    path = os.path.join(directory, MANIFEST_FILE)
+    with open(path) as f:
+        manifest = json.load(f)
+    assert manifest["format_version"] == CATALOG_FORMAT_VERSION
+    manifest["format_version"] = CATALOG_FORMAT_VERSION + 1
+    with open(path, "w") as f:
+        json.dump(manifest, f)
+    with pytest.raises(ValueError, match="Unsupported catalog format version"):
+        open_catalog(directory)
+
+def test_rows_without_a_catalog_raise_attribute_error(vehicle_catalog):
+    directory, vehicles = vehicle_catalog
+    row = open_catalog(directory)[2]
+    with pytest.raises(AttributeError):
+        CatalogRow.__new__(TransportationVehicleRow).name
+    duplicate = copy.copy(row)
+    assert duplicate == row and duplicate.name == vehicles[2].name
+    assert pickle.loads(pickle.dumps(row.to_record())) == vehicles[2]
+    with pytest.raises(AttributeError):
+        row.warp_factor
@@ -0,0 +1,74 @@
+# Fleet Assignment Scheduler tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import math
+
+import numpy as np
+import pytest
+
+from fleet_scheduler import Booking, load_bookings, pack_trips, schedule_bookings
+from space_data import get_all_transportation_vehicles, get_transportation_vehicle
+
+def _random_bookings(count, seed=0):
+    rng = np.random.default_rng(seed)
+    destinations = ["Moon", "Mars", "Venus"]
+    return [
+        Booking(f"B{i}", int(rng.integers(0, 9)), int(rng.integers(0, 12000)), destinations[i % 3])
+        for i in range(count)
+    ]
+
+@pytest.mark.parametrize("objective", ["trips", "fuel"])
+def test_trips_stay_within_vehicle_capacity(objective):
+    bookings = _random_bookings(300)
+    schedule = schedule_bookings(bookings, objective)
+    by_id = {booking.booking_id: booking for booking in bookings}
+
+    assigned = [booking_id for trip in schedule.trips for booking_id in trip.booking_ids]
+    assert sorted(assigned + [b.booking_id for b in schedule.unassigned]) == sorted(by_id)
+    for trip in schedule.trips:
+        carried = [by_id[booking_id] for booking_id in trip.booking_ids]
+        assert trip.passengers == sum(b.passengers for b in carried) <= trip.vehicle.passenger_capacity
+        assert trip.cargo == sum(b.cargo for b in carried) <= trip.vehicle.cargo_capacity
+        assert all(b.destination == trip.destination for b in carried)
+    assert all(0.0 <= stats["passenger_utilization"] <= 1.0 and 0.0 <= stats["cargo_utilization"] <= 1.0
+               for stats in schedule.utilization().values())
+
+def test_pack_trips_fills_seats_before_opening_trips():
+    shuttle = get_transportation_vehicle("Space Shuttle")
+    bookings = [Booking(f"B{i}", 1, 0, "Mars") for i in range(3 * shuttle.passenger_capacity)]
+    trips = pack_trips(bookings, shuttle, 225000000)
+    assert len(trips) == 3
+    assert all(trip.passengers == shuttle.passenger_capacity for trip in trips)
+
+    bookings = _random_bookings(200, seed=1)
+    fitting = [b for b in bookings if b.passengers <= shuttle.passenger_capacity and b.cargo <= shuttle.cargo_capacity]
+    trips = pack_trips(fitting, shuttle, 225000000)
+    assert len(trips) >= max(
+        math.ceil(sum(b.passengers for b in fitting) / shuttle.passenger_capacity),
+        math.ceil(sum(b.cargo for b in fitting) / shuttle.cargo_capacity),
+    )
+
+def test_bookings_no_vehicle_can_carry_are_unassigned():
+    vehicles = get_all_transportation_vehicles().values()
+    most_seats = max(vehicle.passenger_capacity for vehicle in vehicles)
+    most_cargo = max(vehicle.cargo_capacity for vehicle in vehicles)
+    crowd = Booking("crowd", most_seats + 1, 0, "Mars")
+    freight = Booking("freight", 1, most_cargo + 1, "Mars")
+    schedule = schedule_bookings([crowd, freight, Booking("small", 2, 100, "Mars")])
+    assert schedule.unassigned == [crowd, freight]
+    assert [trip.booking_ids for trip in schedule.trips] == [["small"]]
+
+@pytest.mark.parametrize("passengers, cargo", [("-1", "100"), ("2", "-0.5")])
+def test_load_bookings_rejects_negative_quantities(tmp_path, passengers, cargo):
+    path = tmp_path / "bookings.csv"
+    path.write_text(
+        "booking_id,passengers,cargo,destination\n"
+        "B1,2,500,Mars\n"
+        f"B2,{passengers},{cargo},Moon\n"
+    )
+    with pytest.raises(ValueError, match="Booking 'B2' at row 1 has negative"):
+        load_bookings(str(path))
+
+    path.write_text("booking_id,passengers,cargo,destination\nB1,2,500.5,Mars\n")
+    assert load_bookings(str(path)) == [Booking("B1", 2, 500, "Mars")]
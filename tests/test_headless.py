@@ -0,0 +1,47 @@
+# Headless Quoting Mode tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import datetime
+import io
+import json
+
+import pytest
+
+from space_headless import quote_requests, read_requests
+from space_journey import validate_velocity
+from quote_cache import QuoteCache
+
+TODAY = datetime.datetime(2026, 10, 18)
+
+def _quote(lines):
+    return list(quote_requests(read_requests(io.StringIO(lines), "jsonl"), today=TODAY, cache=QuoteCache()))
+
+@pytest.mark.parametrize("text", ["nan", "NaN", "inf", "-inf", "0", "-5", "28001", "fast"])
+def test_invalid_velocities_are_rejected(text):
+    assert validate_velocity(text, 28000) == (False, 0)
+
+def test_valid_velocity_is_parsed():
+    assert validate_velocity("20000.5", 28000) == (True, 20000.5)
+
+def test_non_finite_velocity_gives_an_error_row():
+    request = {"name": "Ann", "country": "Canada", "year": 2030, "vehicle": "Space Shuttle", "destination": "Mars"}
+    lines = "".join(
+        json.dumps(dict(request, velocity=velocity)) + "\n" for velocity in ("nan", float("nan"), float("inf"), 20000)
+    )
+    results = _quote(lines)
+    assert [result["row"] for result in results] == [1, 2, 3, 4]
+    assert all(result["error"].startswith("Velocity must be positive") for result in results[:3])
+    assert results[3]["error"] == "" and results[3]["velocity"] == 20000.0
+    # Every result serializes as strict JSON
+    for result in results:
+        json.dumps(result, allow_nan=False)
+
+def test_non_object_lines_keep_their_row():
+    results = _quote('[1, 2]\n\n"Mars"\n{not json\n{"name": ""}\n')
+    assert results == [
+        {"row": 1, "error": "Request must be a JSON object."},
+        {"row": 2, "error": "Request must be a JSON object."},
+        {"row": 3, "error": "Invalid JSON: Expecting property name enclosed in double quotes"},
+        {"row": 4, "error": "Name cannot be empty."},
+    ]
@@ -0,0 +1,88 @@
+# Log rotation tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import gzip
+import os
+import subprocess
+import sys
+
+from space_logger import LogRotation, SpaceLogger, list_rotated_logs, wait_for_compression
+from space_logquery import parse_line
+
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Python")
+
+# Each writer process logs LINES numbered messages to the same file
+WRITER = """
+import sys
+from space_logger import LogRotation, SpaceLogger
+path, tag, lines, max_bytes = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+logger = SpaceLogger(log_to_file=True, log_to_console=False, log_file=path,
+                     rotation=LogRotation(max_bytes=max_bytes, backup_count=0, compress=True))
+for i in range(lines):
+    logger.info(f"{tag} {i} " + "x" * 60)
+    if i % 50 == 0:
+        logger.flush()
+"""
+
+def _all_messages(path: str):
+    messages = []
+    for file_path in list_rotated_logs(path) + [path]:
+        opener = gzip.open if file_path.endswith(".gz") else open
+        with opener(file_path, "rb") as f:
+            data = f.read()
+        assert data.endswith(b"\n")
+        for line in data.splitlines():
+            entry = parse_line(line)
+            assert entry is not None, line
+            messages.append(entry.message)
+    return messages
+
+def test_processes_share_a_rotating_log_without_losing_lines(tmp_path):
+    path = str(tmp_path / "shared.log")
+    processes, lines = 4, 1500
+    env = dict(os.environ, PYTHONPATH=PYTHON_DIR)
+    writers = [
+        subprocess.Popen([sys.executable, "-c", WRITER, path, f"p{p}", str(lines), "20000"], env=env)
+        for p in range(processes)
+    ]
+    for writer in writers:
+        assert writer.wait(timeout=120) == 0
+
+    rotated = list_rotated_logs(path)
+    assert len(rotated) > processes
+    # Every rotated file was compressed by the process that rotated it
+    assert all(file_path.endswith(".gz") for file_path in rotated)
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+    messages = _all_messages(path)
+    assert len(messages) == processes * lines
+    for p in range(processes):
+        numbers = [int(m.split()[1]) for m in messages if m.startswith(f"p{p} ")]
+        assert numbers == list(range(lines))
+
+def test_backup_count_keeps_only_the_newest_files(tmp_path):
+    path = str(tmp_path / "pruned.log")
+    logger = SpaceLogger(
+        log_to_file=True, log_to_console=False, log_file=path, background=False,
+        rotation=LogRotation(max_bytes=2000, backup_count=3, compress=False)
+    )
+    for i in range(400):
+        logger.info(f"line {i} " + "y" * 40)
+    wait_for_compression()
+
+    rotated = list_rotated_logs(path)
+    assert len(rotated) == 3
+    messages = _all_messages(path)
+    # The newest lines survive, contiguous up to the last one written
+    numbers = [int(m.split()[1]) for m in messages]
+    assert numbers == list(range(numbers[0], 400))
+
+def test_logs_do_not_rotate_by_default(tmp_path):
+    path = str(tmp_path / "plain.log")
+    logger = SpaceLogger(log_to_file=True, log_to_console=False, log_file=path)
+    for i in range(300):
+        logger.info(f"line {i} " + "z" * 40)
+    logger.flush()
+    assert os.listdir(tmp_path) == ["plain.log"]
+    assert [int(m.split()[1]) for m in _all_messages(path)] == list(range(300))
@@ -0,0 +1,102 @@
+# Space Logger tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import os
+import threading
+import time
+
+import space_logger
+from space_logger import SpaceLogger, get_file_writer
+from space_logquery import parse_line
+
+def _file_logger(path: str, **options) -> SpaceLogger:
+    return SpaceLogger(log_to_file=True, log_to_console=False, log_file=path, rotation=None, **options)
+
+def _messages(path: str):
+    with open(path, "rb") as f:
+        return [parse_line(line.rstrip(b"\n")).message for line in f]
+
+def test_concurrent_threads_write_whole_lines_in_order(tmp_path):
+    path = str(tmp_path / "threads.log")
+    logger = _file_logger(path)
+    threads_count, lines = 8, 500
+
+    def emit(thread: int) -> None:
+        for i in range(lines):
+            logger.info(f"thread {thread} line {i} " + "x" * 40)
+
+    threads = [threading.Thread(target=emit, args=(t,)) for t in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert logger.flush()
+
+    messages = _messages(path)
+    assert len(messages) == threads_count * lines
+    for t in range(threads_count):
+        numbers = [int(m.split()[3]) for m in messages if m.startswith(f"thread {t} ")]
+        assert numbers == list(range(lines))
+    assert all(m.endswith("x" * 40) for m in messages)
+
+def test_direct_and_background_writes_produce_the_same_lines(tmp_path):
+    background = str(tmp_path / "background.log")
+    direct = str(tmp_path / "direct.log")
+    for path, use_background in ((background, True), (direct, False)):
+        logger = _file_logger(path, background=use_background, log_format="jsonl")
+        logger.warning("a %s message", "formatted")
+        logger.error(lambda: "a lazy message")
+        logger.flush()
+    assert _messages(background) == _messages(direct) == ["a formatted message", "a lazy message"]
+
+def test_flush_does_not_hang_when_the_log_cannot_be_written(tmp_path, capsys):
+    path = str(tmp_path / "missing" / "x.log")
+    logger = _file_logger(path)
+    logger.info("lost")
+    started = time.monotonic()
+    assert logger.flush(timeout=30) is False
+    assert time.monotonic() - started < 5
+    logger.info("also lost")
+    assert logger.flush(timeout=30) is False
+    assert capsys.readouterr().err.count("cannot write") == 1
+
+def test_failed_writer_is_replaced_after_the_retry_delay(tmp_path, monkeypatch):
+    directory = tmp_path / "later"
+    path = str(directory / "x.log")
+    logger = _file_logger(path)
+    logger.info("lost")
+    assert logger.flush(timeout=30) is False
+    failed = get_file_writer(path)
+    assert failed.failed is not None and get_file_writer(path) is failed
+
+    os.mkdir(directory)
+    monkeypatch.setattr(space_logger, "WRITER_RETRY_SECONDS", 0.0)
+    logger.info("kept")
+    assert logger.flush(timeout=30) is True
+    assert get_file_writer(path) is not failed
+    assert _messages(path) == ["kept"]
+
+def test_logger_reuses_its_writer_until_it_closes(tmp_path, monkeypatch):
+    path = str(tmp_path / "cached.log")
+    logger = _file_logger(path)
+    lookups = []
+
+    def counting_get_file_writer(*args):
+        lookups.append(args)
+        return get_file_writer(*args)
+
+    monkeypatch.setattr(space_logger, "get_file_writer", counting_get_file_writer)
+    for i in range(100):
+        logger.info(f"line {i}")
+    assert len(lookups) == 1
+    writer = logger._writer
+    assert writer in space_logger._live_writers
+
+    # A closed writer leaves the atexit registry and the logger fetches a new one
+    writer.close()
+    assert writer not in space_logger._live_writers
+    logger.info("line 100")
+    assert len(lookups) == 2 and logger._writer is not writer
+    assert logger.flush()
+    assert _messages(path) == [f"line {i}" for i in range(101)]
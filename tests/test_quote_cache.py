@@ -0,0 +1,79 @@
+# Journey Quote Cache tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import datetime
+
+import pytest
+
+import quote_cache
+import space_data
+from quote_cache import QuoteCache
+from space_journey import calculate_journey
+
+TRAVEL_DATE = datetime.datetime(2026, 10, 18)
+
+@pytest.fixture
+def shuttle():
+    original = space_data.get_transportation_vehicle("Space Shuttle")
+    yield original
+    space_data.update_transportation_vehicle(
+        "Space Shuttle", max_velocity=original.max_velocity,
+        fuel_efficiency=original.fuel_efficiency, clear_acceleration=True
+    )
+
+def test_least_recently_used_entries_are_evicted():
+    cache = QuoteCache(max_entries=3, ttl=None)
+    for key in "abc":
+        cache.put(key, "Space Shuttle", key.upper())
+    assert cache.get("a") == "A"
+    cache.put("d", "Space Shuttle", "D")
+    # "b" was the least recently used once "a" was read
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+    stats = cache.stats()
+    assert (stats.evictions, stats.size, stats.hits, stats.misses) == (1, 3, 4, 1)
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(quote_cache.time, "monotonic", lambda: now[0])
+    cache = QuoteCache(ttl=10.0)
+    cache.put("quote", "Space Shuttle", 42)
+    now[0] += 10.0
+    assert cache.get("quote") == 42
+    now[0] += 0.5
+    assert cache.get("quote") is None
+    stats = cache.stats()
+    assert (stats.expirations, stats.size) == (1, 0)
+
+@pytest.mark.parametrize("change", [
+    {"max_velocity": 30000},
+    {"fuel_efficiency": 40},
+    {"acceleration": 2.0},
+])
+def test_quote_fields_invalidate_the_vehicle(shuttle, change):
+    cache = QuoteCache(ttl=None)
+    mars = space_data.get_planetary_body("Mars")
+    moon = space_data.get_planetary_body("Moon")
+    cache.quote(mars, shuttle, 20000.0, TRAVEL_DATE)
+    cache.quote(moon, shuttle, 20000.0, TRAVEL_DATE)
+    explorer = space_data.get_transportation_vehicle("High-Speed Explorer")
+    kept = cache.quote(mars, explorer, 20000.0, TRAVEL_DATE)
+
+    updated = space_data.update_transportation_vehicle("Space Shuttle", **change)
+    stats = cache.stats()
+    assert (stats.invalidations, stats.size) == (2, 1)
+    assert cache.quote(mars, explorer, 20000.0, TRAVEL_DATE) is kept
+    # The updated vehicle is quoted afresh rather than from the dropped entry
+    assert cache.quote(mars, updated, 20000.0, TRAVEL_DATE) == calculate_journey(mars, updated, 20000.0, TRAVEL_DATE)
+    assert cache.stats().misses == 4
+
+def test_other_fields_keep_cached_quotes(shuttle):
+    cache = QuoteCache(ttl=None)
+    mars = space_data.get_planetary_body("Mars")
+    cache.quote(mars, shuttle, 20000.0, TRAVEL_DATE)
+    try:
+        space_data.update_transportation_vehicle("Space Shuttle", description="Refitted shuttle.")
+        assert cache.stats().invalidations == 0 and len(cache) == 1
+    finally:
+        space_data.update_transportation_vehicle("Space Shuttle", description=shuttle.description)
@@ -0,0 +1,74 @@
+# Multi-Leg Route Planner tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import itertools
+
+import numpy as np
+import pytest
+
+from route_planner import (
+    DistanceMatrix,
+    _held_karp,
+    _nearest_neighbour,
+    _two_opt,
+    shortest_path,
+)
+
+def _route_cost(cost, order, return_to_start):
+    route = [0] + list(order) + ([0] if return_to_start else [])
+    return sum(cost[a, b] for a, b in zip(route, route[1:]))
+
+def _brute_force_cost(cost, return_to_start):
+    return min(
+        _route_cost(cost, order, return_to_start)
+        for order in itertools.permutations(range(1, len(cost)))
+    )
+
+def _euclidean_cost(points):
+    delta = points[:, None, :] - points[None, :, :]
+    return np.sqrt((delta ** 2).sum(axis=-1))
+
+@pytest.mark.parametrize("return_to_start", [False, True])
+@pytest.mark.parametrize("stops", [2, 3, 5, 7])
+def test_held_karp_finds_the_optimal_order(stops, return_to_start):
+    rng = np.random.default_rng(stops)
+    for _ in range(5):
+        cost = _euclidean_cost(rng.uniform(0, 1e8, size=(stops + 1, 2)))
+        order = _held_karp(cost, return_to_start)
+        assert sorted(order) == list(range(1, stops + 1))
+        assert _route_cost(cost, order, return_to_start) == pytest.approx(_brute_force_cost(cost, return_to_start))
+
+@pytest.mark.parametrize("stops", [4, 6, 8])
+def test_two_opt_agrees_with_held_karp_on_convex_tours(stops):
+    # Without crossing edges the only round trip through points on a circle is
+    # around it, so 2-opt must reach the exact optimum from any start
+    rng = np.random.default_rng(stops)
+    angles = rng.permutation(np.linspace(0, 2 * np.pi, stops + 1, endpoint=False))
+    cost = _euclidean_cost(np.column_stack([np.cos(angles), np.sin(angles)]) * 1e8)
+    exact = _route_cost(cost, _held_karp(cost, True), True)
+    for start in (_nearest_neighbour(cost), list(rng.permutation(range(1, stops + 1)))):
+        heuristic = _two_opt(cost, [int(stop) for stop in start], True)
+        assert sorted(heuristic) == list(range(1, stops + 1))
+        assert _route_cost(cost, heuristic, True) == pytest.approx(exact)
+
+@pytest.mark.parametrize("return_to_start", [False, True])
+def test_two_opt_never_worsens_the_nearest_neighbour_route(return_to_start):
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        cost = _euclidean_cost(rng.uniform(0, 1e8, size=(8, 2)))
+        start = _nearest_neighbour(cost)
+        improved = _two_opt(cost, start, return_to_start)
+        exact = _route_cost(cost, _held_karp(cost, return_to_start), return_to_start)
+        assert exact - 1e-6 <= _route_cost(cost, improved, return_to_start) <= _route_cost(cost, start, return_to_start)
+
+def test_shortest_path_respects_the_leg_limit():
+    matrix = DistanceMatrix(["Moon", "Venus", "Mercury", "Mars"])
+    path, distance = shortest_path("Earth", "Mars", 140_000_000, matrix=matrix)
+    assert path[0] == "Earth" and path[-1] == "Mars" and len(path) > 2
+    assert all(matrix.distance(a, b) <= 140_000_000 for a, b in zip(path, path[1:]))
+    assert distance == pytest.approx(matrix.distance("Earth", "Mars"))
+
+    assert shortest_path("Earth", "Mars", 300_000_000, matrix=matrix) == (["Earth", "Mars"], 225_000_000.0)
+    with pytest.raises(ValueError, match="No route from Earth to Mars"):
+        shortest_path("Earth", "Mars", 100_000_000, matrix=matrix)
@@ -0,0 +1,83 @@
+# Space Data tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import threading
+
+import pytest
+
+import space_data
+from space_data import (
+    TRANSPORTATION_VEHICLES,
+    add_vehicle_listener,
+    current_snapshot,
+    get_all_transportation_vehicles,
+    get_transportation_vehicle,
+    pin_snapshot,
+    remove_vehicle_listener,
+    update_transportation_vehicle,
+)
+
+@pytest.fixture
+def cruiser():
+    original = get_transportation_vehicle("Interplanetary Cruiser")
+    yield original
+    update_transportation_vehicle(
+        "Interplanetary Cruiser", max_velocity=original.max_velocity,
+        fuel_efficiency=original.fuel_efficiency
+    )
+
+def test_pinned_snapshot_survives_an_update(cruiser):
+    pinned_reads = []
+    pinned = threading.Event()
+    updated = threading.Event()
+
+    def batch_job() -> None:
+        with pin_snapshot() as snapshot:
+            pinned.set()
+            updated.wait(timeout=30)
+            pinned_reads.append((snapshot, get_transportation_vehicle("Interplanetary Cruiser")))
+        pinned_reads.append((current_snapshot(), get_transportation_vehicle("Interplanetary Cruiser")))
+
+    job = threading.Thread(target=batch_job)
+    job.start()
+    assert pinned.wait(timeout=30)
+    new = update_transportation_vehicle("Interplanetary Cruiser", max_velocity=80000)
+    updated.set()
+    job.join()
+
+    (snapshot, during), (latest, after) = pinned_reads
+    assert during is cruiser and snapshot.transportation_vehicles["Interplanetary Cruiser"] is cruiser
+    assert after is new and after.max_velocity == 80000
+    assert latest.version == snapshot.version + 1
+    # The updating thread never pinned, so it reads the new snapshot at once
+    assert get_transportation_vehicle("Interplanetary Cruiser") is new
+
+def test_listeners_see_the_new_snapshot(cruiser):
+    seen = []
+
+    def listener(vehicle, changes):
+        seen.append((vehicle, changes, current_snapshot().version,
+                     get_transportation_vehicle(vehicle.name), get_all_transportation_vehicles()))
+
+    version = current_snapshot().version
+    add_vehicle_listener(listener)
+    try:
+        new = update_transportation_vehicle("Interplanetary Cruiser", fuel_efficiency=35)
+        # Unchanged values publish nothing
+        update_transportation_vehicle("Interplanetary Cruiser", fuel_efficiency=35)
+    finally:
+        remove_vehicle_listener(listener)
+
+    assert len(seen) == 1
+    vehicle, changes, seen_version, looked_up, vehicles = seen[0]
+    assert vehicle is new and looked_up is new and vehicles["Interplanetary Cruiser"] is new
+    assert changes == {"fuel_efficiency": (cruiser.fuel_efficiency, 35)}
+    assert seen_version == version + 1
+
+def test_imported_mappings_go_stale_after_an_update(cruiser):
+    imported = TRANSPORTATION_VEHICLES
+    new = update_transportation_vehicle("Interplanetary Cruiser", max_velocity=70000)
+    assert imported["Interplanetary Cruiser"].max_velocity == cruiser.max_velocity
+    assert space_data.TRANSPORTATION_VEHICLES["Interplanetary Cruiser"] is new
+    assert get_all_transportation_vehicles() is space_data.TRANSPORTATION_VEHICLES
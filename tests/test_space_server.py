@@ -0,0 +1,103 @@
+# Space Journey Quoting Server tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+import space_server
+from space_server import MAX_BATCH_SIZE, MAX_BODY_BYTES, handle_connection, route
+
+REQUEST = {"name": "Ann", "country": "Canada", "year": 2030, "vehicle": "Space Shuttle",
+           "destination": "Mars", "velocity": 20000}
+
+@pytest.fixture(autouse=True)
+def server_log(tmp_path):
+    # Keep the server's request log out of the source tree
+    path = str(tmp_path / "server.log")
+    previous, space_server.logger.log_file = space_server.logger.log_file, path
+    yield path
+    space_server.logger.flush()
+    space_server.logger.log_file = previous
+
+def _post(path, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    return route("POST", path, body)
+
+def test_valid_quote_is_ok():
+    status, result = _post("/quote", REQUEST)
+    assert status == HTTPStatus.OK
+    assert result["error"] == "" and result["destination"] == "Mars" and result["duration_hours"] > 0
+
+@pytest.mark.parametrize("payload, message", [
+    (dict(REQUEST, velocity=99999999), "Velocity must be positive"),
+    (dict(REQUEST, velocity="nan"), "Velocity must be positive"),
+    (dict(REQUEST, vehicle="Warp Barge"), "Warp Barge"),
+    (dict(REQUEST, destination="Pluto"), "Pluto"),
+    ([REQUEST], "must be a JSON object"),
+    (None, "must be a JSON object"),
+])
+def test_invalid_quotes_are_unprocessable(payload, message):
+    status, result = _post("/quote", payload)
+    assert status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert message in result["error"]
+    json.dumps(result, allow_nan=False)
+
+@pytest.mark.parametrize("method, path, body, expected", [
+    ("POST", "/quote", b"{not json", HTTPStatus.BAD_REQUEST),
+    ("GET", "/quote", b"", HTTPStatus.METHOD_NOT_ALLOWED),
+    ("POST", "/health", b"", HTTPStatus.METHOD_NOT_ALLOWED),
+    ("POST", "/quotes/extra", b"[]", HTTPStatus.NOT_FOUND),
+    ("POST", "/quotes", b'{"requests": {}}', HTTPStatus.BAD_REQUEST),
+    ("POST", "/quotes", json.dumps([{}] * (MAX_BATCH_SIZE + 1)).encode(), HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+])
+def test_routing_errors(method, path, body, expected):
+    status, result = route(method, path, body)
+    assert status == expected and result["error"]
+
+def test_batch_reports_errors_per_row():
+    status, result = _post("/quotes", {"requests": [REQUEST, dict(REQUEST, velocity=-1), "Mars"]})
+    assert status == HTTPStatus.OK
+    assert [(r["row"], bool(r["error"])) for r in result["results"]] == [(1, False), (2, True), (3, True)]
+
+def _exchange(raw: bytes) -> bytes:
+    async def run() -> bytes:
+        server = await asyncio.start_server(handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+    return asyncio.run(run())
+
+def _status_and_payload(response: bytes):
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+def test_connection_serves_quotes_and_status_codes(monkeypatch):
+    body = json.dumps(REQUEST).encode()
+    status, payload = _status_and_payload(_exchange(
+        b"POST /quote HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+    ))
+    assert status == 200 and payload["error"] == ""
+
+    status, payload = _status_and_payload(_exchange(
+        b"POST /quote HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (MAX_BODY_BYTES + 1)
+    ))
+    assert status == 413 and payload == {"error": "Request body too large."}
+
+    status, _ = _status_and_payload(_exchange(b"NONSENSE\r\n\r\n"))
+    assert status == 400
+
+    def broken_route(method, path, body):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(space_server, "route", broken_route)
+    status, payload = _status_and_payload(_exchange(b"GET /health HTTP/1.0\r\n\r\n"))
+    assert status == 500 and payload == {"error": "Internal server error."}
@@ -0,0 +1,146 @@
+# Space Trajectory Profiles tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import datetime
+import itertools
+
+import numpy as np
+import pytest
+
+import space_data
+from launch_windows import find_launch_windows
+from route_planner import optimize_route, plan_itinerary
+from space_journey import calculate_journey
+from space_trajectory import (
+    KMH2_PER_MS2,
+    PHASE_COLUMNS,
+    TrajectoryProfile,
+    _closed_form,
+    solve_trajectory,
+    trajectory_columns,
+)
+
+# Short distances give triangle profiles, long ones reach the cruise velocity
+DISTANCES = np.geomspace(50.0, 2e6, 400)
+VELOCITIES = np.resize(np.array([4000.0, 15000.0, 28000.0, 41000.0]), 400)
+
+def _constant(velocity):
+    return np.ones_like(velocity)
+
+def _fading(velocity):
+    return np.exp(-velocity / 30000.0)
+
+def test_integrated_constant_thrust_matches_closed_form():
+    exact = trajectory_columns(DISTANCES, VELOCITIES, 12.0, 7.0)
+    integrated = trajectory_columns(DISTANCES, VELOCITIES, 12.0, 7.0, thrust_curve=_constant)
+    assert (exact["coast_km"] == 0).any() and (exact["coast_km"] > 0).any()
+    for name in PHASE_COLUMNS:
+        np.testing.assert_allclose(integrated[name], exact[name], rtol=1e-8, atol=1e-6, err_msg=name)
+
+def test_integrated_fading_thrust_matches_analytic_burns():
+    # With thrust a·exp(-v/V): hours = V/a·(e^(v/V) - 1), km = V/a·((v - V)·e^(v/V) + V)
+    a, b, scale = 12.0 * KMH2_PER_MS2, 7.0 * KMH2_PER_MS2, 30000.0
+    columns = trajectory_columns(DISTANCES, VELOCITIES, 12.0, 7.0, thrust_curve=_fading)
+    peak = columns["peak_velocity"]
+    growth = np.exp(peak / scale)
+    burn_km = scale * ((peak - scale) * growth + scale)
+    np.testing.assert_allclose(columns["accelerate_hours"], scale / a * (growth - 1), rtol=1e-8)
+    np.testing.assert_allclose(columns["decelerate_hours"], scale / b * (growth - 1), rtol=1e-8)
+    np.testing.assert_allclose(columns["accelerate_km"], burn_km / a, rtol=1e-8)
+    np.testing.assert_allclose(columns["decelerate_km"], burn_km / b, rtol=1e-8)
+
+    triangle = columns["coast_km"] == 0
+    assert triangle.any() and (peak[~triangle] == VELOCITIES[~triangle]).all()
+    assert (peak[triangle] <= VELOCITIES[triangle]).all()
+    np.testing.assert_allclose(
+        columns["accelerate_km"][triangle] + columns["decelerate_km"][triangle], DISTANCES[triangle], rtol=1e-8
+    )
+
+def test_symmetric_closed_form_matches_general_form():
+    a = np.full(len(DISTANCES), 10.0 * KMH2_PER_MS2)
+    symmetric = _closed_form(DISTANCES, VELOCITIES, a, a)
+    general = _closed_form(DISTANCES, VELOCITIES, a, a.copy())
+    for name in PHASE_COLUMNS:
+        np.testing.assert_allclose(symmetric[name], general[name], rtol=1e-12, err_msg=name)
+
+@pytest.mark.parametrize("profile", [TrajectoryProfile(10.0), TrajectoryProfile(12.0, 7.0)])
+def test_scalar_trajectory_matches_columns_exactly(profile):
+    columns = trajectory_columns(DISTANCES, VELOCITIES, profile.acceleration, profile.deceleration)
+    for i, (distance, velocity) in enumerate(zip(DISTANCES.tolist(), VELOCITIES.tolist())):
+        result = solve_trajectory(distance, velocity, profile)
+        assert [getattr(result, name) for name in PHASE_COLUMNS] == [float(columns[name][i]) for name in PHASE_COLUMNS]
+
+@pytest.mark.parametrize("distance, velocity", [(1e6, float("nan")), (1e6, float("inf")), (float("nan"), 2e4)])
+def test_non_finite_inputs_are_rejected(distance, velocity):
+    with pytest.raises(ValueError, match="finite"):
+        solve_trajectory(distance, velocity, TrajectoryProfile(10.0))
+    with pytest.raises(ValueError, match="finite"):
+        trajectory_columns(np.array([1e6, distance]), np.array([2e4, velocity]), 10.0)
+    with pytest.raises(ValueError, match="finite"):
+        trajectory_columns(np.array([distance]), np.array([velocity]), 10.0, thrust_curve=_constant)
+
+def test_profile_rejects_non_positive_limits():
+    with pytest.raises(ValueError):
+        TrajectoryProfile(0.0)
+    with pytest.raises(ValueError):
+        TrajectoryProfile(5.0, -1.0)
+    with pytest.raises(ValueError):
+        trajectory_columns(DISTANCES, VELOCITIES, 0.0)
+
+def test_vehicle_acceleration_is_opt_in():
+    name = "Space Shuttle"
+    vehicle = space_data.get_transportation_vehicle(name)
+    mars = space_data.get_planetary_body("Mars")
+    departure = datetime.datetime(2026, 10, 18)
+    assert vehicle.acceleration is None
+    constant = calculate_journey(mars, vehicle, 20000.0, departure)
+    assert constant.duration_hours == mars.distance_from_earth / 20000.0
+    try:
+        with pytest.raises(ValueError, match="positive"):
+            space_data.update_transportation_vehicle(name, acceleration=0)
+        with pytest.raises(ValueError, match="both"):
+            space_data.update_transportation_vehicle(name, acceleration=5.0, clear_acceleration=True)
+        assert space_data.get_transportation_vehicle(name).acceleration is None
+
+        limited = space_data.update_transportation_vehicle(name, acceleration=0.5)
+        assert TrajectoryProfile.for_vehicle(limited) == TrajectoryProfile(0.5)
+        journey = calculate_journey(mars, limited, 20000.0, departure)
+        expected = solve_trajectory(float(mars.distance_from_earth), 20000.0, TrajectoryProfile(0.5))
+        assert journey.duration_hours == expected.duration_hours > constant.duration_hours
+        assert journey.fuel_units == expected.fuel_units(limited.fuel_efficiency)
+    finally:
+        space_data.update_transportation_vehicle(name, clear_acceleration=True)
+    vehicle = space_data.get_transportation_vehicle(name)
+    assert vehicle.acceleration is None and TrajectoryProfile.for_vehicle(vehicle) is None
+
+@pytest.fixture
+def limited_shuttle():
+    vehicle = space_data.update_transportation_vehicle("Space Shuttle", acceleration=0.5)
+    yield vehicle
+    space_data.update_transportation_vehicle("Space Shuttle", clear_acceleration=True)
+
+def test_launch_windows_and_routes_follow_the_profile(limited_shuttle):
+    departure = datetime.datetime(2026, 10, 18)
+    for window in find_launch_windows("Mars", "Space Shuttle", 20000, top_k=3, days=np.arange(
+            np.datetime64("2026-10-18"), np.datetime64("2028-10-18"))):
+        journey = calculate_journey(
+            space_data.get_planetary_body("Mars"), limited_shuttle, 20000.0,
+            datetime.datetime.combine(window.departure_date, datetime.time()), distance=window.distance
+        )
+        assert (window.duration_hours, window.fuel_units) == (journey.duration_hours, journey.fuel_units)
+        assert window.arrival_date == journey.arrival_date
+
+    itinerary = plan_itinerary([("Moon", "Space Shuttle", 20000), ("Mars", "Space Shuttle", 20000)], departure)
+    for leg in itinerary.legs:
+        path = solve_trajectory(leg.distance, 20000.0, TrajectoryProfile(0.5))
+        assert leg.duration_hours == path.duration_hours
+        assert leg.fuel_units == path.fuel_units(limited_shuttle.fuel_efficiency)
+
+    # Burns make short legs relatively expensive, so the optimizer must cost
+    # each leg along the profile rather than in proportion to its distance
+    route = optimize_route(["Moon", "Mars", "Venus", "Mercury"], "Space Shuttle", 20000, departure_date=departure)
+    assert route.total_duration_hours == min(
+        plan_itinerary([(name, "Space Shuttle", 20000) for name in order], departure).total_duration_hours
+        for order in itertools.permutations(["Moon", "Mars", "Venus", "Mercury"])
+    )
@@ -0,0 +1,49 @@
+# User Activity Logger tests - Python Module
+# For www.spacetravel.com innovative solutions
+# Created: October 18, 2026
+
+import json
+import socket
+import time
+
+import UserLogger
+from UserLogger import record_activity, run_daemon
+from space_logger import get_file_writer
+
+def _records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+def test_daemon_keeps_events_whose_keys_collide(tmp_path):
+    path = str(tmp_path / "activity.jsonl")
+    events = [
+        "login\n",
+        '{"event": "upload", "host_info": "spoofed", "path": "/tmp/x", "username": "mallory"}\n',
+        "\n",
+        '{"event": "logout", "timestamp": "yesterday", "size": 3}\n',
+    ]
+    assert run_daemon(events, path) == 3
+    login, upload, logout = _records(path)
+    assert login["event"] == "login"
+    assert upload["event"] == "upload" and upload["host_info"] == "spoofed" and upload["path"] == "/tmp/x"
+    assert upload["username"] == login["username"] and upload["detail_username"] == "mallory"
+    assert logout["detail_timestamp"] == "yesterday" and logout["size"] == 3
+
+def test_record_activity_accepts_a_path_detail(tmp_path):
+    path = str(tmp_path / "activity.jsonl")
+    record = record_activity("download", path, path="/srv/file.bin", event="ignored")
+    assert get_file_writer(path).flush(timeout=30)
+    assert _records(path) == [record]
+    assert record["event"] == "download" and record["path"] == "/srv/file.bin"
+    assert record["detail_event"] == "ignored"
+
+def test_hung_resolver_is_given_up(monkeypatch):
+    def hang(*args, **kwargs):
+        time.sleep(30)
+
+    monkeypatch.delattr(socket, "if_nameindex", raising=False)
+    monkeypatch.setattr(socket, "getaddrinfo", hang)
+    monkeypatch.setattr(UserLogger, "RESOLVER_TIMEOUT", 0.2)
+    started = time.monotonic()
+    assert UserLogger.find_ip_address() == UserLogger.UNKNOWN_IP_ADDRESS
+    assert time.monotonic() - started < 5